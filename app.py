@@ -1,11 +1,11 @@
+import importlib
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import re
-import qrcode
-from io import BytesIO
-from datetime import datetime, timedelta
+
+from app_data import find_sheet_names, get_master_teams, get_workbook_loader, load_all_data
+from profiling import begin_run, end_run, stage
+from theme import inject_css
+import sidebar_view
 
 # -----------------------------------------------------------------------------
 # 1. 시스템 설정 및 디자인
@@ -17,894 +17,59 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# [CSS] 프리미엄 UI 디자인
-st.markdown("""
-    <style>
-        @import url('https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css');
-        
-        .stApp {
-            font-family: 'Pretendard', sans-serif;
-            background-color: #F4F7FE;
-        }
-        
-        h1, h2, h3, h4, h5, h6, p, div, span, label, button, input, select, textarea {
-            font-family: 'Pretendard', sans-serif;
-        }
-
-        .material-symbols-rounded { font-family: 'Material Symbols Rounded' !important; }
-        .block-container { padding-top: 1.5rem; padding-bottom: 10rem; }
-
-        /* 카드 박스 스타일 */
-        div.css-1r6slb0, div.stDataFrame, div[data-testid="stMetric"] {
-            background-color: white;
-            border-radius: 20px;
-            padding: 24px;
-            box-shadow: 0px 4px 20px rgba(112, 144, 176, 0.08);
-            border: none;
-        }
-
-        /* 메트릭 숫자 */
-        div[data-testid="stMetricValue"] {
-            font-size: 2rem !important;
-            font-weight: 700 !important;
-            color: #2B3674;
-        }
-        div[data-testid="stMetricLabel"] {
-            font-size: 0.95rem !important;
-            color: #A3AED0;
-            font-weight: 500;
-        }
-
-        /* 모던 헤더 */
-        .modern-header {
-            background: white;
-            padding: 25px 30px;
-            border-radius: 20px;
-            box-shadow: 0px 4px 20px rgba(112, 144, 176, 0.08);
-            margin-bottom: 25px;
-            border-left: 10px solid #4318FF;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-        }
-        .modern-header h1 {
-            margin: 0;
-            font-size: 1.8rem;
-            color: #2B3674;
-            font-weight: 800;
-            line-height: 1.2;
-        }
-        .modern-header p {
-            margin: 8px 0 0 0;
-            color: #A3AED0;
-            font-size: 1rem;
-            font-weight: 500;
-        }
-
-        /* KPI 카드 */
-        .kpi-card {
-            background-color: white;
-            border-radius: 16px;
-            padding: 24px;
-            box-shadow: 0px 4px 12px rgba(112, 144, 176, 0.08);
-            border: 1px solid #E2E8F0;
-            border-top: 5px solid #3B82F6;
-            height: 100%;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        }
-        .kpi-title { color: #64748B; font-size: 0.9rem; font-weight: 600; margin-bottom: 8px; }
-        .kpi-value { color: #1E293B; font-size: 2.2rem; font-weight: 800; letter-spacing: -1px; }
-        .kpi-sub { color: #94A3B8; font-size: 0.85rem; margin-top: 4px; font-weight: 500; }
-
-        /* 커스텀 리스트 행 */
-        .custom-row {
-            background-color: white;
-            border-bottom: 1px solid #F4F7FE;
-            padding: 16px 10px;
-            display: flex;
-            align-items: center;
-            transition: all 0.2s ease;
-            border-radius: 12px;
-            margin-bottom: 5px;
-        }
-        .custom-row:hover { background-color: #F4F7FE; transform: translateX(5px); }
-        
-        .custom-header {
-            background-color: #EEF2FF; 
-            border-radius: 12px;
-            padding: 16px 10px;
-            font-weight: 700;
-            color: #4318FF; 
-            font-size: 0.9rem;
-            display: flex;
-            align-items: center;
-            margin-bottom: 12px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border: 1px solid #E0E7FF;
-        }
-        .custom-header .row-item, .custom-header .row-item-left {
-            color: #4318FF !important;
-            font-weight: 800 !important;
-        }
-        
-        .row-item { flex: 1; text-align: center; font-size: 0.95rem; color: #2B3674; font-weight: 500; }
-        .row-item-left { flex: 1; text-align: left; padding-left: 20px; font-size: 0.95rem; color: #2B3674; font-weight: 500; }
-        
-        /* 태그 */
-        .badge { padding: 6px 12px; border-radius: 30px; font-size: 0.75rem; font-weight: 700; }
-        .badge-red { background-color: #FEE2E2; color: #DC2626; }
-        .badge-blue { background-color: #E0E7FF; color: #4318FF; }
-        .badge-gray { background-color: #F4F7FE; color: #A3AED0; }
-        
-        /* 합계 박스 */
-        .total-box {
-            background: linear-gradient(135deg, #868CFF 0%, #4318FF 100%);
-            border-radius: 20px;
-            padding: 25px;
-            margin-bottom: 25px;
-            display: flex;
-            justify-content: space-around;
-            align-items: center;
-            color: white;
-            box-shadow: 0px 10px 20px rgba(67, 24, 255, 0.2);
-        }
-        .total-label { font-size: 0.9rem; color: #E9E3FF; margin-bottom: 5px; display: block; text-align: center; font-weight: 500;}
-        .total-value { font-size: 1.5rem; font-weight: 700; color: white; display: block; text-align: center;}
-        
-        /* 사이드바 */
-        [data-testid="stSidebar"] {
-            background-color: white;
-            box-shadow: 4px 0px 20px rgba(112, 144, 176, 0.05);
-            border-right: none;
-        }
-
-        /* 탭 버튼 스타일 */
-        div.row-widget.stRadio > div {
-            background-color: white;
-            padding: 10px;
-            border-radius: 20px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.05);
-            display: flex;
-            justify-content: center;
-            gap: 15px;
-            border: 1px solid #E2E8F0;
-            margin-bottom: 20px;
-            margin-top: 10px;
-        }
-        div.row-widget.stRadio > div[role="radiogroup"] > label {
-            flex: 1;
-            background-color: transparent;
-            border-radius: 15px;
-            padding: 15px 0;
-            text-align: center;
-            transition: all 0.3s ease;
-            cursor: pointer;
-            border: 2px solid transparent;
-            margin-right: 0 !important;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }
-        div.row-widget.stRadio > div[role="radiogroup"] > label:hover {
-            background-color: #F8FAFC;
-            color: #4318FF;
-            transform: translateY(-2px);
-        }
-        div.row-widget.stRadio > div[role="radiogroup"] > label[data-checked="true"] {
-            background-color: #4318FF;
-            color: white !important;
-            box-shadow: 0 8px 20px rgba(67, 24, 255, 0.3);
-            transform: translateY(-2px);
-        }
-        div.row-widget.stRadio > div[role="radiogroup"] > label p {
-            font-size: 1.2rem !important;
-            font-weight: 700 !important;
-            margin: 0 !important;
-        }
-        div.row-widget.stRadio > div[role="radiogroup"] > label[data-checked="false"] p {
-            color: #A3AED0 !important;
-        }
-    </style>
-""", unsafe_allow_html=True)
-
-# 구글 시트 주소
-SHEET_URL = "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ6hnNtH_1tBFJoA25lXzFPjKUGpBfu0H313_QVFDPdHOpWDDQSJQvIlOQpUoczNO7z7jyWbE171ApD/pub?output=xlsx"
-
-# -----------------------------------------------------------------------------
-# 2. 데이터 로드 및 유틸리티
-# -----------------------------------------------------------------------------
-@st.cache_data(ttl=60)
-def load_all_data():
-    try:
-        sheets = pd.read_excel(SHEET_URL, sheet_name=None, engine='openpyxl')
-        return sheets
-    except Exception as e:
-        return None
-
-def clean_dept_name(name):
-    if pd.isna(name): return ""
-    return re.sub(r'^[\d\.\s]+', '', str(name))
-
-def safe_numeric(series):
-    if series.dtype == 'object':
-        return pd.to_numeric(series.astype(str).str.replace(',', ''), errors='coerce').fillna(0)
-    else:
-        return pd.to_numeric(series, errors='coerce').fillna(0)
-
-# [Helper] 전월 구하기 (자동 필터용 - GitHub 오류 방지를 위해 기본 datetime 사용)
-def get_default_month_index(options):
-    today = datetime.now()
-    # 이번 달의 1일에서 하루를 빼면 정확히 저번 달이 됩니다. (dateutil 대체)
-    first_day = today.replace(day=1)
-    prev_month = first_day - timedelta(days=1)
-    prev_month_str = f"2026-{prev_month.strftime('%m')}" 
-    
-    for i, opt in enumerate(options):
-        if prev_month_str in opt:
-            return i
-    return 0 
-
-all_sheets = load_all_data()
-
-if not all_sheets:
-    st.error("데이터 로드 실패. 구글 시트 연결을 확인해주세요.")
-    if st.button("🔄 데이터 다시 불러오기"):
-        st.cache_data.clear()
-        st.rerun()
-    st.stop()
-
-# 시트 이름 매핑
-sheet_keys = list(all_sheets.keys())
-budget_sheet_name = next((s for s in sheet_keys if '기준' in s or 'Budget' in s), None)
-expense_sheet_name = next((s for s in sheet_keys if '지출' in s or 'Expense' in s), None)
-leave_sheet_name = next((s for s in sheet_keys if '원천' in s or 'Leave' in s), None)
-overtime_sheet_name = next((s for s in sheet_keys if '연장' in s or 'Overtime' in s or '근무' in s), None)
-
-# [마스터 데이터] TypeError 완벽 방어를 위한 팀명 정제
-master_teams = ["전체 팀"]
-if budget_sheet_name:
-    df_bm = all_sheets[budget_sheet_name].fillna(0)
-    if '팀명' in df_bm.columns:
-        df_bm['팀명'] = df_bm['팀명'].astype(str)
-        teams = sorted(df_bm['팀명'].unique())
-        teams = [t for t in teams if str(t).strip() not in ('0', '0.0', 'nan', 'NaN', '')]
-        master_teams = ["전체 팀"] + teams
-
-current_year = datetime.now().year
-master_months_list = [f"2026-{str(m).zfill(2)}" for m in range(1, 13)]
-master_months = ["전체 누적"] + master_months_list 
-
-# -----------------------------------------------------------------------------
-# 3. 사이드바 및 공통
-# -----------------------------------------------------------------------------
-with st.sidebar:
-    st.title("통합 관리 시스템")
-    st.markdown("---")
-    menu = st.radio("MAIN MENU", ["💰 예산 관리", "🏖️ 연차 관리", "⏰ 연장근무 관리"])
-    st.markdown("---")
-    
-    if st.button("🔄 데이터 새로고침", use_container_width=True):
-        st.cache_data.clear()
-        st.rerun()
-    st.caption("※ 시트 수정 후 1~5분 뒤 반영됩니다.")
-    st.markdown("---")
-    
-    try:
-        import qrcode
-        has_qrcode = True
-    except ImportError:
-        has_qrcode = False
-
-    with st.expander("📱 모바일 접속 QR"):
-        if has_qrcode:
-            st.caption("Scan to access")
-            default_url = "https://my-budget-dashboard-ebrzrzbmslu8xh6dphqtin.streamlit.app/"
-            app_url = st.text_input("URL", value=default_url)
-            if app_url:
-                try:
-                    qr = qrcode.QRCode(box_size=10, border=1)
-                    qr.add_data(app_url)
-                    qr.make(fit=True)
-                    img = qr.make_image(fill_color="black", back_color="white")
-                    buffer = BytesIO()
-                    img.save(buffer, format="PNG")
-                    st.image(buffer, use_container_width=True)
-                except: pass
-
-# =============================================================================
-# [PART A] 예산 관리
-# =============================================================================
-if menu == "💰 예산 관리":
-    if not budget_sheet_name or not expense_sheet_name:
-        st.error("예산 시트가 없습니다.")
-        st.stop()
-
-    df_budget = all_sheets[budget_sheet_name].fillna(0)
-    df_budget.columns = [str(c).strip() for c in df_budget.columns]
-    
-    # 확실한 방어를 위해 강제 문자열 치환 후 필터링
-    df_budget['팀명'] = df_budget['팀명'].astype(str)
-    df_budget = df_budget[~df_budget['팀명'].isin(['0', '0.0', 'nan', 'NaN', ''])]
-    
-    for col in df_budget.columns:
-        if col != '팀명': df_budget[col] = safe_numeric(df_budget[col])
-
-    base_col = next((c for c in df_budget.columns if '배정' in c or '기본' in c), None)
-    if base_col:
-        df_budget['월기본예산'] = df_budget[base_col]
-    else:
-        num_cols = df_budget.select_dtypes(include=['number']).columns
-        df_budget['월기본예산'] = df_budget[num_cols[0]] if len(num_cols) > 0 else 0
-
-    df_expense = all_sheets[expense_sheet_name].fillna(0)
-    df_expense.columns = [str(c).strip() for c in df_expense.columns]
-    
-    # 지출 내역에서도 확실하게 문자열 처리
-    if '팀명' in df_expense.columns: df_expense['팀명'] = df_expense['팀명'].astype(str)
-    if '대분류' in df_expense.columns: df_expense['대분류'] = df_expense['대분류'].astype(str)
-    if '소분류' in df_expense.columns: df_expense['소분류'] = df_expense['소분류'].astype(str)
-    
-    date_col = next((c for c in df_expense.columns if '날짜' in c or 'Date' in c), None)
-    if date_col:
-        df_expense[date_col] = pd.to_datetime(df_expense[date_col], errors='coerce')
-        df_expense['월'] = df_expense[date_col].dt.strftime('%Y-%m') 
-        df_expense['월_숫자'] = df_expense[date_col].dt.month
-    else:
-        df_expense['월'] = 'Unknown'
-        df_expense['월_숫자'] = 0
-    
-    if '금액' in df_expense.columns:
-        df_expense['금액'] = safe_numeric(df_expense['금액'])
-    
-    df_expense = df_expense[df_expense['금액'] != 0]
-
-    with st.sidebar:
-        st.subheader("Filter")
-        default_idx = get_default_month_index(master_months)
-        period_option = st.selectbox("기간", master_months, index=default_idx)
-        
-        team_option = st.selectbox("부서", master_teams)
-        
-        main_cats = ["전체"] + sorted([t for t in df_expense['대분류'].unique() if t.strip() not in ('0', 'nan', '')])
-        cat_main = st.selectbox("대분류", main_cats)
-        sub_cats = ["전체"]
-        if cat_main != "전체":
-            sub_list = [t for t in df_expense[df_expense['대분류'] == cat_main]['소분류'].unique() if t.strip() not in ('0', 'nan', '')]
-            sub_cats += sorted(sub_list)
-        cat_sub = st.selectbox("소분류", sub_cats)
-
-    monthly_exp = df_expense.groupby(['팀명', '월'])['금액'].sum().reset_index()
-    dashboard_rows = []
-    
-    target_teams = df_budget['팀명'].unique() if team_option == "전체 팀" else [team_option]
-    target_year = master_months[1].split('-')[0] if len(master_months) > 1 else '2026'
-
-    # 당월/누계 연산 로직
-    for team in target_teams:
-        team_base_monthly = df_budget.loc[df_budget['팀명'] == team, '월기본예산'].sum()
-        
-        is_cumulative_view = (period_option == "전체 누적")
-        target_month_idx = 12
-        if not is_cumulative_view:
-            try: target_month_idx = int(period_option.split('-')[1])
-            except: target_month_idx = 1
-        
-        cum_budget = 0
-        cum_spent = 0
-        cur_budget_added = 0
-        cur_spent = 0
-        
-        for m in range(1, target_month_idx + 1):
-            month_str = f"{target_year}-{str(m).zfill(2)}"
-            
-            add_col = [c for c in df_budget.columns if str(m) in c and '추가' in c]
-            this_add = df_budget.loc[df_budget['팀명'] == team, add_col[0]].sum() if add_col else 0
-            
-            spent = monthly_exp[(monthly_exp['팀명'] == team) & (monthly_exp['월'] == month_str)]['금액'].sum()
-            
-            cum_budget += (team_base_monthly + this_add)
-            cum_spent += spent
-            
-            if m == target_month_idx:
-                cur_budget_added = team_base_monthly + this_add
-                cur_spent = spent
-
-        cum_balance = cum_budget - cum_spent
-        cum_rate = (cum_spent / cum_budget * 100) if cum_budget > 0 else 0
-        
-        if is_cumulative_view:
-            cur_budget_total = cum_budget
-            cur_balance = cum_balance
-            cur_rate = cum_rate
-        else:
-            # 1월은 잔액 이월 없이 시작(Reset)
-            if target_month_idx == 1:
-                carry_over = 0
-            else:
-                prev_cum_budget = cum_budget - cur_budget_added
-                prev_cum_spent = cum_spent - cur_spent
-                carry_over = prev_cum_budget - prev_cum_spent
-            
-            cur_budget_total = cur_budget_added + carry_over
-            cur_balance = cur_budget_total - cur_spent
-            cur_rate = (cur_spent / cur_budget_total * 100) if cur_budget_total > 0 else 0
-
-        dashboard_rows.append({
-            '팀명': team,
-            '누계_예산': cum_budget,
-            '누계_사용액': cum_spent,
-            '누계_잔액': cum_balance,
-            '누계_집행률': cum_rate,
-            '당월_예산': cur_budget_total,
-            '당월_사용액': cur_spent,
-            '당월_잔액': cur_balance,
-            '당월_집행률': cur_rate,
-            'is_공통': 1 if "공통" in str(team) else 0  # 공통운영비 상단 정렬용
-        })
-
-    df_dash = pd.DataFrame(dashboard_rows)
-    # 정렬: 공통운영비가 가장 먼저 오고, 그 다음 팀명 순
-    if not df_dash.empty:
-        df_dash = df_dash.sort_values(by=['is_공통', '팀명'], ascending=[False, True]).reset_index(drop=True)
-    
-    df_detail_filtered = df_expense.copy()
-    if period_option != "전체 누적":
-        df_detail_filtered = df_detail_filtered[df_detail_filtered['월'] == period_option]
-    if team_option != "전체 팀":
-        df_detail_filtered = df_detail_filtered[df_detail_filtered['팀명'] == team_option]
-    if cat_main != "전체": df_detail_filtered = df_detail_filtered[df_detail_filtered['대분류'] == cat_main]
-    if cat_sub != "전체": df_detail_filtered = df_detail_filtered[df_detail_filtered['소분류'] == cat_sub]
-
-    st.markdown(f"""
-        <div class="modern-header">
-            <h1>💰 예산 관리 대시보드</h1>
-            <p>Status: {team_option} / {period_option}</p>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    if cat_main == "전체":
-        tot_b = df_dash['당월_예산'].sum()
-        tot_s = df_dash['당월_사용액'].sum()
-        tot_r = df_dash['당월_잔액'].sum()
-    else:
-        tot_b = 0
-        tot_s = df_detail_filtered['금액'].sum()
-        tot_r = 0
-
-    total_rate = (tot_s / tot_b * 100) if tot_b > 0 else 0
-
-    c1, c2, c3, c4, c5 = st.columns(5)
-    c1.metric("가용 예산 (이월포함)", f"{tot_b:,.0f}원")
-    c2.metric("총 사용액", f"{tot_s:,.0f}원")
-    c3.metric("총 집행률", f"{total_rate:.1f}%")
-    c4.metric("현재 잔액", f"{tot_r:,.0f}원")
-    c5.metric("지출 건수", f"{len(df_detail_filtered):,}건")
-
-    st.divider()
-
-    st.subheader("🏢 팀별 집행 현황 (당월 & 누계)")
-    
-    if not df_dash.empty:
-        records = df_dash.to_dict('records')
-        split_idx = (len(records) + 1) // 2 
-        left_data = records[:split_idx]
-        right_data = records[split_idx:]
-        
-        col_left, col_right = st.columns(2)
-        
-        def render_card(row):
-            is_common = row['is_공통'] == 1 
-            header_color = "#8B5CF6" if is_common else "#3B82F6"
-            team_label = f"⭐ {row['팀명']}" if is_common else row['팀명']
-            
-            cur_pct = min(row['당월_집행률'], 100)
-            cum_pct = min(row['누계_집행률'], 100)
-            
-            cur_status_color = "#3B82F6" if cur_pct < 80 else ("#F59E0B" if cur_pct < 100 else "#EF4444")
-            cum_status_color = "#3B82F6" if cum_pct < 80 else ("#F59E0B" if cum_pct < 100 else "#EF4444")
-
-            return f"""<div style="background:white; padding:24px; border-radius:16px; margin-bottom:20px; box-shadow: 0px 4px 12px rgba(0,0,0,0.05); border:1px solid #E2E8F0; border-top: 5px solid {header_color};">
-<div style="margin-bottom:15px;">
-<span style="font-weight:800; color:#1E293B; font-size:1.2rem;">{team_label}</span>
-</div>
-<div style="margin-bottom: 20px;">
-<div style="display:flex; justify-content:space-between; font-size: 0.9rem; margin-bottom: 6px;">
-<span style="color:#64748B; font-weight:700;">당월 실적 (이월포함)</span>
-<span style="font-weight:800; color:{cur_status_color};">{row['당월_집행률']:.1f}%</span>
-</div>
-<div style="width:100%; background-color:#F1F5F9; height:8px; border-radius:4px; margin-bottom:10px;">
-<div style="width:{cur_pct}%; background-color:{cur_status_color}; height:8px; border-radius:4px;"></div>
-</div>
-<div style="display:flex; justify-content:space-between; font-size:0.85rem; color:#64748B;">
-<span>예산: {row['당월_예산']:,.0f}</span>
-<span>사용: <strong style="color:#1E293B;">{row['당월_사용액']:,.0f}</strong></span>
-<span>잔액: <strong style="color:{cur_status_color};">{row['당월_잔액']:,.0f}</strong></span>
-</div>
-</div>
-<div style="border-top: 1px dashed #E2E8F0; margin: 15px 0;"></div>
-<div>
-<div style="display:flex; justify-content:space-between; font-size: 0.9rem; margin-bottom: 6px;">
-<span style="color:#64748B; font-weight:700;">누계 실적 (1월 ~ 현재)</span>
-<span style="font-weight:800; color:{cum_status_color};">{row['누계_집행률']:.1f}%</span>
-</div>
-<div style="width:100%; background-color:#F1F5F9; height:8px; border-radius:4px; margin-bottom:10px;">
-<div style="width:{cum_pct}%; background-color:{cum_status_color}; height:8px; border-radius:4px;"></div>
-</div>
-<div style="display:flex; justify-content:space-between; font-size:0.85rem; color:#64748B;">
-<span>예산: {row['누계_예산']:,.0f}</span>
-<span>사용: <strong style="color:#1E293B;">{row['누계_사용액']:,.0f}</strong></span>
-<span>잔액: <strong style="color:{cum_status_color};">{row['누계_잔액']:,.0f}</strong></span>
-</div>
-</div>
-</div>"""
-
-        with col_left:
-            for row in left_data:
-                st.markdown(render_card(row), unsafe_allow_html=True)
-                
-        with col_right:
-            for row in right_data:
-                st.markdown(render_card(row), unsafe_allow_html=True)
-    else:
-        st.info("데이터 없음")
-
-    st.subheader("📝 상세 지출 내역 (보안)")
-    
-    if 'budget_auth' not in st.session_state:
-        st.session_state['budget_auth'] = False
-        
-    if not st.session_state['budget_auth']:
-        col_pw1, col_pw2 = st.columns([2, 3])
-        with col_pw1:
-            pwd = st.text_input("관리자 비밀번호를 입력하세요", type="password")
-            if pwd == "7026":
-                st.session_state['budget_auth'] = True
-                st.rerun()
-            elif pwd:
-                st.error("비밀번호가 올바르지 않습니다.")
-    else:
-        if not df_detail_filtered.empty:
-            df_show = df_detail_filtered.sort_values('날짜', ascending=False).reset_index(drop=True)
-            st.markdown("""<div class="custom-header">
-<div class="row-item">날짜</div><div class="row-item">부서</div><div class="row-item">대분류</div>
-<div class="row-item">소분류</div><div class="row-item-left" style="flex:2;">적요</div>
-<div class="row-item" style="text-align:right; padding-right:20px;">금액</div></div>""", unsafe_allow_html=True)
-            
-            with st.container(height=600):
-                for _, row in df_show.iterrows():
-                    date_str = row['날짜'].strftime('%Y-%m-%d')
-                    amt_str = f"{int(row['금액']):,}"
-                    st.markdown(f"""<div class="custom-row">
-<div class="row-item" style="color:#64748B; font-size:0.85rem;">{date_str}</div>
-<div class="row-item"><strong>{row['팀명']}</strong></div>
-<div class="row-item"><span class="badge badge-gray">{row['대분류']}</span></div>
-<div class="row-item"><span class="badge badge-gray">{row['소분류']}</span></div>
-<div class="row-item-left" style="flex:2; color:#334155;">{row['상세내역']}</div>
-<div class="row-item" style="text-align:right; padding-right:20px; font-weight:bold; color:#1E293B;">{amt_str}원</div>
-</div>""", unsafe_allow_html=True)
-                # 리스트 마지막 잘림 방지용 여백 추가
-                st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
-        else:
-            st.info("내역이 없습니다.")
-
-# =============================================================================
-# [PART B] 연차 관리
-# =============================================================================
-elif menu == "🏖️ 연차 관리":
-    if not leave_sheet_name:
-        st.error("연차 데이터 시트가 없습니다.")
-        st.stop()
-
-    df_leave = all_sheets[leave_sheet_name].fillna(0)
-    df_leave['소속'] = df_leave['소속'].astype(str).apply(clean_dept_name)
-    
-    # 대상델리하임 제외
-    df_leave = df_leave[~df_leave['소속'].isin(['대상델리하임', '0', 'nan', 'NaN'])]
-
-    for col in ['합계', '사용일수', '잔여일수', '부채예산', '부채잔액']:
-        if col in df_leave.columns: df_leave[col] = safe_numeric(df_leave[col])
-        
-    df_leave['잔여율'] = df_leave.apply(lambda x: (x['잔여일수'] / x['합계'] * 100) if x['합계'] > 0 else 0, axis=1)
-
-    with st.sidebar:
-        st.subheader("Filter")
-        default_idx = get_default_month_index(master_months)
-        leave_period_option = st.selectbox("기간(월)", master_months, index=default_idx)
-        
-        dept_list = master_teams 
-        leave_dept_option = st.selectbox("소속 부서", dept_list)
-        risk_criteria = st.slider("촉진 대상 기준 (잔여일)", 5, 25, 10)
-
-    if leave_dept_option != "전체 팀":
-        df_leave = df_leave[df_leave['소속'] == leave_dept_option]
-
-    if leave_period_option != "전체 누적":
-        target_col = leave_period_option.split('-')[1] + "월"
-        if target_col not in df_leave.columns:
-             try: target_col = f"{int(leave_period_option.split('-')[1])}월"
-             except: pass
-             
-        if target_col in df_leave.columns:
-             df_leave['당월사용'] = safe_numeric(df_leave[target_col])
-             display_usage_col = '당월사용'
-        else:
-             st.warning(f"'{target_col}' 데이터가 없습니다. 누적 사용량으로 표시합니다.")
-             display_usage_col = '사용일수'
-    else:
-        display_usage_col = '사용일수'
-
-    df_risk = df_leave[df_leave['잔여일수'] >= risk_criteria].sort_values('잔여율', ascending=False)
-    
-    total_used = df_leave[display_usage_col].sum()
-    total_remain = df_leave['잔여일수'].sum()
-    
-    # 목표 소진율 50%
-    avg_usage = (total_used / df_leave['합계'].sum() * 100) if df_leave['합계'].sum() > 0 else 0
-
-    st.markdown(f"""
-        <div class="modern-header">
-            <h1>🏖️ 연차 관리 대시보드</h1>
-            <p>Status: {leave_dept_option} / {leave_period_option}</p>
-        </div>
-    """, unsafe_allow_html=True)
-
-    # 부채 제거
-    k1, k2, k3, k4 = st.columns(4)
-    k1.metric(f"소진율 ({leave_period_option})", f"{avg_usage:.1f}%", delta="Goal 50%")
-    k2.metric("총 사용 연차", f"{total_used:,.1f}일")
-    k3.metric("총 잔여 연차", f"{total_remain:,.1f}일")
-    k4.metric("촉진 대상자", f"{len(df_risk)}명", f"> {risk_criteria} days", delta_color="inverse")
-
-    st.divider()
-
-    c_chart, c_risk = st.columns([4, 6])
-    with c_chart:
-        st.subheader("📊 부서별 소진율")
-        dept_sum = df_leave.groupby('소속').agg({display_usage_col:'sum', '합계':'sum'}).reset_index()
-        dept_sum['소진율'] = (dept_sum[display_usage_col] / dept_sum['합계'] * 100).fillna(0)
-        fig = px.bar(dept_sum, x='소속', y='소진율', text=dept_sum['소진율'].apply(lambda x: f"{x:.1f}%"), color='소진율', color_continuous_scale='Bluyl')
-        fig.update_traces(textfont_color='white', textposition='auto')
-        fig.update_layout(xaxis_title=None, yaxis_title="소진율(%)", height=450, paper_bgcolor='white', plot_bgcolor='white')
-        st.plotly_chart(fig, use_container_width=True)
-
-    with c_risk:
-        st.subheader(f"🚨 촉진 대상자 (High Residual Rate)")
-        if not df_risk.empty:
-            r_tot = df_risk['합계'].sum()
-            r_use = df_risk['사용일수'].sum()
-            r_rem = df_risk['잔여일수'].sum()
-            r_rate = (r_rem / r_tot * 100) if r_tot > 0 else 0 
-            
-            st.markdown(f"""
-                <div class="total-box">
-                    <div><span class="total-label">대상자 총 연차</span><span class="total-value">{r_tot:,.1f}</span></div>
-                    <div><span class="total-label">사용 총계</span><span class="total-value">{r_use:,.1f}</span></div>
-                    <div><span class="total-label">잔여 총계</span><span class="total-value" style="color:#FCA5A5;">{r_rem:,.1f}</span></div>
-                    <div><span class="total-label">평균 잔여율</span><span class="total-value">{r_rate:.1f}%</span></div>
-                </div>
-            """, unsafe_allow_html=True)
-            
-            # 잔여일 -> 잔여율로 변경
-            st.markdown("""
-                <div class="custom-header">
-                    <div class="row-item">성명/직급</div>
-                    <div class="row-item">소속</div>
-                    <div class="row-item">잔여율</div>
-                    <div class="row-item">비고</div>
-                </div>
-            """, unsafe_allow_html=True)
-
-            with st.container(height=400):
-                for _, row in df_risk.iterrows():
-                    st.markdown(f"""
-                        <div class="custom-row">
-                            <div class="row-item"><strong>{row['성명']}</strong></div>
-                            <div class="row-item" style="color:#64748B;">{row['소속']}</div>
-                            <div class="row-item"><span class="badge badge-red">{row['잔여율']:.1f}%</span></div>
-                            <div class="row-item" style="font-size:0.8rem; color:#94A3B8;">잔여 {row['잔여일수']:.1f}일 이상</div>
-                        </div>
-                    """, unsafe_allow_html=True)
-                # 리스트 마지막 잘림 방지용 여백 추가
-                st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
-        else:
-            st.success("대상자 없음")
-
-    st.divider()
-    st.subheader("👥 전체 임직원 명부")
-    df_show = df_leave.sort_values('소속').copy()
-    
-    # 잔여율만 표시 (총/사용/잔여일 삭제)
-    st.markdown("""
-        <div class="custom-header">
-            <div class="row-item">소속</div>
-            <div class="row-item">성명</div>
-            <div class="row-item">잔여율</div>
-        </div>
-    """, unsafe_allow_html=True)
-    with st.container(height=600):
-        for _, row in df_show.iterrows():
-            st.markdown(f"""
-                <div class="custom-row">
-                    <div class="row-item" style="color:#64748B;">{row['소속']}</div>
-                    <div class="row-item"><strong>{row['성명']}</strong></div>
-                    <div class="row-item"><span class="badge badge-blue">{row['잔여율']:.1f}%</span></div>
-                </div>
-            """, unsafe_allow_html=True)
-        # 리스트 마지막 잘림 방지용 여백 추가
-        st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
+# 메뉴별 화면 모듈: 처음 선택될 때 import (plotly 등 무거운 모듈은 해당 메뉴에서만 로드)
+# 각 화면은 구역 함수로 나뉘고, 자체 위젯(페이지 번호, 슬라이더, 검색어 등)이 있는 구역만 st.fragment로 둠:
+# 그 위젯을 바꾸면 해당 구역만 다시 실행·전송됨 (구역은 인자로 받은 값만 사용). 위젯이 없는 구역은 혼자 다시
+# 실행될 일이 없으므로 일반 함수로 둠 (fragment 등록 비용만 듦)
+MENU_VIEWS = {
+    "💰 예산 관리": "budget_view",
+    "🏖️ 연차 관리": "leave_view",
+    "⏰ 연장근무 관리": "overtime_view",
+}
+
+# 이번 실행(rerun) 계측 시작 (관리자가 요청한 경우에만 cProfile/tracemalloc 포함)
+run_profile = begin_run(
+    "app",
+    cprofile=st.session_state.pop('profile_cprofile_next', False),
+    trace_memory=st.session_state.pop('profile_tracemalloc_next', False),
+)
 
-# =============================================================================
-# [PART C] 연장근무 관리
-# =============================================================================
-elif menu == "⏰ 연장근무 관리":
-    if not overtime_sheet_name:
-        st.error("연장근무 시트를 찾을 수 없습니다.")
+# st.stop()/st.rerun()(예외로 실행을 끝냄)이나 오류로 중간에 끝나도 계측은 반드시 종료 (tracemalloc/cProfile 해제)
+try:
+    # [CSS] 프리미엄 UI 디자인 (theme.py)
+    inject_css()
+
+    # -----------------------------------------------------------------------------
+    # 2. 데이터 로드 (app_data.py)
+    # -----------------------------------------------------------------------------
+    with stage("load_all_data"):
+        all_sheets = load_all_data()
+
+    if not all_sheets:
+        st.error("데이터 로드 실패. 구글 시트 연결을 확인해주세요.")
+        if st.button("🔄 데이터 다시 불러오기"):
+            st.rerun()
         st.stop()
 
-    df_ot = all_sheets[overtime_sheet_name].fillna(0)
-    df_ot.columns = [str(c).replace(' ','').strip() for c in df_ot.columns]
-    
-    # [수정] TypeError 원천 차단: 팀명이 존재하면 가장 먼저 무조건 문자열 강제 변환
-    if '팀명' not in df_ot.columns:
-        df_ot['팀명'] = 'Unknown'
-        
-    df_ot['팀명'] = df_ot['팀명'].astype(str)
-    
-    # 지원팀 -> 경영지원팀, 생산팀/대상델리하임 제외
-    df_ot['팀명'] = df_ot['팀명'].replace('지원팀', '경영지원팀')
-    df_ot = df_ot[~df_ot['팀명'].isin(['생산팀', '대상델리하임', '0', '0.0', 'nan', 'NaN', ''])]
-
-    month_col = next((c for c in df_ot.columns if c == '월' or c == 'Month'), None)
-    if month_col:
-        df_ot.rename(columns={month_col: '월'}, inplace=True)
-        df_ot['월'] = df_ot['월'].astype(str)
-    else:
-        df_ot['월'] = 'Unknown'
-
-    num_cols = ['연장시간', '연장근로', '야근시간', '휴일시간']
-    valid_num_cols = []
-    for c in df_ot.columns:
-        if any(x in c for x in num_cols):
-            df_ot[c] = safe_numeric(df_ot[c])
-            valid_num_cols.append(c)
-    
-    df_ot['총근무'] = df_ot[valid_num_cols].sum(axis=1)
-
-    with st.sidebar:
-        st.subheader("Filter")
-        default_idx = get_default_month_index(master_months)
-        ot_month_opt = st.selectbox("조회 기간", master_months, index=default_idx)
-
-        # [수정] TypeError 방어를 위한 안전한 정렬 및 빈값 제거
-        safe_teams_list = [str(t) for t in df_ot['팀명'].unique() if str(t).strip() not in ('0', '0.0', 'nan', 'NaN', '')]
-        filtered_teams = sorted(safe_teams_list)
-        
-        ot_team_opt = st.selectbox("소속 팀", ["전체 팀"] + filtered_teams)
-        target_ratio = st.slider("전년 대비 목표 (%)", 80, 120, 90)
-
-    df_filtered = df_ot.copy()
-    if ot_month_opt != "전체 누적":
-        df_filtered = df_filtered[df_filtered['월'] == ot_month_opt]
-    if ot_team_opt != "전체 팀":
-        df_filtered = df_filtered[df_filtered['팀명'] == ot_team_opt]
-
-    st.markdown(f"""
-        <div class="modern-header">
-            <h1>⏰ 연장근무 관리</h1>
-            <p>Status: {ot_team_opt} / {ot_month_opt}</p>
-        </div>
-    """, unsafe_allow_html=True)
-
-    view_mode = st.radio("VIEW MODE", ["📊 통합 현황"], horizontal=True, label_visibility="collapsed")
-    st.markdown("---")
-
-    total_sum = df_filtered['총근무'].sum()
-    ext_sum = df_filtered[[c for c in df_ot.columns if '연장' in c]].sum().sum()
-    night_sum = df_filtered[[c for c in df_ot.columns if '야근' in c]].sum().sum()
-    hol_sum = df_filtered[[c for c in df_ot.columns if '휴일' in c]].sum().sum()
-    
-    ext_ratio = (ext_sum / total_sum * 100) if total_sum > 0 else 0
-    night_ratio = (night_sum / total_sum * 100) if total_sum > 0 else 0
-    hol_ratio = (hol_sum / total_sum * 100) if total_sum > 0 else 0
-
-    if view_mode == "📊 통합 현황":
-        st.subheader("통합 연장근무 현황")
-        
-        k1, k2, k3, k4 = st.columns(4)
-        with k1:
-            st.markdown(f"""<div class="kpi-card" style="border-top-color: #4F46E5;"><div class="kpi-title">총 근무시간</div><div class="kpi-value">{total_sum:,.1f}h</div><div class="kpi-sub">Total Overtime</div></div>""", unsafe_allow_html=True)
-        with k2:
-            st.markdown(f"""<div class="kpi-card" style="border-top-color: #3B82F6;"><div class="kpi-title">연장 근로</div><div class="kpi-value">{ext_sum:,.1f}h</div><div class="kpi-sub">{ext_ratio:.1f}% (Blue)</div></div>""", unsafe_allow_html=True)
-        with k3:
-            st.markdown(f"""<div class="kpi-card" style="border-top-color: #EF4444;"><div class="kpi-title">야간 근로</div><div class="kpi-value">{night_sum:,.1f}h</div><div class="kpi-sub">{night_ratio:.1f}% (Red)</div></div>""", unsafe_allow_html=True)
-        with k4:
-            st.markdown(f"""<div class="kpi-card" style="border-top-color: #0EA5E9;"><div class="kpi-title">휴일 근로</div><div class="kpi-value">{hol_sum:,.1f}h</div><div class="kpi-sub">{hol_ratio:.1f}% (Sky)</div></div>""", unsafe_allow_html=True)
-
-        st.markdown("---")
-        
-        c1, c2 = st.columns([1, 1])
-        with c1:
-            st.markdown("##### 🏢 팀별 근무 유형 비교")
-            
-            chart_teams = [t for t in filtered_teams] if ot_team_opt == "전체 팀" else [ot_team_opt]
-            df_agg = df_filtered.groupby('팀명')[valid_num_cols].sum().reset_index()
-            df_agg = df_agg.set_index('팀명').reindex(chart_teams).fillna(0).reset_index()
-            
-            df_long = df_agg.melt(id_vars='팀명', var_name='유형', value_name='시간')
-            
-            color_map = {
-                '연장시간': '#3B82F6', '연장근로': '#3B82F6', 
-                '야근시간': '#EF4444', 
-                '휴일시간': '#0EA5E9'
-            }
-            
-            fig = px.bar(df_long, x='시간', y='팀명', color='유형',
-                         orientation='h', barmode='stack',
-                         color_discrete_map=color_map, text_auto='.0f')
-            
-            fig.update_traces(textposition='auto', textfont_size=12, textfont_color='white')
-            fig.update_layout(xaxis_title=None, yaxis_title=None, height=400, 
-                              paper_bgcolor='white', plot_bgcolor='white', font=dict(size=14))
-            st.plotly_chart(fig, use_container_width=True)
-            
-        with c2:
-            st.markdown("##### 📅 월별 통합 추이")
-            if '월' in df_ot.columns and not df_ot.empty:
-                trend_df = df_ot.groupby('월')['총근무'].sum().reset_index()
-                try:
-                    # 날짜 기준 정렬 (X축 깨짐 방지)
-                    trend_df['sort_key'] = trend_df['월'].apply(lambda x: int(re.sub(r'\D', '', str(x))) if re.sub(r'\D', '', str(x)) else 0)
-                    trend_df = trend_df.sort_values('sort_key')
-                except: pass
-                
-                fig2 = px.area(trend_df, x='월', y='총근무', markers=True)
-                fig2.update_traces(line_color='#4318FF', fillcolor='rgba(67, 24, 255, 0.1)')
-                fig2.update_layout(xaxis_title=None, yaxis_title=None, height=400, paper_bgcolor='white', plot_bgcolor='white')
-                st.plotly_chart(fig2, use_container_width=True)
-            else:
-                st.info("데이터 없음")
-
-    st.divider()
-    st.subheader("🗓️ 상세 근무 내역")
-    
-    st.markdown("""
-        <div class="custom-header">
-            <div class="row-item">월</div>
-            <div class="row-item">팀명</div>
-            <div class="row-item">이름</div>
-            <div class="row-item" style="color:#3B82F6 !important;">연장</div>
-            <div class="row-item" style="color:#EF4444 !important;">야근</div>
-            <div class="row-item" style="color:#0EA5E9 !important;">휴일</div>
-            <div class="row-item" style="font-weight:bold;">합계</div>
-        </div>
-    """, unsafe_allow_html=True)
-
-    if not df_filtered.empty:
-        # 내림차순 정렬 (근무시간 많은 순)
-        df_show_ot = df_filtered.sort_values('총근무', ascending=False).reset_index(drop=True)
-
-        with st.container(height=600):
-            for _, row in df_show_ot.iterrows():
-                ext = row.get('연장근로', row.get('연장시간', 0))
-                night = row.get('야근시간', 0)
-                hol = row.get('휴일시간', 0)
-                
-                st.markdown(f"""
-                    <div class="custom-row">
-                        <div class="row-item" style="color:#A3AED0;">{row['월']}</div>
-                        <div class="row-item"><strong>{row['팀명']}</strong></div>
-                        <div class="row-item">{row['이름']}</div>
-                        <div class="row-item" style="color:#3B82F6; font-weight:bold;">{ext:.1f}</div>
-                        <div class="row-item" style="color:#EF4444; font-weight:bold;">{night:.1f}</div>
-                        <div class="row-item" style="color:#0EA5E9; font-weight:bold;">{hol:.1f}</div>
-                        <div class="row-item" style="font-weight:bold; background-color:#EFF4FB; border-radius:4px; color:#2B3674;">{row['총근무']:.1f}h</div>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            # 리스트 마지막 잘림 방지용 여백 추가
-            st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
-    else:
-        st.info("내역이 없습니다.")
+    if all_sheets.is_snapshot and get_workbook_loader().last_error is not None:
+        st.warning("구글 시트에 연결하지 못해 마지막으로 저장된 데이터를 표시합니다.")
+
+    # 시트 이름 매핑
+    sheets = find_sheet_names(all_sheets)
+    master_teams = get_master_teams(all_sheets, sheets['budget'])
+
+    # -----------------------------------------------------------------------------
+    # 3. 사이드바 및 메뉴 화면
+    # -----------------------------------------------------------------------------
+    menu = sidebar_view.render(all_sheets, sheets)
+
+    with stage(f"import:{MENU_VIEWS[menu]}"):
+        view = importlib.import_module(MENU_VIEWS[menu])
+    view.render(all_sheets, sheets, master_teams)
+    run_profile.label = menu
+    run_profile.completed = True
+finally:
+    # 계측 종료: 구조화 로그 기록 + 관리자 패널용으로 보관 (패널에는 직전 실행 결과가 표시됨)
+    st.session_state['last_run_profile'] = end_run()
+    if run_profile.report:
+        st.session_state['last_run_report'] = run_profile.report
@@ -0,0 +1,268 @@
+import os
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from data_loader import WorkbookLoader
+from data_prep import normalize_budget, normalize_expense, normalize_leave, normalize_overtime
+from data_store import VersionedDataStore
+from expense_cube import ExpenseCube
+from expense_stream import read_expense_csv, read_expense_rows
+from leave_analytics import LeaveAnalytics
+from overtime_analytics import OvertimeAnalytics
+from refresh_worker import RefreshWorker
+from search_index import SearchIndex
+from sheet_diff import ChangeFeed, SheetDiff
+from year_index import YearIndex
+
+# -----------------------------------------------------------------------------
+# 앱 공용 데이터 접근: 세션 공용 리소스(로더/워커/저장소)와 버전별 프레임 accessor
+# 메뉴 화면 모듈(budget_view/leave_view/overtime_view)과 sidebar_view가 함께 사용
+# -----------------------------------------------------------------------------
+# 구글 시트 주소
+SHEET_URL = os.environ.get(
+    "BUDGET_SHEET_URL",
+    "https://docs.google.com/spreadsheets/d/e/2PACX-1vQ6hnNtH_1tBFJoA25lXzFPjKUGpBfu0H313_QVFDPdHOpWDDQSJQvIlOQpUoczNO7z7jyWbE171ApD/pub?output=xlsx",
+)
+
+# 지출 시트 적재 방식: full(기본, 시트 전체 파싱) / stream(행 단위 chunk) / csv(CSV 내보내기 chunk)
+EXPENSE_INGEST = os.environ.get("BUDGET_EXPENSE_INGEST", "full")
+EXPENSE_CSV_URL = os.environ.get("BUDGET_EXPENSE_CSV_URL")
+
+# 데이터 소스: sheet(기본, 게시된 xlsx) 또는 로컬 SQL 파일 (예: data/budget.db, duckdb:///data/budget.duckdb)
+# SQL 파일은 sql_import.py로 시트에서 증분 동기화하고, 지출 필터/집계는 SQL로 처리
+DATA_SOURCE = os.environ.get("BUDGET_DATA_SOURCE", "sheet")
+
+# 마지막 정상 데이터 스냅샷 위치 (Parquet)
+SNAPSHOT_DIR = os.environ.get(
+    "BUDGET_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "snapshots"),
+)
+
+# 레플리카 공용 캐시 위치 (여러 레플리카가 마운트한 공유 볼륨). 지정하면 시트는 잠금을 잡은 레플리카 하나만 받아오고
+# 원본 xlsx와 정규화 프레임(Parquet)을 버전별로 공유. 지정하지 않으면 레플리카마다 따로 받아옴
+SHARED_CACHE_DIR = os.environ.get("BUDGET_SHARED_CACHE_DIR")
+
+@st.cache_resource
+def get_shared_cache():
+    if not SHARED_CACHE_DIR:
+        return None
+    from shared_cache import SharedCache
+    return SharedCache(SHARED_CACHE_DIR)
+
+# 로더는 세션 간 공유 (ETag/해시가 같으면 재다운로드·재파싱 없음)
+@st.cache_resource
+def get_workbook_loader():
+    if DATA_SOURCE != "sheet":
+        from sql_store import SqlSource
+        return SqlSource(DATA_SOURCE, min_interval=60)
+    try:
+        from snapshot_store import SnapshotStore
+        store = SnapshotStore(SNAPSHOT_DIR)
+    except ImportError:
+        store = None
+    return WorkbookLoader(SHEET_URL, min_interval=60, snapshot_store=store, shared_cache=get_shared_cache())
+
+# 시트 확인은 세션 공용 백그라운드 워커 하나가 담당 (요청 경로에서는 다운로드하지 않음)
+# 새 버전을 받으면 직전 버전과 행 단위로 비교해 두고(증분 집계용) 관리자용 변경 피드에 기록
+@st.cache_resource
+def get_refresh_worker():
+    store, feed = get_data_store(), get_change_feed()
+    return RefreshWorker(get_workbook_loader(), interval=60,
+                         on_change=lambda previous, current: record_changes(store, feed, previous, current)).start()
+
+@st.cache_resource
+def get_change_feed():
+    return ChangeFeed(maxlen=500)
+
+def record_changes(store, feed, previous, current):
+    # 증분 집계에 쓰는 시트(지출/연장근무)만, 직전 버전에서 실제로 읽은 경우에만 비교
+    # (비교하려고 시트를 새로 파싱하지 않고, 기준/원천 시트는 행 해시를 만들지 않음)
+    parsed = getattr(previous, 'parsed_sheets', None)
+    sheets = find_sheet_names(current)
+    for sheet in (sheets['expense'], sheets['overtime']):
+        if not sheet or sheet not in previous or (parsed is not None and sheet not in parsed):
+            continue
+        # 직전 버전도 비교된 적이 있으면 그때 만든 행 해시를 재사용
+        before = store.peek(previous.content_hash, ('sheet_diff', sheet))
+        diff = store.get(current.content_hash, ('sheet_diff', sheet),
+                         lambda: SheetDiff(sheet, previous[sheet], current[sheet], previous.content_hash,
+                                           None if before is None else before.keys))
+        if len(diff) or not diff.comparable:
+            feed.record(diff)
+
+def load_all_data():
+    # 시트 이름 -> DataFrame 매핑을 반환하되, 각 시트는 처음 조회될 때만 파싱됨
+    try:
+        loader = get_workbook_loader()
+        get_refresh_worker()
+        if loader.workbook is not None:
+            return loader.workbook
+        return loader.refresh()
+    except Exception as e:
+        return None
+# 정규화 결과는 데이터 버전(워크북 해시) + 시트 단위로 서버에 한 벌만 보관하고 모든 세션이 공유
+# (읽기 전용: 세션에서 열을 추가할 때는 assign 등으로 새 프레임을 만들 것)
+@st.cache_resource
+def get_data_store():
+    return VersionedDataStore(keep_versions=2, shared=get_shared_cache())
+
+def get_budget_frame(workbook, sheet_name):
+    return get_data_store().get(workbook.content_hash, ('budget', sheet_name), lambda: normalize_budget(workbook[sheet_name]))
+
+def build_expense_frame(workbook, sheet_name):
+    # 지출 시트는 계속 커지므로 스트리밍(openpyxl read-only) 또는 CSV 내보내기 chunk 적재를 선택 가능
+    if hasattr(workbook, 'expense_frame'):
+        return workbook.expense_frame()
+    if EXPENSE_INGEST == "csv" and EXPENSE_CSV_URL:
+        return read_expense_csv(EXPENSE_CSV_URL)
+    if EXPENSE_INGEST == "stream" and hasattr(workbook, 'iter_rows'):
+        return read_expense_rows(workbook.iter_rows(sheet_name))
+    return normalize_expense(workbook[sheet_name])
+
+def get_expense_frame(workbook, sheet_name):
+    return get_data_store().get(workbook.content_hash, ('expense', sheet_name), lambda: build_expense_frame(workbook, sheet_name))
+
+# 연도별 파티션(year_index.py): 연도 -> 행 위치. 연도를 지정한 조회/집계는 해당 연도 행만 사용
+def get_expense_years(workbook, sheet_name):
+    return get_data_store().get(workbook.content_hash, ('expense_years', sheet_name), lambda: YearIndex.by_month(get_expense_frame(workbook, sheet_name)))
+
+# 증분 집계: 워커가 만들어 둔 직전 버전 대비 변경(sheet_diff)과 직전 버전 집계가 남아 있으면
+# 추가/삭제된 원본 행만 정규화해 집계에 증감으로 반영 (전체 재집계 없음)
+# 행이 적은 시트는 category groupby 한 번이 증감 병합보다 빠르므로 INCREMENTAL_MIN_ROWS 이상일 때만 사용
+INCREMENTAL_MIN_ROWS = 200_000
+
+def get_sheet_diff(workbook, sheet_name):
+    diff = get_data_store().peek(workbook.content_hash, ('sheet_diff', sheet_name))
+    return diff if diff is not None and diff.comparable else None
+
+def get_previous_result(workbook, sheet_name, key):
+    """(직전 버전 대비 변경, 직전 버전의 같은 키 값). 둘 중 하나라도 없으면 (None, None)"""
+    diff = get_sheet_diff(workbook, sheet_name)
+    if diff is None or diff.rows < INCREMENTAL_MIN_ROWS:
+        return None, None
+    previous = get_data_store().peek(diff.base_version, key)
+    return (diff, previous) if previous is not None else (None, None)
+
+def build_expense_cube(workbook, sheet_name, year):
+    # SQL 소스면 연도 조건 + GROUP BY를 DB에서 처리
+    if hasattr(workbook, 'expense_cells'):
+        return ExpenseCube.from_cells(workbook.expense_cells(year))
+    key = ('expense_cube', sheet_name, year)
+    diff, previous = get_previous_result(workbook, sheet_name, key) if EXPENSE_INGEST == "full" else (None, None)
+    if previous is not None:
+        get_data_store().stats['incremental'] += 1
+        years = get_expense_years(workbook, sheet_name)
+        part = years.key(year)
+        return previous.updated(years.select(normalize_expense(diff.added), part), years.select(normalize_expense(diff.removed), part))
+    return ExpenseCube(get_expense_years(workbook, sheet_name).rows(year))
+
+def get_expense_cube(workbook, sheet_name, year=None):
+    return get_data_store().get(workbook.content_hash, ('expense_cube', sheet_name, year),
+                                lambda: build_expense_cube(workbook, sheet_name, year))
+
+def get_expense_rows(workbook, sheet_name, year=None, month=None, team=None, cat_main=None, cat_sub=None):
+    """상세 목록용 지출 행 (None인 조건은 적용하지 않음). SQL 소스면 인덱스를 타는 WHERE 조회"""
+    if hasattr(workbook, 'expense_rows'):
+        return workbook.expense_rows(year, month, team, cat_main, cat_sub)
+    df = get_expense_years(workbook, sheet_name).rows(year)
+    for col, value in (('월', month), ('팀명', team), ('대분류', cat_main), ('소분류', cat_sub)):
+        if value is not None:
+            df = df[df[col] == value]
+    return df
+
+def get_expense_search(workbook, sheet_name):
+    # 상세내역/대분류/소분류 n-gram 역색인 (처음 검색할 때 한 번 생성)
+    return get_data_store().get(workbook.content_hash, ('expense_search', sheet_name), lambda: SearchIndex(get_expense_frame(workbook, sheet_name)))
+
+def get_leave_frame(workbook, sheet_name):
+    return get_data_store().get(workbook.content_hash, ('leave', sheet_name), lambda: normalize_leave(workbook[sheet_name]))
+
+def get_leave_years(workbook, sheet_name):
+    # 원천 시트는 보통 해당 연도 한 벌뿐: 연도 열이 있을 때만 파티션을 나눔
+    return get_data_store().get(workbook.content_hash, ('leave_years', sheet_name), lambda: YearIndex.by_year_column(get_leave_frame(workbook, sheet_name)))
+
+def get_leave_analytics(workbook, sheet_name, year=None):
+    years = get_leave_years(workbook, sheet_name)
+    return get_data_store().get(workbook.content_hash, ('leave_analytics', sheet_name, years.key(year)),
+                                lambda: LeaveAnalytics(years.rows(year)))
+
+def get_overtime_frame(workbook, sheet_name):
+    return get_data_store().get(workbook.content_hash, ('overtime', sheet_name), lambda: normalize_overtime(workbook[sheet_name]))
+
+def get_overtime_years(workbook, sheet_name):
+    return get_data_store().get(workbook.content_hash, ('overtime_years', sheet_name), lambda: YearIndex.by_month(get_overtime_frame(workbook, sheet_name)))
+
+def build_overtime_analytics(workbook, sheet_name):
+    diff, previous = get_previous_result(workbook, sheet_name, ('overtime_analytics', sheet_name))
+    if previous is not None:
+        get_data_store().stats['incremental'] += 1
+        return previous.updated(normalize_overtime(diff.added), normalize_overtime(diff.removed))
+    return OvertimeAnalytics(get_overtime_frame(workbook, sheet_name))
+
+def get_overtime_analytics(workbook, sheet_name):
+    return get_data_store().get(workbook.content_hash, ('overtime_analytics', sheet_name), lambda: build_overtime_analytics(workbook, sheet_name))
+
+def build_years(workbook, sheets, kinds):
+    partitions = {'expense': get_expense_years, 'leave': get_leave_years, 'overtime': get_overtime_years}
+    years = set()
+    for kind in kinds:
+        if kind == 'expense' and sheets[kind] and hasattr(workbook, 'expense_years'):
+            years.update(workbook.expense_years())
+        elif sheets[kind]:
+            years.update(partitions[kind](workbook, sheets[kind]).years)
+    return sorted(years, reverse=True) or [str(get_previous_month().year)]
+
+def get_years(workbook, sheets, *kinds):
+    # 연도 선택 목록 (최신 연도 먼저): 메뉴가 쓰는 시트(kinds)에 있는 연도만. 연도가 없으면 전월이 속한 연도
+    return get_data_store().get(workbook.content_hash, ('years', *(sheets[k] for k in kinds)),
+                                lambda: build_years(workbook, sheets, kinds))
+
+def get_figure(workbook, name, filters, build):
+    # 같은 데이터 버전 + 같은 필터 값이면 다른 세션에서 만든 Figure를 그대로 사용
+    return get_data_store().get(workbook.content_hash, ('figure', name, *filters), build)
+
+# [Helper] 전월 구하기 (자동 필터용 - GitHub 오류 방지를 위해 기본 datetime 사용)
+def get_previous_month():
+    # 이번 달의 1일에서 하루를 빼면 정확히 저번 달이 됩니다. (dateutil 대체)
+    first_day = datetime.now().replace(day=1)
+    return first_day - timedelta(days=1)
+
+def get_default_month_index(options):
+    # 선택한 연도에 전월이 없으면(지난 연도) 전체 누적
+    prev_month_str = get_previous_month().strftime('%Y-%m')
+    for i, opt in enumerate(options):
+        if prev_month_str in opt:
+            return i
+    return 0
+
+def get_default_year_index(years):
+    # 전월이 속한 연도(1월이면 작년), 목록에 없으면 최신 연도
+    prev_year = str(get_previous_month().year)
+    return years.index(prev_year) if prev_year in years else 0
+
+
+# 시트 이름 매핑
+def find_sheet_names(workbook):
+    sheet_keys = list(workbook.keys())
+    return {
+        'budget': next((s for s in sheet_keys if '기준' in s or 'Budget' in s), None),
+        'expense': next((s for s in sheet_keys if '지출' in s or 'Expense' in s), None),
+        'leave': next((s for s in sheet_keys if '원천' in s or 'Leave' in s), None),
+        'overtime': next((s for s in sheet_keys if '연장' in s or 'Overtime' in s or '근무' in s), None),
+    }
+
+# [마스터 데이터] TypeError 완벽 방어를 위한 팀명 정제
+def build_master_teams(workbook, sheet_name):
+    df_bm = workbook[sheet_name].fillna(0)
+    if '팀명' not in df_bm.columns:
+        return ["전체 팀"]
+    teams = sorted(df_bm['팀명'].astype(str).unique())
+    teams = [t for t in teams if str(t).strip() not in ('0', '0.0', 'nan', 'NaN', '')]
+    return ["전체 팀"] + teams
+
+def get_master_teams(workbook, sheet_name):
+    if not sheet_name:
+        return ["전체 팀"]
+    return get_data_store().get(workbook.content_hash, ('master_teams', sheet_name),
+                                lambda: build_master_teams(workbook, sheet_name))
@@ -0,0 +1,116 @@
+"""예산 원장 벤치마크: 기존 팀 x 월 루프 vs budget_ledger.build_dashboard
+
+    python benchmarks/bench_budget_ledger.py --teams 500 --rows 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from budget_ledger import DASH_COLUMNS, build_dashboard  # noqa: E402
+
+
+def make_data(n_teams, n_rows, year=2026, seed=0):
+    rng = np.random.default_rng(seed)
+    teams = [f"팀{i:04d}" for i in range(n_teams - 1)] + ["공통운영비"]
+    df_budget = pd.DataFrame({'팀명': teams, '월 기본예산': rng.integers(1, 50, n_teams) * 100_000})
+    for m in range(1, 13):
+        df_budget[f"{m}월 추가"] = rng.choice([0, 0, 0, 500_000], n_teams)
+    df_budget['월기본예산'] = df_budget['월 기본예산']
+
+    months = rng.integers(1, 13, n_rows)
+    df_expense = pd.DataFrame({
+        '팀명': rng.choice(teams, n_rows),
+        '월': [f"{year}-{str(m).zfill(2)}" for m in months],
+        '금액': rng.integers(1, 500, n_rows) * 1_000,
+    })
+    monthly_exp = df_expense.groupby(['팀명', '월'])['금액'].sum().reset_index()
+    return df_budget, monthly_exp
+
+
+def legacy_dashboard(df_budget, monthly_exp, target_teams, target_year, target_month_idx, is_cumulative_view):
+    # app.py 기존 구현 (비교 기준)
+    dashboard_rows = []
+    for team in target_teams:
+        team_base_monthly = df_budget.loc[df_budget['팀명'] == team, '월기본예산'].sum()
+        cum_budget = 0
+        cum_spent = 0
+        cur_budget_added = 0
+        cur_spent = 0
+        for m in range(1, target_month_idx + 1):
+            month_str = f"{target_year}-{str(m).zfill(2)}"
+            add_col = [c for c in df_budget.columns if str(m) in c and '추가' in c]
+            this_add = df_budget.loc[df_budget['팀명'] == team, add_col[0]].sum() if add_col else 0
+            spent = monthly_exp[(monthly_exp['팀명'] == team) & (monthly_exp['월'] == month_str)]['금액'].sum()
+            cum_budget += (team_base_monthly + this_add)
+            cum_spent += spent
+            if m == target_month_idx:
+                cur_budget_added = team_base_monthly + this_add
+                cur_spent = spent
+
+        cum_balance = cum_budget - cum_spent
+        cum_rate = (cum_spent / cum_budget * 100) if cum_budget > 0 else 0
+        if is_cumulative_view:
+            cur_budget_total = cum_budget
+            cur_balance = cum_balance
+            cur_rate = cum_rate
+        else:
+            if target_month_idx == 1:
+                carry_over = 0
+            else:
+                carry_over = (cum_budget - cur_budget_added) - (cum_spent - cur_spent)
+            cur_budget_total = cur_budget_added + carry_over
+            cur_balance = cur_budget_total - cur_spent
+            cur_rate = (cur_spent / cur_budget_total * 100) if cur_budget_total > 0 else 0
+
+        dashboard_rows.append({
+            '팀명': team, '누계_예산': cum_budget, '누계_사용액': cum_spent, '누계_잔액': cum_balance,
+            '누계_집행률': cum_rate, '당월_예산': cur_budget_total, '당월_사용액': cur_spent,
+            '당월_잔액': cur_balance, '당월_집행률': cur_rate, 'is_공통': 1 if "공통" in str(team) else 0,
+        })
+    return pd.DataFrame(dashboard_rows, columns=DASH_COLUMNS)
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--teams', type=int, default=500)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--month', type=int, default=12)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    df_budget, monthly_exp = make_data(args.teams, args.rows)
+    teams = df_budget['팀명'].unique()
+    print(f"teams={args.teams} rows={args.rows} month={args.month}")
+
+    for is_cum in (False, True):
+        label = "누계" if is_cum else "당월"
+        fast_t, fast = timed(lambda: build_dashboard(df_budget, monthly_exp, teams, '2026', args.month, is_cum), args.repeat)
+        print(f"[{label}] vectorized: {fast_t * 1000:9.1f} ms")
+        if args.skip_legacy:
+            continue
+        slow_t, slow = timed(lambda: legacy_dashboard(df_budget, monthly_exp, teams, '2026', args.month, is_cum), 1)
+        num_cols = DASH_COLUMNS[1:]
+        same = np.allclose(fast[num_cols].to_numpy(float), slow[num_cols].to_numpy(float)) and \
+            (fast['팀명'].to_numpy() == slow['팀명'].to_numpy()).all()
+        print(f"[{label}] legacy loop: {slow_t * 1000:9.1f} ms  (x{slow_t / fast_t:,.0f}, same result: {same})")
+
+
+if __name__ == '__main__':
+    main()
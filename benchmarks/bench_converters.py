@@ -0,0 +1,85 @@
+"""셀 변환 마이크로 벤치마크: 기존 safe_numeric / clean_dept_name vs converters.py (100만 행 열)
+
+    python benchmarks/bench_converters.py --rows 1000000
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from converters import clean_labels, to_number  # noqa: E402
+
+
+def legacy_safe_numeric(series):
+    # data_prep.py 기존 구현 (비교 기준)
+    if not pd.api.types.is_numeric_dtype(series):
+        return pd.to_numeric(series.astype(str).str.replace(',', ''), errors='coerce').fillna(0)
+    else:
+        return pd.to_numeric(series, errors='coerce').fillna(0)
+
+
+def legacy_clean_dept_name(name):
+    if pd.isna(name): return ""
+    return re.sub(r'^[\d\.\s]+', '', str(name))
+
+
+def legacy_clean_column(series):
+    # 행마다 정규식 적용
+    return series.astype(str).map(legacy_clean_dept_name)
+
+
+def make_columns(n_rows, n_amounts, n_depts, seed=0):
+    rng = np.random.default_rng(seed)
+    amounts = [f"{v:,}" for v in rng.integers(1, 5_000, n_amounts) * 1_000] + ['', '-', '미정']
+    depts = [f"{i + 1}. 부서{i:03d}" for i in range(n_depts)]
+    mixed = pd.Series(rng.choice(np.array(amounts + [1500, 2.5], dtype=object), n_rows), dtype=object)
+    mixed[rng.random(n_rows) < 0.01] = np.nan
+    return {
+        '금액(문자열)': pd.Series(rng.choice(amounts, n_rows), dtype=object),
+        '금액(혼합)': mixed,
+        '시간(숫자)': pd.Series(rng.choice([0, 0.5, 1, 2, 8], n_rows)),
+        '소속': pd.Series(rng.choice(depts, n_rows), dtype=object),
+    }
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--amounts', type=int, default=5_000, help='고유 금액 문자열 수')
+    parser.add_argument('--depts', type=int, default=60, help='고유 부서명 수')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    columns = make_columns(args.rows, args.amounts, args.depts)
+    print(f"rows={args.rows} amounts={args.amounts} depts={args.depts}")
+
+    for name, series in columns.items():
+        if name == '소속':
+            legacy, fast = legacy_clean_column, clean_labels
+        else:
+            legacy, fast = legacy_safe_numeric, to_number
+        slow_t, slow = timed(lambda: legacy(series), args.repeat)
+        fast_t, result = timed(lambda: fast(series), args.repeat)
+        same = (slow.to_numpy() == result.to_numpy()).all()
+        print(f"{name:<10} legacy {slow_t * 1000:9.1f} ms  new {fast_t * 1000:9.1f} ms  "
+              f"(x{slow_t / fast_t:,.1f}, same result: {same})")
+
+
+if __name__ == '__main__':
+    main()
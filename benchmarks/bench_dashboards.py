@@ -0,0 +1,274 @@
+"""세 대시보드 벤치마크: 합성 워크북으로 단계별(load/normalize/aggregate/render) 시간과 최대 메모리,
+시트별 스키마 적용 전/후 프레임 메모리 측정
+
+    python benchmarks/bench_dashboards.py --expenses 100000 --output bench.json
+    python benchmarks/bench_dashboards.py --expenses 100000 --compare bench.json
+
+결과 JSON은 --compare로 이전 실행과 비교할 수 있으며, 임계값(--threshold, %)보다 느려진 단계는
+REGRESSION으로 표시된다(--fail-on-regression이면 종료 코드 1).
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import BytesIO
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from budget_ledger import build_dashboard  # noqa: E402
+from data_loader import WorkbookLoader  # noqa: E402
+from data_prep import normalize_budget, normalize_expense, normalize_leave, normalize_overtime  # noqa: E402
+from expense_cube import ExpenseCube  # noqa: E402
+from expense_stream import read_expense_rows  # noqa: E402
+from leave_analytics import LeaveAnalytics  # noqa: E402
+from overtime_analytics import OvertimeAnalytics  # noqa: E402
+from schema import memory_comparison  # noqa: E402
+from shared_cache import SharedCache  # noqa: E402
+from sheet_diff import SheetDiff  # noqa: E402
+from search_index import SearchIndex  # noqa: E402
+from sql_store import SqlSource, sync_workbook  # noqa: E402
+from synthetic import make_workbook, write_workbook  # noqa: E402
+from year_index import YearIndex  # noqa: E402
+
+SHEETS = {'budget': '예산기준', 'expense': '지출내역', 'leave': '연차원천', 'overtime': '연장근무'}
+
+
+class Recorder:
+    def __init__(self, repeat, memory):
+        self.repeat = repeat
+        self.memory = memory
+        self.stages = {}
+
+    def measure(self, name, fn, repeat=None):
+        best = float('inf')
+        value = None
+        for _ in range(repeat or self.repeat):
+            t0 = time.perf_counter()
+            value = fn()
+            best = min(best, time.perf_counter() - t0)
+
+        peak_mb = None
+        if self.memory:
+            tracemalloc.start()
+            fn()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+            tracemalloc.stop()
+
+        self.stages[name] = {'seconds': round(best, 6), 'peak_mb': None if peak_mb is None else round(peak_mb, 3)}
+        mem = f"{peak_mb:9.1f} MB" if peak_mb is not None else ""
+        print(f"{name:<45} {best * 1000:10.1f} ms {mem}")
+        return value
+
+
+def bench_stages(rec, path):
+    url = f"file://{path}"
+    rec.measure('load.fetch', lambda: WorkbookLoader(url).refresh())
+    with open(path, 'rb') as f:
+        payload = f.read()
+
+    raw = {}
+    for key, sheet in SHEETS.items():
+        raw[key] = rec.measure(f'load.parse.{key}',
+                               lambda sheet=sheet: pd.read_excel(BytesIO(payload), sheet_name=sheet, engine='openpyxl'))
+
+    workbook = WorkbookLoader(url).refresh()
+    rec.measure('load.stream.expense', lambda: read_expense_rows(workbook.iter_rows(SHEETS['expense'])))
+
+    df_budget = rec.measure('normalize.budget', lambda: normalize_budget(raw['budget']))
+    df_expense = rec.measure('normalize.expense', lambda: normalize_expense(raw['expense']))
+    df_leave = rec.measure('normalize.leave', lambda: normalize_leave(raw['leave']))
+    df_ot = rec.measure('normalize.overtime', lambda: normalize_overtime(raw['overtime']))
+
+    rec.measure('aggregate.expense_cube', lambda: ExpenseCube(df_expense))
+    # 연도 선택: 연도 파티션 인덱스 + 해당 연도 행만으로 만든 큐브
+    years = rec.measure('aggregate.expense_years', lambda: YearIndex.by_month(df_expense))
+    year = years.years[0]
+    cube = rec.measure('aggregate.expense_cube.year', lambda: ExpenseCube(YearIndex.by_month(df_expense).rows(year)))
+    search = rec.measure('aggregate.expense_search', lambda: SearchIndex(df_expense))
+    rec.measure('aggregate.expense_search.query', lambda: [search.search(q) for q in ('택시', '스타벅스 회의', '#12', '식대 점심')])
+    # 시트 갱신(앞쪽 20행 삭제 + 10행 추가) 후: 행 단위 비교 + 바뀐 행만 정규화해 큐브에 증감 반영
+    changed = pd.concat([raw['expense'].iloc[20:], raw['expense'].iloc[:10].assign(금액=lambda d: d['금액'] + 1000)],
+                        ignore_index=True)
+    diff = rec.measure('diff.expense', lambda: SheetDiff(SHEETS['expense'], raw['expense'], changed, 'base'))
+    rec.measure('aggregate.expense_cube.incremental',
+                lambda: cube.updated(*(normalize_expense(rows) for rows in (diff.added, diff.removed))))
+    teams = df_budget['팀명'].unique()
+    rec.measure('aggregate.budget_ledger.month', lambda: build_dashboard(df_budget, cube.monthly, teams, year, 6, False))
+    rec.measure('aggregate.budget_ledger.cumulative', lambda: build_dashboard(df_budget, cube.monthly, teams, year, 12, True))
+
+    leave = rec.measure('aggregate.leave_analytics', lambda: LeaveAnalytics(df_leave))
+    rec.measure('aggregate.leave_risk_scope', lambda: [leave.scope(None).risk(t) for t in range(5, 26)])
+
+    overtime = rec.measure('aggregate.overtime_analytics', lambda: OvertimeAnalytics(df_ot))
+    rec.measure('aggregate.overtime_scope', lambda: [(overtime.totals(m, year=y), overtime.prior_year(m, year=y),
+                                                      overtime.team_breakdown(m, overtime.teams, y))
+                                                     for y in overtime.years for m in [None] + overtime.months_of(y)])
+
+    # 로컬 SQL 소스(BUDGET_DATA_SOURCE): 전체 동기화 + 지출 필터/집계 pushdown 조회
+    db = os.path.join(os.path.dirname(path), 'budget.db')
+
+    def full_sync():
+        if os.path.exists(db):
+            os.remove(db)
+        return sync_workbook(db, workbook, SHEETS['expense'])
+
+    rec.measure('sql.sync.full', full_sync, repeat=1)
+    rec.measure('sql.sync.unchanged', lambda: sync_workbook(db, workbook, SHEETS['expense'], force=True))
+    source = SqlSource(db).refresh()
+    rec.measure('sql.expense_cells.year', lambda: source.expense_cells(year))
+    rec.measure('sql.expense_rows.filtered', lambda: source.expense_rows(year, f"{year}-06", str(teams[0])))
+
+    # 레플리카 공용 캐시(BUDGET_SHARED_CACHE_DIR): 정규화 프레임을 Parquet로 쓰고 다른 레플리카가 읽는 비용
+    shared = SharedCache(os.path.join(os.path.dirname(path), 'shared'))
+    rec.measure('shared.put.expense', lambda: shared.put_frame(workbook.content_hash, ('expense',), df_expense))
+    rec.measure('shared.get.expense', lambda: shared.get_frame(workbook.content_hash, ('expense',)))
+    return raw
+
+
+def bench_schema(raw):
+    """시트별 정규화 프레임 메모리: 선언 스키마 적용 전(compact=False) / 후"""
+    normalizers = {'budget': normalize_budget, 'expense': normalize_expense,
+                   'leave': normalize_leave, 'overtime': normalize_overtime}
+    memory = {}
+    print()
+    for key, normalize in normalizers.items():
+        report = memory_comparison(normalize(raw[key], compact=False), normalize(raw[key]))
+        before, after = (int(v) for v in report.iloc[-1][['이전 bytes', '이후 bytes']])
+        memory[key] = {'before_bytes': before, 'after_bytes': after}
+        print(f"{'memory.' + key:<45} {before / 1024 ** 2:8.2f} MB -> {after / 1024 ** 2:8.2f} MB")
+    return memory
+
+
+def filter_plans():
+    budget = [dict(zip(('기간', '부서', '대분류'), combo))
+              for combo in itertools.product(('전체 누적', '2026-06'), ('전체 팀', 0), ('전체', 0))]
+    leave = [{'기간(월)': p, '촉진 대상 기준 (잔여일)': r} for p, r in itertools.product(('전체 누적', '2026-06'), (5, 15))]
+    overtime = [{'조회 기간': p, '소속 팀': t} for p, t in itertools.product(('전체 누적', '2026-06'), ('전체 팀', 0))]
+    return [('💰 예산 관리', budget), ('🏖️ 연차 관리', leave), ('⏰ 연장근무 관리', overtime)]
+
+
+def apply_filters(at, filters):
+    # 값이 0이면 해당 선택 상자의 첫 번째 실제 항목(전체 제외)을 선택. 실제로 적용한 값을 반환
+    applied = {}
+    for label, value in filters.items():
+        for widget in list(at.selectbox) + list(at.slider):
+            if widget.label != label:
+                continue
+            if value == 0 and hasattr(widget, 'options'):
+                value = widget.options[1] if len(widget.options) > 1 else widget.options[0]
+            widget.set_value(value)
+            applied[label] = value
+    return applied
+
+
+def bench_render(rec, path, timeout):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    os.environ['BUDGET_SHEET_URL'] = f"file://{path}"
+    os.environ['BUDGET_SNAPSHOT_DIR'] = tempfile.mkdtemp(prefix='bench-snapshots-')
+    app_path = os.path.join(ROOT, 'app.py')
+
+    def new_app():
+        at = AppTest.from_file(app_path, default_timeout=timeout)
+        at.session_state['budget_auth'] = True
+        return at
+
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    rec.measure('render.cold_start', lambda: new_app().run(), repeat=1)
+
+    for menu, plans in filter_plans():
+        for filters in plans:
+            at = new_app().run()
+            at.sidebar.radio[0].set_value(menu).run()
+            applied = apply_filters(at, filters)
+
+            def rerun(at=at):
+                at.run()
+                if at.exception:
+                    raise RuntimeError(at.exception[0].message)
+
+            label = ",".join(f"{k}={v}" for k, v in applied.items())
+            rec.measure(f"render.{menu.split(' ', 1)[1]}[{label}]", rerun)
+
+
+def compare(current, baseline_path, threshold):
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = []
+    print(f"\n{'stage':<45} {'base ms':>10} {'now ms':>10} {'delta':>8}")
+    for name, now in current['stages'].items():
+        base = baseline['stages'].get(name)
+        if not base or not base['seconds']:
+            continue
+        delta = (now['seconds'] - base['seconds']) / base['seconds'] * 100
+        flag = "  REGRESSION" if delta > threshold else ""
+        print(f"{name:<45} {base['seconds'] * 1000:10.1f} {now['seconds'] * 1000:10.1f} {delta:+7.1f}%{flag}")
+        if flag:
+            regressions.append(name)
+    if baseline.get('meta', {}).get('workbook_sha256') != current['meta']['workbook_sha256']:
+        print("※ 기준 실행과 워크북이 다릅니다 (크기/시드 확인).")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--teams', type=int, default=30)
+    parser.add_argument('--expenses', type=int, default=20_000)
+    parser.add_argument('--employees', type=int, default=1_000)
+    parser.add_argument('--overtime-employees', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 최대 메모리 측정 생략')
+    parser.add_argument('--no-render', action='store_true', help='AppTest 렌더링 단계 생략')
+    parser.add_argument('--timeout', type=float, default=300)
+    parser.add_argument('--output')
+    parser.add_argument('--compare')
+    parser.add_argument('--threshold', type=float, default=20.0)
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='bench-')
+    path = write_workbook(os.path.join(workdir, 'workbook.xlsx'),
+                          make_workbook(args.teams, args.expenses, args.employees, args.overtime_employees, seed=args.seed))
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    rec = Recorder(args.repeat, memory=not args.no_memory)
+    memory = bench_schema(bench_stages(rec, path))
+    if not args.no_render:
+        bench_render(rec, path, args.timeout)
+
+    result = {
+        'meta': {
+            'teams': args.teams, 'expenses': args.expenses, 'employees': args.employees,
+            'overtime_employees': args.overtime_employees, 'seed': args.seed, 'repeat': args.repeat,
+            'workbook_sha256': digest, 'python': platform.python_version(), 'pandas': pd.__version__,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'stages': rec.stages,
+        'memory': memory,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        regressions = compare(result, args.compare, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
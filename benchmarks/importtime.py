@@ -0,0 +1,78 @@
+"""import 시간 예산 점검: `python -X importtime`으로 앱 공통 모듈과 메뉴별 화면 모듈의 추가 import 시간 측정
+
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --repeat 5 --top 10
+
+화면 모듈은 공통 모듈(SHELL)을 먼저 import한 뒤 측정하므로, 해당 메뉴를 처음 열 때 추가로 드는 시간이다.
+예산(BUDGET_MS)을 넘는 항목이 있으면 종료 코드 1.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHELL = ['theme', 'profiling', 'app_data', 'sidebar_view']
+VIEWS = ['budget_view', 'leave_view', 'overtime_view']
+# 밀리초. 공통 모듈은 streamlit/pandas/openpyxl 포함
+BUDGET_MS = {
+    'shell': 1200,
+    'budget_view': 100,
+    'leave_view': 300,
+    'overtime_view': 300,
+}
+LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def measure(preload, target):
+    """preload를 import한 뒤 target을 import할 때의 (총 ms, target이 끌어온 모듈별 [(cumulative ms, 모듈)])"""
+    code = "; ".join(f"import {m}" for m in preload + target)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    entries = []
+    for line in proc.stderr.splitlines():
+        m = LINE.match(line)
+        if m:
+            entries.append((int(m.group(2)) / 1000, len(m.group(3)), m.group(4)))
+
+    # importtime은 처음 import될 때만 기록하므로 preload 이후 줄이 target의 추가 비용
+    start = 0
+    for i, (_, depth, name) in enumerate(entries):
+        if depth == 0 and name in preload:
+            start = i + 1
+    total = sum(ms for ms, depth, name in entries[start:] if depth == 0 and name in target)
+    children = [(ms, name) for ms, depth, name in entries[start:] if depth == 2]
+    return total, children
+
+
+def best_of(preload, target, repeat):
+    runs = [measure(preload, target) for _ in range(repeat)]
+    return min(runs, key=lambda r: r[0])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=5, help='항목별로 표시할 느린 모듈 수')
+    args = parser.parse_args()
+
+    results = {'shell': best_of([], SHELL, args.repeat)}
+    for view in VIEWS:
+        results[view] = best_of(SHELL, [view], args.repeat)
+
+    over = []
+    for name, (total, top) in results.items():
+        budget = BUDGET_MS[name]
+        flag = "  OVER BUDGET" if total > budget else ""
+        print(f"{name:<15} {total:8.1f} ms / {budget:6d} ms{flag}")
+        for ms, module in sorted(top, reverse=True)[:args.top]:
+            print(f"    {module:<40} {ms:8.1f} ms")
+        if flag:
+            over.append(name)
+    sys.exit(1 if over else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""기준/지출/원천/연장 시트 구조를 따르는 합성 워크북 생성기
+
+    python benchmarks/synthetic.py out.xlsx --teams 40 --expenses 50000 --employees 2000
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = {
+    '복리후생': ['식대', '간식', '경조사'],
+    '교통비': ['택시', '주유', '주차'],
+    '소모품': ['문구', '전산소모품'],
+    '회의비': ['다과', '외부회의'],
+}
+MEMOS = ['스타벅스 회의', '카카오택시', '오피스디포 구매', '점심 식대', 'GS칼텍스 주유', '쿠팡 비품', '거래처 미팅']
+
+
+def team_names(n_teams):
+    return [f"{i + 1}. 팀{i + 1:03d}" for i in range(n_teams - 1)] + ["공통운영비"]
+
+
+def make_budget(teams, rng):
+    names = [t.split('. ', 1)[-1] for t in teams]
+    df = pd.DataFrame({'팀명': names, '월 기본예산': rng.integers(5, 50, len(names)) * 100_000})
+    for m in range(1, 13):
+        df[f"{m}월 추가"] = rng.choice([0, 0, 0, 200_000, 500_000], len(names))
+    return df
+
+
+def make_expense(teams, n_rows, years, rng):
+    names = [t.split('. ', 1)[-1] for t in teams]
+    mains = rng.choice(list(CATEGORIES), n_rows)
+    subs = [CATEGORIES[m][i % len(CATEGORIES[m])] for i, m in enumerate(mains)]
+    dates = pd.to_datetime({
+        'year': rng.choice(years, n_rows),
+        'month': rng.integers(1, 13, n_rows),
+        'day': rng.integers(1, 29, n_rows),
+    })
+    amounts = rng.integers(1, 300, n_rows) * 1_000
+    amounts[rng.random(n_rows) < 0.02] = 0
+    return pd.DataFrame({
+        '날짜': dates,
+        '팀명': rng.choice(names, n_rows),
+        '대분류': mains,
+        '소분류': subs,
+        '상세내역': [f"{MEMOS[i % len(MEMOS)]} #{i}" for i in rng.integers(0, 10 * n_rows, n_rows)],
+        '금액': amounts,
+    })
+
+
+def make_leave(teams, n_employees, rng):
+    total = rng.choice([15, 18, 20, 25], n_employees).astype(float)
+    used = np.floor(total * rng.random(n_employees) * 2) / 2
+    df = pd.DataFrame({
+        '소속': rng.choice(teams, n_employees),
+        '성명': [f"직원{i:05d}" for i in range(n_employees)],
+        '합계': total,
+        '사용일수': used,
+        '잔여일수': total - used,
+        '부채예산': 0,
+        '부채잔액': 0,
+    })
+    for m in range(1, 13):
+        df[f"{m}월"] = rng.choice([0, 0, 0.5, 1, 2], n_employees)
+    return df
+
+
+def make_overtime(teams, n_employees, years, rng):
+    names = [t.split('. ', 1)[-1] for t in teams]
+    months = [f"{y}-{m:02d}" for y in years for m in range(1, 13)]
+    n_rows = len(months) * n_employees
+    return pd.DataFrame({
+        '월': np.repeat(months, n_employees),
+        '팀명': rng.choice(names, n_rows),
+        '이름': np.tile([f"직원{i:05d}" for i in range(n_employees)], len(months)),
+        '연장 근로': rng.choice([0, 0, 2, 4, 8], n_rows).astype(float),
+        '야근시간': rng.choice([0, 0, 1, 3], n_rows).astype(float),
+        '휴일시간': rng.choice([0, 0, 0, 8], n_rows).astype(float),
+    })
+
+
+def make_workbook(teams=20, expenses=10_000, employees=500, overtime_employees=100, years=(2025, 2026), seed=0):
+    """시트 이름 -> DataFrame"""
+    rng = np.random.default_rng(seed)
+    names = team_names(teams)
+    return {
+        '예산기준': make_budget(names, rng),
+        '지출내역': make_expense(names, expenses, list(years), rng),
+        '연차원천': make_leave(names, employees, rng),
+        '연장근무': make_overtime(names, overtime_employees, list(years), rng),
+    }
+
+
+def write_workbook(path, sheets):
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path')
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--expenses', type=int, default=10_000)
+    parser.add_argument('--employees', type=int, default=500)
+    parser.add_argument('--overtime-employees', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sheets = make_workbook(args.teams, args.expenses, args.employees, args.overtime_employees, seed=args.seed)
+    print(write_workbook(args.path, sheets))
+
+
+if __name__ == '__main__':
+    main()
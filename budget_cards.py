@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 팀별 예산 카드: df_dash 전체를 한 번에 HTML로 변환 (스타일은 theme.py의 team-card 클래스)
+# 앱에서는 (데이터 버전, 기간)별로 전 팀 카드를 캐시하고, 팀 필터는 행 선택으로 처리
+# -----------------------------------------------------------------------------
+STATUS_CLASSES = np.array(['st-ok', 'st-warn', 'st-over'])
+
+
+def _status(rate):
+    # 집행률 80% 미만 / 100% 미만 / 그 이상
+    return pd.Series(STATUS_CLASSES[np.select([rate < 80, rate < 100], [0, 1], 2)], index=rate.index)
+
+
+def _money(series):
+    return series.map('{:,.0f}'.format)
+
+
+def _section(df, prefix, title):
+    rate = df[f'{prefix}_집행률']
+    status = _status(rate)
+    return (
+        '<div class="card-head"><span class="label">' + title + '</span>'
+        '<span class="rate ' + status + '">' + rate.map('{:.1f}'.format) + '%</span></div>'
+        '<div class="card-bar"><div class="' + status + '" style="width:' + rate.clip(upper=100).map('{:.2f}'.format) + '%;"></div></div>'
+        '<div class="card-nums"><span>예산: ' + _money(df[f'{prefix}_예산']) + '</span>'
+        '<span>사용: <strong>' + _money(df[f'{prefix}_사용액']) + '</strong></span>'
+        '<span>잔액: <strong class="' + status + '">' + _money(df[f'{prefix}_잔액']) + '</strong></span></div>'
+    )
+
+
+def card_html(df_dash):
+    """df_dash(build_dashboard 결과) 각 행의 카드 HTML Series"""
+    if df_dash.empty:
+        return pd.Series([], index=df_dash.index, dtype=object)
+    is_common = df_dash['is_공통'] == 1
+    team = df_dash['팀명'].astype(str)
+    label = team.where(~is_common, '⭐ ' + team)
+    return (
+        '<div class="team-card' + is_common.map({True: ' common', False: ''}) + '">'
+        '<div class="card-title">' + label + '</div>'
+        '<div class="card-section">' + _section(df_dash, '당월', '당월 실적 (이월포함)') + '</div>'
+        '<div class="card-divider"></div>'
+        '<div>' + _section(df_dash, '누계', '누계 실적 (1월 ~ 현재)') + '</div>'
+        '</div>'
+    )
+
+
+def build_team_cards(df_dash):
+    """정렬(공통운영비 먼저, 그다음 팀명 순)된 df_dash + html 열"""
+    if not df_dash.empty:
+        df_dash = df_dash.sort_values(by=['is_공통', '팀명'], ascending=[False, True]).reset_index(drop=True)
+    return df_dash.assign(html=card_html(df_dash))
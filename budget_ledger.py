@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 예산 원장: 팀 x 월 행렬로 한 번에 당월/누계/이월 계산
+# -----------------------------------------------------------------------------
+DASH_COLUMNS = ['팀명', '누계_예산', '누계_사용액', '누계_잔액', '누계_집행률',
+                '당월_예산', '당월_사용액', '당월_잔액', '당월_집행률', 'is_공통']
+
+
+def find_add_column(columns, month):
+    # 기존 규칙 유지: 월 숫자와 '추가'를 모두 포함하는 첫 번째 열
+    return next((c for c in columns if str(month) in c and '추가' in c), None)
+
+
+def _safe_rate(spent, budget):
+    rate = np.divide(spent, budget, out=np.zeros_like(spent, dtype=float), where=budget > 0)
+    return rate * 100
+
+
+def build_budget_matrix(df_budget, teams, months):
+    """팀 x 월 배정 예산(월기본예산 + 해당 월 추가 예산) 행렬"""
+    add_cols = {m: find_add_column(df_budget.columns, m) for m in months}
+    value_cols = ['월기본예산'] + sorted({c for c in add_cols.values() if c})
+    sums = df_budget.groupby('팀명')[value_cols].sum().reindex(teams, fill_value=0)
+
+    base = sums['월기본예산'].to_numpy(dtype=float)
+    matrix = np.repeat(base[:, None], len(months), axis=1)
+    for j, m in enumerate(months):
+        if add_cols[m]:
+            matrix[:, j] += sums[add_cols[m]].to_numpy(dtype=float)
+    return matrix
+
+
+def build_spent_matrix(monthly_exp, teams, month_keys):
+    """팀 x 월 사용액 행렬 (monthly_exp: 팀명/월/금액)"""
+    scoped = monthly_exp[monthly_exp['월'].isin(month_keys)]
+    pivot = scoped.pivot_table(index='팀명', columns='월', values='금액', aggfunc='sum', observed=True)
+    return pivot.reindex(index=teams, columns=month_keys).fillna(0).to_numpy(dtype=float)
+
+
+def build_dashboard(df_budget, monthly_exp, teams, target_year, target_month_idx, is_cumulative_view):
+    teams = pd.Index(teams)
+    months = list(range(1, target_month_idx + 1))
+    month_keys = [f"{target_year}-{str(m).zfill(2)}" for m in months]
+
+    budget_m = build_budget_matrix(df_budget, teams, months)
+    spent_m = build_spent_matrix(monthly_exp, teams, month_keys)
+
+    cum_budget = np.cumsum(budget_m, axis=1)[:, -1]
+    cum_spent = np.cumsum(spent_m, axis=1)[:, -1]
+    cum_balance = cum_budget - cum_spent
+    cum_rate = _safe_rate(cum_spent, cum_budget)
+
+    cur_spent = spent_m[:, -1]
+    if is_cumulative_view:
+        cur_budget_total = cum_budget
+        cur_balance = cum_balance
+        cur_rate = cum_rate
+    else:
+        cur_budget_added = budget_m[:, -1]
+        # 1월은 잔액 이월 없이 시작(Reset)
+        if target_month_idx == 1:
+            carry_over = np.zeros(len(teams))
+        else:
+            carry_over = (cum_budget - cur_budget_added) - (cum_spent - cur_spent)
+        cur_budget_total = cur_budget_added + carry_over
+        cur_balance = cur_budget_total - cur_spent
+        cur_rate = _safe_rate(cur_spent, cur_budget_total)
+
+    return pd.DataFrame({
+        '팀명': teams,
+        '누계_예산': cum_budget,
+        '누계_사용액': cum_spent,
+        '누계_잔액': cum_balance,
+        '누계_집행률': cum_rate,
+        '당월_예산': cur_budget_total,
+        '당월_사용액': cur_spent,
+        '당월_잔액': cur_balance,
+        '당월_집행률': cur_rate,
+        'is_공통': teams.astype(str).str.contains('공통').astype(int),  # 공통운영비 상단 정렬용
+    }, columns=DASH_COLUMNS)
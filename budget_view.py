@@ -0,0 +1,168 @@
+import streamlit as st
+
+from app_data import get_budget_frame, get_data_store, get_expense_cube, get_expense_rows, get_expense_search, get_years
+from budget_cards import build_team_cards
+from budget_ledger import build_dashboard
+from list_view import expense_rows, render_paged_rows
+from profiling import section, stage
+from sidebar_view import select_period
+
+
+# =============================================================================
+# [PART A] 예산 관리
+# =============================================================================
+def render(all_sheets, sheets, master_teams):
+    budget_sheet_name, expense_sheet_name = sheets['budget'], sheets['expense']
+
+    if not budget_sheet_name or not expense_sheet_name:
+        st.error("예산 시트가 없습니다.")
+        st.stop()
+
+    with stage("budget.normalize"):
+        df_budget = get_budget_frame(all_sheets, budget_sheet_name)
+        years = get_years(all_sheets, sheets, 'expense')
+
+    with st.sidebar:
+        st.subheader("Filter")
+        target_year, period_option = select_period(years, "기간")
+        
+        team_option = st.selectbox("부서", master_teams)
+
+        # 선택한 연도의 지출 행만으로 만든 큐브 (연도별로 한 번만 계산)
+        with stage("budget.year_cube"):
+            cube = get_expense_cube(all_sheets, expense_sheet_name, target_year)
+        main_cats = ["전체"] + cube.main_categories
+        cat_main = st.selectbox("대분류", main_cats)
+        sub_cats = ["전체"]
+        if cat_main != "전체":
+            sub_cats += cube.sub_categories.get(cat_main, [])
+        cat_sub = st.selectbox("소분류", sub_cats)
+
+    monthly_exp = cube.monthly
+
+    # 당월/누계 연산 로직 (선택 연도의 팀 x 월 행렬로 한 번에 계산, 1월에 이월 초기화)
+    is_cumulative_view = (period_option == "전체 누적")
+    target_month_idx = 12
+    if not is_cumulative_view:
+        try: target_month_idx = int(period_option.split('-')[1])
+        except: target_month_idx = 1
+
+    def build_rows(teams):
+        # 정렬: 공통운영비가 가장 먼저 오고, 그 다음 팀명 순 + 카드 HTML
+        return build_team_cards(build_dashboard(df_budget, monthly_exp, teams, target_year, target_month_idx, is_cumulative_view))
+
+    with stage("budget.dashboard_rows"):
+        # 전 팀 결과를 (데이터 버전, 연도, 기간)별로 한 번만 계산하고 팀 필터는 행 선택으로 처리
+        df_dash = get_data_store().get(all_sheets.content_hash, ('budget_dashboard', budget_sheet_name, target_year, period_option),
+                                       lambda: build_rows(df_budget['팀명'].unique()))
+        if team_option != "전체 팀":
+            df_dash = df_dash[df_dash['팀명'] == team_option].reset_index(drop=True)
+            if df_dash.empty:
+                df_dash = build_rows([team_option])
+
+    # KPI는 큐브 조회로 계산 (상세 행 필터링은 목록을 볼 때만)
+    filter_month = None if period_option == "전체 누적" else period_option
+    filter_team = None if team_option == "전체 팀" else team_option
+    filter_main = None if cat_main == "전체" else cat_main
+    filter_sub = None if cat_sub == "전체" else cat_sub
+    filtered_sum, filtered_count = cube.totals(filter_month, filter_team, filter_main, filter_sub)
+
+    st.markdown(f"""
+        <div class="modern-header">
+            <h1>💰 예산 관리 대시보드</h1>
+            <p>Status: {team_option} / {period_option}</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    kpi_row(df_dash, cat_main, filtered_sum, filtered_count)
+
+    st.divider()
+
+    team_cards(df_dash)
+
+    detail_list(all_sheets, expense_sheet_name, target_year, filter_month, filter_team, filter_main, filter_sub)
+
+
+# -----------------------------------------------------------------------------
+# 화면 구역: 상세 내역(비밀번호/검색어/페이지)만 fragment
+# -----------------------------------------------------------------------------
+def kpi_row(df_dash, cat_main, filtered_sum, filtered_count):
+    with section("budget.kpi"):
+        if cat_main == "전체":
+            tot_b = df_dash['당월_예산'].sum()
+            tot_s = df_dash['당월_사용액'].sum()
+            tot_r = df_dash['당월_잔액'].sum()
+        else:
+            tot_b = 0
+            tot_s = filtered_sum
+            tot_r = 0
+
+        total_rate = (tot_s / tot_b * 100) if tot_b > 0 else 0
+
+        c1, c2, c3, c4, c5 = st.columns(5)
+        c1.metric("가용 예산 (이월포함)", f"{tot_b:,.0f}원")
+        c2.metric("총 사용액", f"{tot_s:,.0f}원")
+        c3.metric("총 집행률", f"{total_rate:.1f}%")
+        c4.metric("현재 잔액", f"{tot_r:,.0f}원")
+        c5.metric("지출 건수", f"{filtered_count:,}건")
+
+
+def team_cards(df_dash):
+    st.subheader("🏢 팀별 집행 현황 (당월 & 누계)")
+    
+    if not df_dash.empty:
+        cards = df_dash['html']
+        split_idx = (len(cards) + 1) // 2
+
+        # 열마다 카드 전체를 한 요소로 전송
+        col_left, col_right = st.columns(2)
+        with col_left:
+            st.markdown("".join(cards.iloc[:split_idx]), unsafe_allow_html=True)
+        with col_right:
+            st.markdown("".join(cards.iloc[split_idx:]), unsafe_allow_html=True)
+    else:
+        st.info("데이터 없음")
+
+
+@st.fragment
+def detail_list(all_sheets, expense_sheet_name, target_year, filter_month, filter_team, filter_main, filter_sub):
+    st.subheader("📝 상세 지출 내역 (보안)")
+    
+    if 'budget_auth' not in st.session_state:
+        st.session_state['budget_auth'] = False
+        
+    if not st.session_state['budget_auth']:
+        # 비밀번호 입력은 이 구역만 다시 실행. 인증되면 사이드바 관리자 패널까지 보이도록 전체 rerun
+        col_pw1, col_pw2 = st.columns([2, 3])
+        with col_pw1:
+            pwd = st.text_input("관리자 비밀번호를 입력하세요", type="password")
+            if pwd == "7026":
+                st.session_state['budget_auth'] = True
+                st.rerun()
+            elif pwd:
+                st.error("비밀번호가 올바르지 않습니다.")
+        return
+
+    with section("budget.detail_rows"):
+        df_detail_filtered = get_expense_rows(all_sheets, expense_sheet_name, target_year,
+                                              filter_month, filter_team, filter_main, filter_sub)
+
+    # 검색어는 역색인으로 행을 찾은 뒤 위 필터 결과와 교집합
+    search_query = st.text_input("🔍 적요 검색", key="expense_search", placeholder="상세내역 · 대분류 · 소분류 (공백으로 구분한 단어를 모두 포함)")
+    if search_query.strip():
+        with section("budget.search"):
+            hits = get_expense_search(all_sheets, expense_sheet_name).search(search_query)
+            df_detail_filtered = df_detail_filtered[df_detail_filtered.index.isin(hits)]
+        st.caption(f"'{search_query.strip()}' 검색 결과 {len(df_detail_filtered):,}건")
+
+    if not df_detail_filtered.empty:
+        df_show = df_detail_filtered.sort_values('날짜', ascending=False, kind='stable').reset_index(drop=True)
+        st.markdown("""<div class="custom-header">
+<div class="row-item">날짜</div><div class="row-item">부서</div><div class="row-item">대분류</div>
+<div class="row-item">소분류</div><div class="row-item-left" style="flex:2;">적요</div>
+<div class="row-item" style="text-align:right; padding-right:20px;">금액</div></div>""", unsafe_allow_html=True)
+        
+        with section("budget.list.detail"):
+            render_paged_rows(df_show, expense_rows, key="page_expense", height=600)
+    else:
+        st.info("내역이 없습니다.")
@@ -0,0 +1,40 @@
+import plotly.express as px
+
+
+# -----------------------------------------------------------------------------
+# 차트: Figure 생성만 담당. 앱에서는 (데이터 버전, 필터 값)별로 저장소에 캐시해 세션 간 재사용
+# 숫자 열은 numpy 배열 그대로 넘겨 plotly가 typed array(base64)로 직렬화하게 하고,
+# 막대 라벨은 행마다 문자열을 만들지 않고 texttemplate로 브라우저에서 포맷
+# -----------------------------------------------------------------------------
+OT_COLOR_MAP = {
+    '연장시간': '#3B82F6', '연장근로': '#3B82F6',
+    '야근시간': '#EF4444',
+    '휴일시간': '#0EA5E9'
+}
+
+
+def dept_usage_figure(dept_sum):
+    """부서별 소진율 막대 (dept_sum: 소속/소진율)"""
+    fig = px.bar(dept_sum, x='소속', y='소진율', color='소진율', color_continuous_scale='Bluyl')
+    fig.update_traces(texttemplate='%{y:.1f}%', textfont_color='white', textposition='auto')
+    fig.update_layout(xaxis_title=None, yaxis_title="소진율(%)", height=450, paper_bgcolor='white', plot_bgcolor='white')
+    return fig
+
+
+def team_type_figure(df_long):
+    """팀별 근무 유형 누적 가로 막대 (df_long: 팀명/유형/시간)"""
+    fig = px.bar(df_long, x='시간', y='팀명', color='유형',
+                 orientation='h', barmode='stack',
+                 color_discrete_map=OT_COLOR_MAP, text_auto='.0f')
+    fig.update_traces(textposition='auto', textfont_size=12, textfont_color='white')
+    fig.update_layout(xaxis_title=None, yaxis_title=None, height=400,
+                      paper_bgcolor='white', plot_bgcolor='white', font=dict(size=14))
+    return fig
+
+
+def trend_figure(trend_df):
+    """월별 총근무 추이 영역 차트 (trend_df: 월/총근무, 월 순서대로 정렬된 상태)"""
+    fig = px.area(trend_df, x='월', y='총근무', markers=True)
+    fig.update_traces(line_color='#4318FF', fillcolor='rgba(67, 24, 255, 0.1)')
+    fig.update_layout(xaxis_title=None, yaxis_title=None, height=400, paper_bgcolor='white', plot_bgcolor='white')
+    return fig
@@ -0,0 +1,41 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 셀 값 변환: 고유값만 한 번 파싱해서 코드로 펼침 (같은 라벨/금액 문자열이 수천 번 반복되므로)
+# -----------------------------------------------------------------------------
+DEPT_PREFIX = re.compile(r'^[\d\.\s]+')
+
+
+@lru_cache(maxsize=4096)
+def clean_label(name):
+    """'1. 경영지원팀' -> '경영지원팀'. 결과는 프로세스 단위로 캐시"""
+    return DEPT_PREFIX.sub('', name)
+
+
+def _spread(series, uniques_out, codes, fill):
+    # codes == -1(결측)은 fill로 채움
+    values = np.append(np.asarray(uniques_out), [fill])
+    return pd.Series(values[codes], index=series.index, name=series.name)
+
+
+def to_number(series):
+    """콤마 포함 숫자 문자열/숫자 -> float64, 해석 불가·결측은 0 (기존 safe_numeric과 같은 결과)"""
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_numeric(series, errors='coerce').fillna(0)
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    parsed = pd.to_numeric(pd.Series(uniques, dtype=object).astype(str).str.replace(',', '', regex=False),
+                           errors='coerce').fillna(0).to_numpy(dtype=float)
+    return _spread(series, parsed, codes, 0.0)
+
+
+def clean_labels(series):
+    """부서명 열 정제: 고유값마다 clean_label 한 번, 결측은 빈 문자열"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    cleaned = np.array([clean_label(str(u)) for u in uniques], dtype=object)
+    return _spread(series, cleaned, codes, "").astype(str)
@@ -0,0 +1,242 @@
+import hashlib
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from collections.abc import Mapping
+from io import BytesIO
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from profiling import stage
+
+
+# -----------------------------------------------------------------------------
+# 워크북 로더: 조건부 요청(ETag/Last-Modified) + 시트 단위 지연 파싱
+# -----------------------------------------------------------------------------
+class LazyWorkbook(Mapping):
+    """시트 이름 -> DataFrame 매핑. 실제 파싱은 해당 시트를 처음 조회할 때 한 번만 수행한다."""
+
+    is_snapshot = False
+
+    def __init__(self, payload, content_hash):
+        self.content_hash = content_hash
+        self._payload = payload
+        self._frames = {}
+        self._lock = threading.Lock()
+
+        wb = load_workbook(BytesIO(payload), read_only=True)
+        try:
+            self._names = list(wb.sheetnames)
+        finally:
+            wb.close()
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._frames:
+                with stage(f"parse:{name}"):
+                    self._frames[name] = pd.read_excel(BytesIO(self._payload), sheet_name=name, engine='openpyxl')
+            return self._frames[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def parsed_sheets(self):
+        return list(self._frames)
+
+    def read(self, name):
+        """시트를 DataFrame으로 읽되 캐시하지 않는다 (이미 파싱된 시트는 그대로). 스냅샷 저장 등 백그라운드용"""
+        if name not in self._names:
+            raise KeyError(name)
+        with self._lock:
+            frame = self._frames.get(name)
+        if frame is not None:
+            return frame
+        return pd.read_excel(BytesIO(self._payload), sheet_name=name, engine='openpyxl')
+
+    def iter_rows(self, name):
+        """시트를 read-only 모드로 한 행씩(값만) 읽는다. DataFrame으로 파싱·캐시하지 않음"""
+        if name not in self._names:
+            raise KeyError(name)
+        wb = load_workbook(BytesIO(self._payload), read_only=True, data_only=True)
+        try:
+            yield from wb[name].iter_rows(values_only=True)
+        finally:
+            wb.close()
+
+
+class WorkbookLoader:
+    """게시된 xlsx를 받아오되, 바뀌지 않았으면(304 또는 동일 해시) 다시 파싱하지 않는다.
+
+    snapshot_store가 있으면 새 버전을 받을 때마다 Parquet 스냅샷으로 남기고,
+    콜드 스타트 시에는 스냅샷을 먼저 내보낸 뒤 백그라운드에서 최신본을 확인한다.
+    shared_cache(SharedCache)가 있으면 여러 레플리카 중 잠금을 잡은 하나만 시트를 받아오고,
+    나머지는 공유 볼륨에 올라간 원본을 그대로 읽어 모든 레플리카가 같은 버전을 보여준다.
+    """
+
+    def __init__(self, url, min_interval=60, timeout=30, snapshot_store=None, shared_cache=None):
+        self.url = url
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.snapshot_store = snapshot_store
+        self.shared_cache = shared_cache
+        self.last_error = None
+        self.stats = Counter()
+        self._etag = None
+        self._last_modified = None
+        self._checked_at = None
+        self._workbook = None
+        self._background = None
+        self._lock = threading.Lock()
+
+    @property
+    def workbook(self):
+        return self._workbook
+
+    def refresh(self, force=False):
+        with self._lock:
+            if self._workbook is None and self.snapshot_store is not None:
+                snapshot = self.snapshot_store.latest()
+                if snapshot is not None:
+                    self._workbook = snapshot
+                    self._background = threading.Thread(target=self._background_check, daemon=True)
+                    self._background.start()
+                    return self._workbook
+
+            # 백그라운드 확인이 진행 중이면 기다리지 않고 현재 데이터로 응답
+            if self._background is not None and self._background.is_alive():
+                return self._workbook
+
+            now = time.monotonic()
+            is_fresh = self._checked_at is not None and now - self._checked_at < self.min_interval
+            if self._workbook is not None and is_fresh and not force:
+                return self._workbook
+            return self._check()
+
+    def _background_check(self):
+        try:
+            self._check()
+        except Exception:
+            pass
+
+    def _check(self):
+        self._checked_at = time.monotonic()
+        if self.shared_cache is not None:
+            try:
+                return self._check_shared()
+            except OSError:
+                # 공유 볼륨 장애 시에는 레플리카 단독으로 시트를 확인
+                self.stats['shared_error'] += 1
+        return self._fetch_and_apply()
+
+    def _check_shared(self):
+        shared = self.shared_cache
+        info = shared.current()
+        if info is not None and shared.age(info) < self.min_interval and self._adopt(info):
+            return self._workbook
+        # 다른 레플리카가 확인 중이면 끝날 때까지(최대 timeout) 기다렸다가 그 결과를 사용
+        with shared.refresh_lock(wait=self.timeout) as acquired:
+            info = shared.current()
+            adopted = info is not None and self._adopt(info)
+            if adopted and (not acquired or shared.age(info) < self.min_interval):
+                return self._workbook
+            # 공유 캐시의 ETag로 조건부 요청 (304면 다시 받지 않음)
+            return self._fetch_and_apply()
+
+    def _adopt(self, info):
+        """공유 캐시가 가리키는 버전으로 맞춤 (원본은 공유 볼륨에서 읽고 다운로드하지 않음). 원본이 없으면 False"""
+        digest = info['content_hash']
+        if self._workbook is not None and self._workbook.content_hash == digest and not self._workbook.is_snapshot:
+            self.stats['shared_unchanged'] += 1
+        else:
+            payload = self.shared_cache.load_payload(digest)
+            if payload is None:
+                return False
+            self.stats['shared_changed'] += 1
+            self._workbook = LazyWorkbook(payload, digest)
+            self._persist(self._workbook)
+        self._etag, self._last_modified = info.get('etag'), info.get('last_modified')
+        return True
+
+    def _fetch_and_apply(self):
+        self.stats['fetch'] += 1
+        try:
+            payload = self._fetch()
+        except Exception as e:
+            # 이미 받아둔 데이터(또는 스냅샷)가 있으면 일시적인 오류는 무시하고 기존 데이터를 유지
+            self.last_error = e
+            self.stats['error'] += 1
+            if self._workbook is None:
+                raise
+            return self._workbook
+        self.last_error = None
+
+        if payload is None:
+            self.stats['not_modified'] += 1
+            self._share(None)
+            return self._workbook
+
+        digest = hashlib.sha256(payload).hexdigest()
+        if self._workbook is None or self._workbook.content_hash != digest:
+            self.stats['changed'] += 1
+            self._workbook = LazyWorkbook(payload, digest)
+            self._persist(self._workbook)
+        else:
+            self.stats['unchanged'] += 1
+            # 콜드 스타트 스냅샷과 같은 버전이면 원본으로 교체 (행 스트리밍 등은 원본이 필요. 스냅샷은 이미 저장돼 있음)
+            if self._workbook.is_snapshot:
+                self._workbook = LazyWorkbook(payload, digest)
+        self._share(payload)
+        return self._workbook
+
+    def _share(self, payload):
+        # 확인 결과를 공유 캐시에 기록 (원본이 아직 없으면 함께 저장). 실패해도 이 레플리카는 계속 동작
+        if self.shared_cache is None or self._workbook is None:
+            return
+        try:
+            if payload is not None:
+                self.shared_cache.publish(payload, self._workbook.content_hash, self._etag, self._last_modified)
+            else:
+                self.shared_cache.touch(self._workbook.content_hash, self._etag, self._last_modified)
+        except OSError:
+            self.stats['shared_error'] += 1
+
+    def _persist(self, workbook):
+        if self.snapshot_store is None:
+            return
+
+        def save():
+            try:
+                self.snapshot_store.save(workbook)
+            except Exception:
+                pass
+
+        threading.Thread(target=save, daemon=True).start()
+
+    def _fetch(self):
+        # 304(Not Modified)면 None 반환
+        req = urllib.request.Request(self.url)
+        if self._workbook is not None:
+            if self._etag:
+                req.add_header('If-None-Match', self._etag)
+            if self._last_modified:
+                req.add_header('If-Modified-Since', self._last_modified)
+
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                payload = resp.read()
+                self._etag = resp.headers.get('ETag')
+                self._last_modified = resp.headers.get('Last-Modified')
+                return payload
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from converters import clean_labels, to_number
+from schema import BUDGET_SCHEMA, EXPENSE_SCHEMA, LEAVE_SCHEMA, OVERTIME_SCHEMA
+
+
+# -----------------------------------------------------------------------------
+# 시트 정규화: 원본 시트 -> 바로 조회 가능한 타입의 DataFrame
+# compact=True(기본)이면 마지막에 schema.py의 선언 dtype을 적용. False는 메모리 비교용
+# -----------------------------------------------------------------------------
+INVALID_LABELS = ('0', '0.0', 'nan', 'NaN', '')
+
+
+# 열 단위 변환은 converters.py (고유값만 파싱)
+safe_numeric = to_number
+
+
+def normalize_budget(raw, compact=True):
+    df_budget = raw.fillna(0)
+    df_budget.columns = [str(c).strip() for c in df_budget.columns]
+
+    # 확실한 방어를 위해 강제 문자열 치환 후 필터링
+    df_budget['팀명'] = df_budget['팀명'].astype(str)
+    df_budget = df_budget[~df_budget['팀명'].isin(INVALID_LABELS)].copy()
+
+    for col in df_budget.columns:
+        if col != '팀명': df_budget[col] = safe_numeric(df_budget[col])
+
+    base_col = next((c for c in df_budget.columns if '배정' in c or '기본' in c), None)
+    if base_col:
+        df_budget['월기본예산'] = df_budget[base_col]
+    else:
+        num_cols = df_budget.select_dtypes(include=['number']).columns
+        df_budget['월기본예산'] = df_budget[num_cols[0]] if len(num_cols) > 0 else 0
+    df_budget = df_budget.reset_index(drop=True)
+    return BUDGET_SCHEMA.apply(df_budget) if compact else df_budget
+
+
+def normalize_expense(raw, compact=True):
+    """월_키는 YYYYMM 정수, 금액은 int64, 금액 0인 행 제외. 날짜가 비었거나 읽을 수 없으면 월은 결측, 월_키는 0"""
+    columns = [str(c).strip() for c in raw.columns]
+    date_col = next((c for c in columns if '날짜' in c or 'Date' in c), None)
+    # 날짜 열은 결측을 채우지 않음 (0으로 채우면 1970-01-01로 읽혀 1970년이 생김)
+    df_expense = raw.fillna({c: 0 for c, name in zip(raw.columns, columns) if name != date_col})
+    df_expense.columns = columns
+
+    # 지출 내역에서도 확실하게 문자열 처리
+    for col in ('팀명', '대분류', '소분류'):
+        if col in df_expense.columns: df_expense[col] = df_expense[col].astype(str)
+
+    if date_col:
+        df_expense[date_col] = pd.to_datetime(df_expense[date_col], errors='coerce')
+        dates = df_expense[date_col]
+        df_expense['월'] = dates.dt.strftime('%Y-%m')
+        df_expense['월_숫자'] = dates.dt.month
+        df_expense['월_키'] = (dates.dt.year * 100 + dates.dt.month).fillna(0).astype('int32')
+    else:
+        df_expense['월'] = 'Unknown'
+        df_expense['월_숫자'] = 0
+        df_expense['월_키'] = pd.Series(0, index=df_expense.index, dtype='int32')
+
+    if '금액' in df_expense.columns:
+        df_expense['금액'] = safe_numeric(df_expense['금액']).round().astype('int64')
+
+    df_expense = df_expense[df_expense['금액'] != 0].reset_index(drop=True)
+    return EXPENSE_SCHEMA.apply(df_expense) if compact else df_expense
+
+
+def normalize_leave(raw, compact=True):
+    df_leave = raw.fillna(0)
+    # 같은 부서명이 수천 번 반복되므로 고유값만 정제해서 매핑
+    df_leave['소속'] = clean_labels(df_leave['소속'])
+
+    # 대상델리하임 제외
+    df_leave = df_leave[~df_leave['소속'].isin(['대상델리하임', '0', 'nan', 'NaN'])].copy()
+
+    for col in ['합계', '사용일수', '잔여일수', '부채예산', '부채잔액']:
+        if col in df_leave.columns: df_leave[col] = safe_numeric(df_leave[col])
+
+    total = df_leave['합계'].to_numpy(dtype=float)
+    remain = df_leave['잔여일수'].to_numpy(dtype=float)
+    df_leave['잔여율'] = np.divide(remain, total, out=np.zeros_like(remain), where=total > 0) * 100
+    return LEAVE_SCHEMA.apply(df_leave) if compact else df_leave
+
+
+OT_HOUR_KEYS = ['연장시간', '연장근로', '야근시간', '휴일시간']
+
+
+def overtime_hour_columns(df_ot):
+    return [c for c in df_ot.columns if any(x in c for x in OT_HOUR_KEYS)]
+
+
+def normalize_overtime(raw, compact=True):
+    df_ot = raw.fillna(0)
+    df_ot.columns = [str(c).replace(' ','').strip() for c in df_ot.columns]
+
+    # [수정] TypeError 원천 차단: 팀명이 존재하면 가장 먼저 무조건 문자열 강제 변환
+    if '팀명' not in df_ot.columns:
+        df_ot['팀명'] = 'Unknown'
+
+    df_ot['팀명'] = df_ot['팀명'].astype(str)
+
+    # 지원팀 -> 경영지원팀, 생산팀/대상델리하임 제외
+    df_ot['팀명'] = df_ot['팀명'].replace('지원팀', '경영지원팀')
+    df_ot = df_ot[~df_ot['팀명'].isin(['생산팀', '대상델리하임', '0', '0.0', 'nan', 'NaN', ''])].copy()
+
+    month_col = next((c for c in df_ot.columns if c == '월' or c == 'Month'), None)
+    if month_col:
+        df_ot.rename(columns={month_col: '월'}, inplace=True)
+        df_ot['월'] = df_ot['월'].astype(str)
+    else:
+        df_ot['월'] = 'Unknown'
+
+    valid_num_cols = overtime_hour_columns(df_ot)
+    for c in valid_num_cols:
+        df_ot[c] = safe_numeric(df_ot[c])
+
+    df_ot['총근무'] = df_ot[valid_num_cols].sum(axis=1)
+    return OVERTIME_SCHEMA.apply(df_ot) if compact else df_ot
@@ -0,0 +1,103 @@
+import threading
+from collections import Counter, OrderedDict
+
+import pandas as pd
+
+from profiling import stage
+
+
+# -----------------------------------------------------------------------------
+# 버전별 공유 데이터 저장소: (데이터 버전, 키)마다 한 번만 만들고 모든 세션이 같은 객체를 읽음
+# -----------------------------------------------------------------------------
+def _frame_bytes(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if hasattr(value, 'to_plotly_json'):
+        # plotly Figure: 직렬화된 크기(브라우저 전송량)로 계산
+        return len(value.to_json())
+    if isinstance(value, (list, tuple)):
+        return sum(_frame_bytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(_frame_bytes(v) for v in value.values())
+    if hasattr(value, '__dict__'):
+        return sum(_frame_bytes(v) for v in vars(value).values())
+    return 0
+
+
+class VersionedDataStore:
+    """저장된 프레임은 읽기 전용으로 취급한다 (열 추가/수정이 필요하면 assign 등으로 새 프레임을 만들 것).
+
+    같은 (버전, 키)를 여러 세션이 동시에 요청해도 build는 한 번만 실행된다(single-flight).
+    최근 keep_versions개 버전만 유지한다.
+    shared(SharedCache)가 있으면 DataFrame 결과는 공유 볼륨에도 저장해 다른 레플리카가 다시 만들지 않는다.
+    """
+
+    def __init__(self, keep_versions=2, shared=None):
+        self.keep_versions = keep_versions
+        self.shared = shared
+        self._versions = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    def get(self, version, key, build):
+        with self._lock:
+            entries = self._versions.get(version)
+            if entries is not None and key in entries:
+                self.stats['hit'] += 1
+                return entries[key]
+            flight = self._inflight.setdefault((version, key), threading.Lock())
+
+        with flight:
+            try:
+                with self._lock:
+                    entries = self._versions.get(version)
+                    if entries is not None and key in entries:
+                        self.stats['hit'] += 1
+                        return entries[key]
+                    self.stats['miss'] += 1
+                value = self._build(version, key, build)
+                with self._lock:
+                    self._versions.setdefault(version, {})[key] = value
+                    self._versions.move_to_end(version)
+                    while len(self._versions) > self.keep_versions:
+                        self._versions.popitem(last=False)
+                return value
+            finally:
+                # build가 실패해도 잠금 객체를 남기지 않음 (기다리던 요청은 새 잠금으로 다시 시도)
+                with self._lock:
+                    if self._inflight.get((version, key)) is flight:
+                        del self._inflight[(version, key)]
+
+    def peek(self, version, key):
+        """이미 만들어진 값만 반환 (없으면 None, 새로 만들지 않음)"""
+        with self._lock:
+            return self._versions.get(version, {}).get(key)
+
+    def _build(self, version, key, build):
+        name = '/'.join(map(str, key)) if isinstance(key, tuple) else key
+        if self.shared is not None:
+            with stage(f"shared:{name}"):
+                value = self.shared.get_frame(version, key)
+            if value is not None:
+                self.stats['shared_hit'] += 1
+                return value
+        with stage(f"build:{name}"):
+            value = build()
+        if self.shared is not None and isinstance(value, pd.DataFrame):
+            self.stats['shared_put'] += self.shared.put_frame(version, key, value)
+        return value
+
+    def versions(self):
+        with self._lock:
+            return list(self._versions)
+
+    def memory_report(self):
+        """버전/키별 메모리 사용량(bytes) DataFrame"""
+        with self._lock:
+            snapshot = [(v, k, obj) for v, entries in self._versions.items() for k, obj in entries.items()]
+        rows = [{'version': v[:12], 'key': '/'.join(map(str, k)) if isinstance(k, tuple) else str(k),
+                 'bytes': _frame_bytes(obj)} for v, k, obj in snapshot]
+        return pd.DataFrame(rows, columns=['version', 'key', 'bytes'])
@@ -0,0 +1,69 @@
+import pandas as pd
+
+from schema import categorical_like
+
+
+# -----------------------------------------------------------------------------
+# 지출 집계 큐브: 팀 x 월 x 대분류 x 소분류 합계/건수를 데이터 버전당 한 번만 계산
+# -----------------------------------------------------------------------------
+CUBE_KEYS = ['팀명', '월', '대분류', '소분류']
+ALL = None
+
+
+def _valid_labels(values):
+    return sorted(str(v) for v in values if pd.notna(v) and str(v).strip() not in ('0', 'nan', ''))
+
+
+def _cells(df_expense, keys):
+    return (df_expense.groupby(keys, observed=True, dropna=False)['금액']
+            .agg(합계='sum', 건수='size')
+            .reset_index())
+
+
+class ExpenseCube:
+    def __init__(self, df_expense):
+        self._index(_cells(df_expense, [k for k in CUBE_KEYS if k in df_expense.columns]))
+
+    @classmethod
+    def from_cells(cls, cells):
+        """이미 집계된 셀(CUBE_KEYS + 합계/건수, 예: SQL GROUP BY 결과)로 큐브 구성"""
+        cube = cls.__new__(cls)
+        cube._index(cells)
+        return cube
+
+    def updated(self, added, removed):
+        """정규화된 추가/삭제 행만 반영한 새 큐브 (셀별 합계/건수에 증감을 더함, 전체 행 재집계 없음)"""
+        keys = [k for k in CUBE_KEYS if k in self.cells.columns]
+        changes = [rows[keys].assign(합계=rows['금액'] * sign, 건수=sign)
+                   for rows, sign in ((added, 1), (removed, -1)) if len(rows)]
+        if not changes:
+            return self
+
+        merged = pd.concat([self.cells, *changes], ignore_index=True)
+        cells = merged.groupby(keys, observed=True, dropna=False)[['합계', '건수']].sum()
+        cells = cells[cells['건수'] != 0].reset_index()
+        cells = cells.assign(**{key: categorical_like(cells[key], self.cells[key]) for key in keys})
+        return ExpenseCube.from_cells(cells)
+
+    def _index(self, cells):
+        self.cells = cells
+        self.monthly = (self.cells.groupby(['팀명', '월'], observed=True)['합계'].sum()
+                        .rename('금액').reset_index())
+
+        self.main_categories = []
+        self.sub_categories = {}
+        if '대분류' in self.cells.columns:
+            self.main_categories = _valid_labels(self.cells['대분류'].unique())
+        if '대분류' in self.cells.columns and '소분류' in self.cells.columns:
+            pairs = self.cells[['대분류', '소분류']].drop_duplicates()
+            for main, group in pairs.groupby('대분류', observed=True):
+                self.sub_categories[str(main)] = _valid_labels(group['소분류'].unique())
+
+    def totals(self, month=ALL, team=ALL, cat_main=ALL, cat_sub=ALL):
+        """필터 조합에 해당하는 (금액 합계, 지출 건수)"""
+        mask = pd.Series(True, index=self.cells.index)
+        for col, value in (('월', month), ('팀명', team), ('대분류', cat_main), ('소분류', cat_sub)):
+            if value is not ALL:
+                mask &= self.cells[col] == value
+        scoped = self.cells[mask]
+        return scoped['합계'].sum(), int(scoped['건수'].sum())
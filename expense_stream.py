@@ -0,0 +1,63 @@
+import pandas as pd
+
+from data_prep import normalize_expense
+from schema import EXPENSE_SCHEMA
+
+
+# -----------------------------------------------------------------------------
+# 지출 시트 스트리밍 적재: 행 묶음(chunk) 단위로 읽으면서 바로 정규화·0원 제거
+# 원본 전체를 object 프레임으로 올리지 않으므로 최대 메모리는 chunk 크기에 비례
+# -----------------------------------------------------------------------------
+CHUNK_ROWS = 20_000
+
+
+def _batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _combine(frames, header):
+    if not frames:
+        return normalize_expense(pd.DataFrame(columns=header))
+
+    # chunk마다 category 집합이 달라 그대로 합치면 object로 풀리므로 범주를 먼저 통일
+    for col in frames[0].columns:
+        if EXPENSE_SCHEMA.dtype_for(col) == 'category':
+            categories = pd.api.types.union_categoricals([f[col] for f in frames]).categories
+            for f in frames:
+                f[col] = f[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_expense_rows(rows, chunksize=CHUNK_ROWS):
+    """첫 행이 헤더인 행 iterator(openpyxl read-only iter_rows 등) -> 정규화된 지출 프레임"""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return normalize_expense(pd.DataFrame(columns=['금액']))
+    header = [str(c) if c is not None else f"Unnamed: {i}" for i, c in enumerate(header)]
+
+    frames = []
+    for batch in _batched(rows, chunksize):
+        chunk = normalize_expense(pd.DataFrame.from_records(batch, columns=header))
+        if not chunk.empty:
+            frames.append(chunk)
+    return _combine(frames, header)
+
+
+def read_expense_csv(source, chunksize=CHUNK_ROWS):
+    """같은 게시 시트의 CSV 내보내기(…/pub?gid=<gid>&single=true&output=csv)를 chunk 단위로 적재"""
+    frames = []
+    header = None
+    for raw in pd.read_csv(source, chunksize=chunksize):
+        header = list(raw.columns)
+        chunk = normalize_expense(raw)
+        if not chunk.empty:
+            frames.append(chunk)
+    return _combine(frames, header or ['금액'])
@@ -0,0 +1,81 @@
+import re
+import threading
+
+import numpy as np
+
+from data_prep import safe_numeric
+
+
+# -----------------------------------------------------------------------------
+# 연차 분석: 부서별 집계와 잔여일수 정렬 인덱스를 데이터 버전당 한 번만 계산
+# -----------------------------------------------------------------------------
+MONTH_COLUMN = re.compile(r'^\d{1,2}월$')
+TOTAL_COLUMNS = ['합계', '사용일수', '잔여일수']
+
+
+class _Scope:
+    """한 부서(또는 전체)의 정렬 인덱스.
+
+    잔여일수 오름차순으로 정렬해 두고 합계/사용/잔여의 뒤쪽 누적합을 들고 있으므로,
+    촉진 대상 기준(잔여일수 >= N)은 이진 탐색 한 번으로 대상자 수와 합계를 구한다.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        # 목록 표시 순서: 잔여율 내림차순 / 명부는 소속순
+        self.by_rate = frame.sort_values('잔여율', ascending=False, kind='stable')
+        self.roster = frame.sort_values('소속', kind='stable')
+
+        remain = self.by_rate['잔여일수'].to_numpy(dtype=float)
+        self._order = np.argsort(remain, kind='stable')
+        self._remain_sorted = remain[self._order]
+
+        totals = self.by_rate[TOTAL_COLUMNS].to_numpy(dtype=float)[self._order]
+        # suffix[i] = 정렬 기준 i번째 이후(잔여일수가 큰 쪽) 합계, 마지막 행은 0
+        self._suffix = np.vstack([np.cumsum(totals[::-1], axis=0)[::-1], np.zeros((1, len(TOTAL_COLUMNS)))])
+
+    def _cut(self, threshold):
+        return int(np.searchsorted(self._remain_sorted, threshold, side='left'))
+
+    def risk(self, threshold):
+        cut = self._cut(threshold)
+        positions = np.sort(self._order[cut:])
+        return self.by_rate.iloc[positions]
+
+    def risk_totals(self, threshold):
+        """(대상자 수, 총 연차, 사용 총계, 잔여 총계)"""
+        cut = self._cut(threshold)
+        tot, used, remain = self._suffix[cut]
+        return len(self._remain_sorted) - cut, tot, used, remain
+
+
+class LeaveAnalytics:
+    def __init__(self, df_leave):
+        self.month_columns = [c for c in df_leave.columns if MONTH_COLUMN.match(str(c))]
+        self.frame = df_leave.assign(**{c: safe_numeric(df_leave[c]) for c in self.month_columns})
+
+        value_cols = [c for c in TOTAL_COLUMNS + self.month_columns if c in self.frame.columns]
+        self.dept_rollup = self.frame.groupby('소속')[value_cols].sum()
+        self._scopes = {}
+        self._lock = threading.Lock()
+
+    def scope(self, dept=None):
+        with self._lock:
+            if dept not in self._scopes:
+                frame = self.frame if dept is None else self.frame[self.frame['소속'] == dept]
+                self._scopes[dept] = _Scope(frame)
+            return self._scopes[dept]
+
+    def usage_column(self, period_option):
+        """기간 옵션('2026-03')에 해당하는 월 사용 열 이름. 없으면 None"""
+        month = period_option.split('-')[1]
+        for candidate in (month + "월", f"{int(month)}월" if month.isdigit() else None):
+            if candidate in self.frame.columns:
+                return candidate
+        return None
+
+    def dept_summary(self, usage_col, dept=None):
+        rollup = self.dept_rollup if dept is None else self.dept_rollup.loc[self.dept_rollup.index == dept]
+        dept_sum = rollup[[usage_col, '합계']].reset_index()
+        dept_sum['소진율'] = (dept_sum[usage_col] / dept_sum['합계'] * 100).fillna(0)
+        return dept_sum
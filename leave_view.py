@@ -0,0 +1,143 @@
+import streamlit as st
+
+from app_data import get_figure, get_leave_analytics, get_leave_years, get_years
+from charts import dept_usage_figure
+from list_view import render_paged_rows, risk_rows, roster_rows
+from profiling import section, stage
+from sidebar_view import select_period
+
+
+# =============================================================================
+# [PART B] 연차 관리
+# =============================================================================
+def render(all_sheets, sheets, master_teams):
+    leave_sheet_name = sheets['leave']
+
+    if not leave_sheet_name:
+        st.error("연차 데이터 시트가 없습니다.")
+        st.stop()
+
+    with stage("leave.normalize"):
+        years = get_years(all_sheets, sheets, 'leave')
+
+    with st.sidebar:
+        st.subheader("Filter")
+        leave_year, leave_period_option = select_period(years, "기간(월)")
+        
+        dept_list = master_teams 
+        leave_dept_option = st.selectbox("소속 부서", dept_list)
+
+    # 연도 열이 있는 시트면 해당 연도 행만으로 분석 (없으면 시트 전체)
+    with stage("leave.year_scope"):
+        leave = get_leave_analytics(all_sheets, leave_sheet_name, leave_year)
+        year_key = get_leave_years(all_sheets, leave_sheet_name).key(leave_year)
+
+    # 부서/기준 변경은 미리 만든 정렬 인덱스 조회로 처리 (전체 필터·정렬 없음)
+    leave_scope = leave.scope(None if leave_dept_option == "전체 팀" else leave_dept_option)
+
+    display_usage_col = '사용일수'
+    if leave_period_option != "전체 누적":
+        target_col = leave.usage_column(leave_period_option)
+        if target_col:
+             display_usage_col = target_col
+        else:
+             st.warning(f"'{leave_period_option.split('-')[1]}월' 데이터가 없습니다. 누적 사용량으로 표시합니다.")
+
+    st.markdown(f"""
+        <div class="modern-header">
+            <h1>🏖️ 연차 관리 대시보드</h1>
+            <p>Status: {leave_dept_option} / {leave_period_option}</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    kpi_row(leave_scope, display_usage_col, leave_period_option)
+
+    st.divider()
+
+    c_chart, c_risk = st.columns([4, 6])
+    with c_chart:
+        dept_chart(all_sheets, leave, year_key, display_usage_col, None if leave_dept_option == "전체 팀" else leave_dept_option)
+
+    with c_risk:
+        risk_list(leave_scope)
+
+    st.divider()
+    roster_list(leave_scope)
+
+
+# -----------------------------------------------------------------------------
+# 화면 구역: 촉진 대상자(촉진 기준 슬라이더)와 명부(페이지)만 fragment
+# -----------------------------------------------------------------------------
+def kpi_row(leave_scope, display_usage_col, period_option):
+    with section("leave.kpi"):
+        df_leave = leave_scope.frame
+        total_used = df_leave[display_usage_col].sum()
+        total_remain = df_leave['잔여일수'].sum()
+
+        # 목표 소진율 50%
+        avg_usage = (total_used / df_leave['합계'].sum() * 100) if df_leave['합계'].sum() > 0 else 0
+
+        # 부채 제거
+        k1, k2, k3 = st.columns(3)
+        k1.metric(f"소진율 ({period_option})", f"{avg_usage:.1f}%", delta="Goal 50%")
+        k2.metric("총 사용 연차", f"{total_used:,.1f}일")
+        k3.metric("총 잔여 연차", f"{total_remain:,.1f}일")
+
+
+def dept_chart(all_sheets, leave, year_key, display_usage_col, dept_key):
+    st.subheader("📊 부서별 소진율")
+    with section("leave.chart.dept"):
+        fig = get_figure(all_sheets, 'leave_dept_usage', (year_key, display_usage_col, dept_key),
+                         lambda: dept_usage_figure(leave.dept_summary(display_usage_col, dept_key)))
+        st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def risk_list(leave_scope):
+    # 촉진 기준은 이 구역에서만 쓰이므로 사이드바 대신 목록 위에 둠 (바꿔도 차트/명부는 다시 그리지 않음)
+    st.subheader(f"🚨 촉진 대상자 (High Residual Rate)")
+    risk_criteria = st.slider("촉진 대상 기준 (잔여일)", 5, 25, 10, key="risk_criteria")
+    with section("leave.list.risk"):
+        risk_count, r_tot, r_use, r_rem = leave_scope.risk_totals(risk_criteria)
+        st.metric("촉진 대상자", f"{risk_count}명", f"> {risk_criteria} days", delta_color="inverse")
+        if risk_count > 0:
+            r_rate = (r_rem / r_tot * 100) if r_tot > 0 else 0 
+            
+            st.markdown(f"""
+                <div class="total-box">
+                    <div><span class="total-label">대상자 총 연차</span><span class="total-value">{r_tot:,.1f}</span></div>
+                    <div><span class="total-label">사용 총계</span><span class="total-value">{r_use:,.1f}</span></div>
+                    <div><span class="total-label">잔여 총계</span><span class="total-value" style="color:#FCA5A5;">{r_rem:,.1f}</span></div>
+                    <div><span class="total-label">평균 잔여율</span><span class="total-value">{r_rate:.1f}%</span></div>
+                </div>
+            """, unsafe_allow_html=True)
+            
+            # 잔여일 -> 잔여율로 변경
+            st.markdown("""
+                <div class="custom-header">
+                    <div class="row-item">성명/직급</div>
+                    <div class="row-item">소속</div>
+                    <div class="row-item">잔여율</div>
+                    <div class="row-item">비고</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+            render_paged_rows(leave_scope.risk(risk_criteria), risk_rows, key="page_risk", height=400)
+        else:
+            st.success("대상자 없음")
+
+
+@st.fragment
+def roster_list(leave_scope):
+    st.subheader("👥 전체 임직원 명부")
+    
+    # 잔여율만 표시 (총/사용/잔여일 삭제)
+    st.markdown("""
+        <div class="custom-header">
+            <div class="row-item">소속</div>
+            <div class="row-item">성명</div>
+            <div class="row-item">잔여율</div>
+        </div>
+    """, unsafe_allow_html=True)
+    with section("leave.list.roster"):
+        render_paged_rows(leave_scope.roster, roster_rows, key="page_roster", height=600)
@@ -0,0 +1,88 @@
+import math
+
+import pandas as pd
+import streamlit as st
+
+
+# -----------------------------------------------------------------------------
+# 리스트 컴포넌트: 행마다 st.markdown을 보내지 않고, 한 페이지 분량을 한 번에 렌더링
+# -----------------------------------------------------------------------------
+PAGE_SIZE = 100
+# 리스트 마지막 잘림 방지용 여백
+BOTTOM_SPACER = "<div style='height: 20px;'></div>"
+
+
+def _fmt(series, spec):
+    return series.map(spec.format)
+
+
+def _text(series):
+    return series.astype(str)
+
+
+def render_paged_rows(df, row_html, key, height=600, page_size=PAGE_SIZE):
+    """df를 page_size 단위로 나눠 현재 페이지의 행 HTML(row_html(window) -> Series)을 하나의 요소로 출력"""
+    n_pages = max(1, math.ceil(len(df) / page_size))
+    if st.session_state.get(key, 1) > n_pages:
+        st.session_state[key] = 1
+
+    page = 1
+    if n_pages > 1:
+        col_info, col_page = st.columns([4, 1])
+        with col_page:
+            page = st.number_input("페이지", min_value=1, max_value=n_pages, step=1, key=key, label_visibility="collapsed")
+        with col_info:
+            st.caption(f"총 {len(df):,}건 · {page} / {n_pages} 페이지")
+
+    window = df.iloc[(page - 1) * page_size: page * page_size]
+    with st.container(height=height):
+        st.markdown("".join(row_html(window)) + BOTTOM_SPACER, unsafe_allow_html=True)
+
+
+# -----------------------------------------------------------------------------
+# 행 템플릿 (custom-row / badge 스타일 유지)
+# -----------------------------------------------------------------------------
+def expense_rows(df):
+    date_str = df['날짜'].dt.strftime('%Y-%m-%d').fillna('')
+    amt_str = _fmt(df['금액'].astype('int64'), '{:,}')
+    return ('<div class="custom-row">'
+            '<div class="row-item" style="color:#64748B; font-size:0.85rem;">' + date_str + '</div>'
+            '<div class="row-item"><strong>' + _text(df['팀명']) + '</strong></div>'
+            '<div class="row-item"><span class="badge badge-gray">' + _text(df['대분류']) + '</span></div>'
+            '<div class="row-item"><span class="badge badge-gray">' + _text(df['소분류']) + '</span></div>'
+            '<div class="row-item-left" style="flex:2; color:#334155;">' + _text(df['상세내역']) + '</div>'
+            '<div class="row-item" style="text-align:right; padding-right:20px; font-weight:bold; color:#1E293B;">' + amt_str + '원</div>'
+            '</div>')
+
+
+def risk_rows(df):
+    return ('<div class="custom-row">'
+            '<div class="row-item"><strong>' + _text(df['성명']) + '</strong></div>'
+            '<div class="row-item" style="color:#64748B;">' + _text(df['소속']) + '</div>'
+            '<div class="row-item"><span class="badge badge-red">' + _fmt(df['잔여율'], '{:.1f}') + '%</span></div>'
+            '<div class="row-item" style="font-size:0.8rem; color:#94A3B8;">잔여 ' + _fmt(df['잔여일수'], '{:.1f}') + '일 이상</div>'
+            '</div>')
+
+
+def roster_rows(df):
+    return ('<div class="custom-row">'
+            '<div class="row-item" style="color:#64748B;">' + _text(df['소속']) + '</div>'
+            '<div class="row-item"><strong>' + _text(df['성명']) + '</strong></div>'
+            '<div class="row-item"><span class="badge badge-blue">' + _fmt(df['잔여율'], '{:.1f}') + '%</span></div>'
+            '</div>')
+
+
+def overtime_rows(df):
+    def hours(*cols):
+        col = next((c for c in cols if c in df.columns), None)
+        return df[col] if col else pd.Series(0.0, index=df.index)
+
+    return ('<div class="custom-row">'
+            '<div class="row-item" style="color:#A3AED0;">' + _text(df['월']) + '</div>'
+            '<div class="row-item"><strong>' + _text(df['팀명']) + '</strong></div>'
+            '<div class="row-item">' + _text(df['이름']) + '</div>'
+            '<div class="row-item" style="color:#3B82F6; font-weight:bold;">' + _fmt(hours('연장근로', '연장시간'), '{:.1f}') + '</div>'
+            '<div class="row-item" style="color:#EF4444; font-weight:bold;">' + _fmt(hours('야근시간'), '{:.1f}') + '</div>'
+            '<div class="row-item" style="color:#0EA5E9; font-weight:bold;">' + _fmt(hours('휴일시간'), '{:.1f}') + '</div>'
+            '<div class="row-item" style="font-weight:bold; background-color:#EFF4FB; border-radius:4px; color:#2B3674;">' + _fmt(df['총근무'], '{:.1f}') + 'h</div>'
+            '</div>')
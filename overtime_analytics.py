@@ -0,0 +1,133 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from data_prep import INVALID_LABELS, overtime_hour_columns
+from schema import categorical_like
+from year_index import YearIndex, year_labels, year_of
+
+
+# -----------------------------------------------------------------------------
+# 연장근무 분석: 팀 x 월 x 유형(연장/야근/휴일) 집계와 정렬된 월 인덱스를 데이터 버전당 한 번만 계산
+# 집계는 연도별 파티션으로 나눠 두고, 연도를 지정한 조회는 해당 연도 행만 본다
+# -----------------------------------------------------------------------------
+KINDS = ('연장', '야근', '휴일')
+MONTH_PARTS = re.compile(r'(\d{4})\D*(\d{1,2})')
+ALL = None
+
+
+def month_sort_key(label):
+    """'2026-03' -> 202603. 숫자만 이어 붙여 정렬 (숫자가 없으면 0)"""
+    digits = re.sub(r'\D', '', str(label))
+    return int(digits) if digits else 0
+
+
+def prior_year_label(label):
+    """'2026-03' -> '2025-03'. 연/월을 읽을 수 없으면 None"""
+    m = MONTH_PARTS.search(str(label))
+    if not m:
+        return None
+    return f"{int(m.group(1)) - 1}-{int(m.group(2)):02d}"
+
+
+class OvertimeAnalytics:
+    def __init__(self, df_ot):
+        self.hour_columns = overtime_hour_columns(df_ot)
+        self.kind_columns = {k: [c for c in self.hour_columns if k in c] for k in KINDS}
+        self._index(self._group(df_ot))
+
+    def _group(self, df_ot):
+        # 시간 열은 float32로 저장되므로 합계는 float64로 누적. 행 수(_rows)는 증분 반영 시 빈 셀 판단용
+        value_cols = self.hour_columns + ['총근무']
+        values = df_ot[value_cols].astype('float64').assign(팀명=df_ot['팀명'], 월=df_ot['월'], _rows=1)
+        return values.groupby(['팀명', '월'], observed=True)[value_cols + ['_rows']].sum()
+
+    def _index(self, sums):
+        self._sums = sums
+        self.rollup = sums.drop(columns='_rows')
+        for kind, cols in self.kind_columns.items():
+            self.rollup[kind] = self.rollup[cols].sum(axis=1)
+
+        months = self.rollup.index.get_level_values('월')
+        self.partitions = YearIndex(self.rollup, year_labels(pd.Series(months)))
+        self.years = self.partitions.years
+        self.months = sorted((str(m) for m in months.unique()), key=month_sort_key)
+        teams = self.rollup.index.get_level_values('팀명').unique()
+        self.teams = sorted(str(t) for t in teams if str(t).strip() not in INVALID_LABELS)
+
+    def updated(self, added, removed):
+        """정규화된 추가/삭제 행만 반영한 새 분석 (팀 x 월 롤업에 시간 증감을 더함, 전체 재집계 없음)"""
+        parts = [self._sums]
+        if len(added):
+            parts.append(self._group(added))
+        if len(removed):
+            parts.append(-self._group(removed))
+        if len(parts) == 1:
+            return self
+
+        sums = pd.concat(parts).groupby(level=['팀명', '월']).sum()
+        sums = sums[sums['_rows'] > 0]
+        sums.index = pd.MultiIndex.from_arrays(
+            [categorical_like(sums.index.get_level_values(n), self._sums.index.get_level_values(n)) for n in sums.index.names],
+            names=sums.index.names)
+
+        analytics = OvertimeAnalytics.__new__(OvertimeAnalytics)
+        analytics.hour_columns, analytics.kind_columns = self.hour_columns, self.kind_columns
+        analytics._index(sums)
+        return analytics
+
+    def months_of(self, year=ALL):
+        year = self.partitions.key(year)
+        return self.months if year is None else [m for m in self.months if year_of(m) == year]
+
+    def _scope(self, month=ALL, team=ALL, months=None, year=ALL):
+        frame = self.partitions.rows(year)
+        mask = np.ones(len(frame), dtype=bool)
+        if month is not ALL:
+            mask &= frame.index.get_level_values('월') == month
+        if months is not None:
+            mask &= frame.index.get_level_values('월').isin(months)
+        if team is not ALL:
+            mask &= frame.index.get_level_values('팀명') == team
+        return frame[mask]
+
+    def totals(self, month=ALL, team=ALL, year=ALL):
+        """{'총근무': h, '연장': h, '야근': h, '휴일': h}"""
+        return self._scope(month, team, year=year)[['총근무', *KINDS]].sum().to_dict()
+
+    def team_breakdown(self, month=ALL, teams=(), year=ALL):
+        """팀 x 근무 유형 시간 (누적 막대 차트용 long 포맷: 팀명/유형/시간)"""
+        df_agg = self._scope(month, year=year).groupby(level='팀명', observed=True)[self.hour_columns].sum()
+        df_agg = df_agg.reindex(list(teams)).fillna(0).rename_axis('팀명').reset_index()
+        return df_agg.melt(id_vars='팀명', var_name='유형', value_name='시간')
+
+    def trend(self, year=ALL):
+        """월별 총근무 (월 순서대로 정렬된 월/총근무)"""
+        return (self._scope(year=year).groupby(level='월', observed=True)['총근무'].sum()
+                .reindex(self.months_of(year)).fillna(0).rename_axis('월').reset_index())
+
+    def prior_year(self, month=ALL, team=ALL, year=ALL):
+        """(기준 기간, 기준 총근무, 전년 동기 총근무). 전년 데이터가 없으면 전년 값은 None
+
+        월 선택 시 같은 월의 전년 값, 전체 누적이면 해당 연도(미지정 시 최근 연도)에 있는 월과 같은 전년 월들의 합계.
+        기준/전년 값은 각각 해당 연도 파티션에서만 계산
+        """
+        if month is not ALL:
+            current_months = [month]
+            year = year_of(month)
+            label = month
+        else:
+            if year is ALL:
+                if not self.years:
+                    return None, 0.0, None
+                year = self.years[0]
+            current_months = self.months_of(year)
+            label = f"{year}년 누적"
+
+        prior_months = [p for p in map(prior_year_label, current_months) if p]
+        current = float(self._scope(months=current_months, team=team, year=year)['총근무'].sum())
+        if not year or not prior_months or not set(prior_months) & set(self.months):
+            return label, current, None
+        prior = float(self._scope(months=prior_months, team=team, year=str(int(year) - 1))['총근무'].sum())
+        return label, current, prior
@@ -0,0 +1,156 @@
+import streamlit as st
+
+from app_data import get_figure, get_overtime_analytics, get_overtime_years, get_years
+from charts import team_type_figure, trend_figure
+from list_view import overtime_rows, render_paged_rows
+from profiling import section, stage
+from sidebar_view import select_period
+
+
+# =============================================================================
+# [PART C] 연장근무 관리
+# =============================================================================
+def render(all_sheets, sheets, master_teams):
+    overtime_sheet_name = sheets['overtime']
+
+    if not overtime_sheet_name:
+        st.error("연장근무 시트를 찾을 수 없습니다.")
+        st.stop()
+
+    with stage("overtime.normalize"):
+        overtime = get_overtime_analytics(all_sheets, overtime_sheet_name)
+        years = get_years(all_sheets, sheets, 'overtime')
+
+    with st.sidebar:
+        st.subheader("Filter")
+        ot_year, ot_month_opt = select_period(years, "조회 기간")
+
+        # [수정] TypeError 방어를 위한 안전한 정렬 및 빈값 제거 (OvertimeAnalytics.teams)
+        filtered_teams = overtime.teams
+
+        ot_team_opt = st.selectbox("소속 팀", ["전체 팀"] + filtered_teams)
+
+    # 상세 목록은 선택 연도 파티션에서만 필터링
+    df_ot = get_overtime_years(all_sheets, overtime_sheet_name).rows(ot_year)
+    df_filtered = df_ot
+    if ot_month_opt != "전체 누적":
+        df_filtered = df_filtered[df_filtered['월'] == ot_month_opt]
+    if ot_team_opt != "전체 팀":
+        df_filtered = df_filtered[df_filtered['팀명'] == ot_team_opt]
+
+    st.markdown(f"""
+        <div class="modern-header">
+            <h1>⏰ 연장근무 관리</h1>
+            <p>Status: {ot_team_opt} / {ot_month_opt}</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    view_mode = st.radio("VIEW MODE", ["📊 통합 현황"], horizontal=True, label_visibility="collapsed")
+    st.markdown("---")
+
+    month_key = None if ot_month_opt == "전체 누적" else ot_month_opt
+    team_key = None if ot_team_opt == "전체 팀" else ot_team_opt
+
+    if view_mode == "📊 통합 현황":
+        st.subheader("통합 연장근무 현황")
+        
+        kpi_row(overtime.totals(month_key, team_key, ot_year))
+        target_card(overtime, month_key, team_key, ot_year)
+
+        st.markdown("---")
+        
+        c1, c2 = st.columns([1, 1])
+        with c1:
+            chart_teams = [t for t in filtered_teams] if ot_team_opt == "전체 팀" else [ot_team_opt]
+            team_chart(all_sheets, overtime, ot_year, month_key, team_key, chart_teams)
+            
+        with c2:
+            trend_chart(all_sheets, overtime, ot_year, not df_ot.empty)
+
+    st.divider()
+    detail_list(df_filtered)
+
+
+# -----------------------------------------------------------------------------
+# 화면 구역: 목표 카드(목표 비율 슬라이더)와 상세 내역(페이지)만 fragment
+# -----------------------------------------------------------------------------
+def kpi_row(ot_totals):
+    with section("overtime.kpi"):
+        total_sum = ot_totals['총근무']
+        ext_sum = ot_totals['연장']
+        night_sum = ot_totals['야근']
+        hol_sum = ot_totals['휴일']
+
+        ext_ratio = (ext_sum / total_sum * 100) if total_sum > 0 else 0
+        night_ratio = (night_sum / total_sum * 100) if total_sum > 0 else 0
+        hol_ratio = (hol_sum / total_sum * 100) if total_sum > 0 else 0
+
+        k1, k2, k3, k4 = st.columns(4)
+        with k1:
+            st.markdown(f"""<div class="kpi-card" style="border-top-color: #4F46E5;"><div class="kpi-title">총 근무시간</div><div class="kpi-value">{total_sum:,.1f}h</div><div class="kpi-sub">Total Overtime</div></div>""", unsafe_allow_html=True)
+        with k2:
+            st.markdown(f"""<div class="kpi-card" style="border-top-color: #3B82F6;"><div class="kpi-title">연장 근로</div><div class="kpi-value">{ext_sum:,.1f}h</div><div class="kpi-sub">{ext_ratio:.1f}% (Blue)</div></div>""", unsafe_allow_html=True)
+        with k3:
+            st.markdown(f"""<div class="kpi-card" style="border-top-color: #EF4444;"><div class="kpi-title">야간 근로</div><div class="kpi-value">{night_sum:,.1f}h</div><div class="kpi-sub">{night_ratio:.1f}% (Red)</div></div>""", unsafe_allow_html=True)
+        with k4:
+            st.markdown(f"""<div class="kpi-card" style="border-top-color: #0EA5E9;"><div class="kpi-title">휴일 근로</div><div class="kpi-value">{hol_sum:,.1f}h</div><div class="kpi-sub">{hol_ratio:.1f}% (Sky)</div></div>""", unsafe_allow_html=True)
+
+
+@st.fragment
+def target_card(overtime, month_key, team_key, year):
+    # 전년 동기 대비 목표: 전년 총근무 x 목표 비율 (기준/전년 모두 연도 파티션 단위)
+    # 목표 비율은 이 카드에서만 쓰이므로 사이드바 대신 카드 위에 둠 (바꿔도 차트/목록은 다시 그리지 않음)
+    base_label, base_sum, prior_sum = overtime.prior_year(month_key, team_key, year)
+    if prior_sum:
+        target_ratio = st.slider("전년 대비 목표 (%)", 80, 120, 90, key="target_ratio")
+        target_sum = prior_sum * target_ratio / 100
+        achieved = base_sum / target_sum * 100
+        target_color = "#05CD99" if base_sum <= target_sum else "#EE5D50"
+        st.markdown(f"""<div class="kpi-card" style="border-top-color: {target_color};"><div class="kpi-title">전년 대비 목표 ({target_ratio}%)</div><div class="kpi-value">{base_sum:,.1f}h / {target_sum:,.1f}h</div><div class="kpi-sub">{base_label} · 전년 동기 {prior_sum:,.1f}h · 목표 대비 <span style="color:{target_color};">{achieved:.1f}%</span></div></div>""", unsafe_allow_html=True)
+    elif base_label:
+        st.caption(f"{base_label}: 전년 동기 데이터가 없어 목표 비교를 생략합니다.")
+
+
+def team_chart(all_sheets, overtime, year, month_key, team_key, chart_teams):
+    st.markdown("##### 🏢 팀별 근무 유형 비교")
+    with section("overtime.chart.team"):
+        fig = get_figure(all_sheets, 'overtime_team_type', (year, month_key, team_key),
+                         lambda: team_type_figure(overtime.team_breakdown(month_key, chart_teams, year)))
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def trend_chart(all_sheets, overtime, year, has_rows):
+    st.markdown("##### 📅 월별 통합 추이")
+    if has_rows:
+        # 날짜 기준 정렬된 월 인덱스 (X축 깨짐 방지)
+        with section("overtime.chart.trend"):
+            fig2 = get_figure(all_sheets, 'overtime_trend', (year,), lambda: trend_figure(overtime.trend(year)))
+            st.plotly_chart(fig2, use_container_width=True)
+    else:
+        st.info("데이터 없음")
+
+
+@st.fragment
+def detail_list(df_filtered):
+    st.subheader("🗓️ 상세 근무 내역")
+    
+    st.markdown("""
+        <div class="custom-header">
+            <div class="row-item">월</div>
+            <div class="row-item">팀명</div>
+            <div class="row-item">이름</div>
+            <div class="row-item" style="color:#3B82F6 !important;">연장</div>
+            <div class="row-item" style="color:#EF4444 !important;">야근</div>
+            <div class="row-item" style="color:#0EA5E9 !important;">휴일</div>
+            <div class="row-item" style="font-weight:bold;">합계</div>
+        </div>
+    """, unsafe_allow_html=True)
+
+    if not df_filtered.empty:
+        # 내림차순 정렬 (근무시간 많은 순)
+        df_show_ot = df_filtered.sort_values('총근무', ascending=False).reset_index(drop=True)
+
+        with section("overtime.list.detail"):
+            render_paged_rows(df_show_ot, overtime_rows, key="page_overtime", height=600)
+    else:
+        st.info("내역이 없습니다.")
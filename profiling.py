@@ -0,0 +1,128 @@
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# -----------------------------------------------------------------------------
+# 성능 계측: 실행(rerun) 단위 단계별 타이머 + 구조화 로그 + 선택적 cProfile/tracemalloc
+# -----------------------------------------------------------------------------
+logger = logging.getLogger("dashboard.perf")
+_local = threading.local()
+
+
+def _configure_logger():
+    # 한 줄에 JSON 하나. DASHBOARD_PERF_LOG가 있으면 해당 파일, 없으면 stderr
+    if logger.handlers:
+        return
+    path = os.environ.get("DASHBOARD_PERF_LOG")
+    handler = logging.FileHandler(path, encoding='utf-8') if path else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+_configure_logger()
+
+
+class RunProfile:
+    def __init__(self, label, cprofile=False, trace_memory=False, event='rerun'):
+        self.label = label
+        self.event = event
+        self.stages = []
+        self.started = time.perf_counter()
+        self.profiler = cProfile.Profile() if cprofile else None
+        self.trace_memory = trace_memory and not tracemalloc.is_tracing()
+        self.report = {}
+        # 끝까지 실행됐는지 (st.stop()/st.rerun()/오류로 중간에 끝나면 False → 로그에 status='stopped')
+        self.completed = False
+
+    def start(self):
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profiler is not None:
+            try:
+                self.profiler.enable()
+            except ValueError:
+                # 다른 세션이 이미 프로파일링 중이면 생략
+                self.profiler = None
+        return self
+
+    def finish(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+        # 보고서 작성 중 오류가 나도 tracemalloc은 반드시 해제 (켜 두면 이후 모든 실행이 느려짐)
+        try:
+            if self.profiler is not None:
+                out = io.StringIO()
+                pstats.Stats(self.profiler, stream=out).sort_stats('cumulative').print_stats(30)
+                self.report['cprofile'] = out.getvalue()
+            if self.trace_memory:
+                snapshot = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+                top = snapshot.statistics('lineno')[:20]
+                self.report['tracemalloc'] = f"current {current / 1024 ** 2:.1f} MB / peak {peak / 1024 ** 2:.1f} MB\n" + \
+                    "\n".join(str(s) for s in top)
+        finally:
+            if self.trace_memory:
+                tracemalloc.stop()
+
+        total = time.perf_counter() - self.started
+        summary = {
+            'event': self.event,
+            'label': self.label,
+            'status': 'done' if self.completed else 'stopped',
+            'total_ms': round(total * 1000, 2),
+            'stages': [{'stage': name, 'ms': round(sec * 1000, 2)} for name, sec in self.stages],
+        }
+        logger.info(json.dumps(summary, ensure_ascii=False))
+        return summary
+
+
+def begin_run(label, cprofile=False, trace_memory=False, event='rerun'):
+    _local.run = RunProfile(label, cprofile, trace_memory, event).start()
+    return _local.run
+
+
+def end_run():
+    run = getattr(_local, 'run', None)
+    _local.run = None
+    return run.finish() if run is not None else None
+
+
+def current_run():
+    return getattr(_local, 'run', None)
+
+
+@contextmanager
+def stage(name):
+    """현재 실행 중인 rerun에 단계 시간 기록 (실행 컨텍스트 밖, 예: 백그라운드 스레드에서는 기록 생략)"""
+    run = getattr(_local, 'run', None)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        if run is not None:
+            run.stages.append((name, time.perf_counter() - t0))
+
+
+@contextmanager
+def section(name):
+    """화면 구역(st.fragment) 계측: 전체 rerun 안에서는 단계로, 구역만 다시 실행될 때는 event='fragment' 로그 한 줄로 기록"""
+    if current_run() is not None:
+        with stage(name):
+            yield
+        return
+    run = begin_run(name, event='fragment')
+    try:
+        with stage(name):
+            yield
+        run.completed = True
+    finally:
+        end_run()
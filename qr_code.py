@@ -0,0 +1,63 @@
+from functools import lru_cache
+from io import BytesIO
+
+
+# -----------------------------------------------------------------------------
+# 모바일 접속 QR: (URL, box_size, border)별 이미지를 한 번만 만들고 이후에는 메모리에서 제공 (LRU)
+# qrcode/PIL은 처음 생성할 때만 import
+# -----------------------------------------------------------------------------
+QR_CACHE_SIZE = 32
+
+
+def _matrix(url, border):
+    import qrcode
+    qr = qrcode.QRCode(border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+def qr_png(url, box_size=10, border=1):
+    import qrcode
+    qr = qrcode.QRCode(box_size=box_size, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+def qr_svg(url, box_size=10, border=1):
+    """PIL 래스터화 없이 모듈 행렬에서 바로 만드는 SVG. 가로로 이어진 검은 모듈은 사각형 하나로 합침"""
+    matrix = _matrix(url, border)
+    size = len(matrix)
+    runs = []
+    for y, row in enumerate(matrix):
+        x = 0
+        while x < size:
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < size and row[x]:
+                x += 1
+            runs.append(f"M{start} {y}h{x - start}v1H{start}z")
+    pixels = size * box_size
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{pixels}" height="{pixels}" '
+            f'viewBox="0 0 {size} {size}" shape-rendering="crispEdges">'
+            f'<rect width="{size}" height="{size}" fill="white"/>'
+            f'<path d="{"".join(runs)}" fill="black"/></svg>')
+
+
+def qr_image(url, fmt="PNG", box_size=10, border=1):
+    """fmt: 'PNG'(bytes) 또는 'SVG'(str)"""
+    if fmt == "SVG":
+        return qr_svg(url, box_size, border)
+    return qr_png(url, box_size, border)
+
+
+def cache_stats():
+    return {fmt: fn.cache_info() for fmt, fn in (('PNG', qr_png), ('SVG', qr_svg))}
@@ -0,0 +1,67 @@
+import threading
+import time
+
+
+# -----------------------------------------------------------------------------
+# 백그라운드 새로고침: 세션 공용 워커 하나가 주기적으로 시트를 확인하고,
+# 내용이 바뀐 경우에만 로더의 워크북을 새 버전으로 교체한다.
+# on_change(이전 워크북, 새 워크북)가 있으면 교체 직후 같은 스레드에서 호출 (행 단위 비교 등)
+# -----------------------------------------------------------------------------
+class RefreshWorker:
+    def __init__(self, loader, interval=60, on_change=None):
+        self.loader = loader
+        self.interval = interval
+        self.on_change = on_change
+        self.last_checked = None
+        self._checks = 0
+        self._busy = False
+        self._wake = threading.Event()
+        self._done = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="sheet-refresh", daemon=True)
+
+    @property
+    def version(self):
+        workbook = self.loader.workbook
+        return workbook.content_hash if workbook is not None else None
+
+    def start(self):
+        if not self._thread.is_alive():
+            self._thread.start()
+        return self
+
+    def request_refresh(self, wait=None):
+        """다음 주기를 기다리지 않고 즉시 확인. wait(초)를 주면 확인이 끝날 때까지 대기"""
+        with self._done:
+            target = self._checks + (2 if self._busy else 1)
+        self._wake.set()
+        if wait:
+            with self._done:
+                self._done.wait_for(lambda: self._checks >= target, timeout=wait)
+        return self.version
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            with self._done:
+                self._busy = True
+            previous, current = self.loader.workbook, None
+            try:
+                # 변경 여부 판단(ETag/해시)과 교체는 로더가 원자적으로 처리
+                current = self.loader.refresh(force=True)
+            except Exception:
+                pass
+            finally:
+                with self._done:
+                    self._busy = False
+                    self._checks += 1
+                    self.last_checked = time.time()
+                    self._done.notify_all()
+
+            # 새로고침을 기다리는 세션은 먼저 깨우고, 비교 작업은 그 뒤에 수행
+            if self.on_change is not None and previous is not None and current is not None \
+                    and current.content_hash != previous.content_hash:
+                try:
+                    self.on_change(previous, current)
+                except Exception:
+                    pass
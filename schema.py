@@ -0,0 +1,107 @@
+import re
+
+import pandas as pd
+
+from converters import to_number
+
+
+# -----------------------------------------------------------------------------
+# 시트 스키마: 정규화된 프레임의 열별 dtype 선언 (반복 라벨은 category, 시간/일수는 float32, 금액은 int64)
+# -----------------------------------------------------------------------------
+class SheetSchema:
+    """columns: 열 이름 -> dtype, patterns: (정규식, dtype) — 이름이 선언되지 않은 열에 순서대로 적용.
+    선언되지 않았고 패턴에도 맞지 않는 열은 그대로 둔다."""
+
+    def __init__(self, name, columns, patterns=()):
+        self.name = name
+        self.columns = dict(columns)
+        self.patterns = [(re.compile(p), dtype) for p, dtype in patterns]
+
+    def dtype_for(self, column):
+        if column in self.columns:
+            return self.columns[column]
+        return next((dtype for p, dtype in self.patterns if p.search(str(column))), None)
+
+    def apply(self, df):
+        casts = {}
+        for col in df.columns:
+            dtype = self.dtype_for(col)
+            if dtype is not None and not _matches(df[col], dtype):
+                casts[col] = _cast(df[col], dtype)
+        return df.assign(**casts) if casts else df
+
+
+def _matches(series, dtype):
+    if dtype == 'datetime64':
+        # 단위(ns/us)는 원본을 따른다
+        return pd.api.types.is_datetime64_any_dtype(series)
+    return str(series.dtype) == dtype
+
+
+def _cast(series, dtype):
+    if dtype == 'str':
+        return series.astype(str)
+    if dtype == 'category':
+        return series.astype('category')
+    if dtype == 'datetime64':
+        return pd.to_datetime(series, errors='coerce')
+    # 숫자 열은 정규화와 같은 규칙(to_number: 콤마 제거, 해석 불가·결측은 0)으로 변환
+    # 원천 시트의 월 열처럼 정규화에서 따로 변환하지 않는 열도 '1,000' 같은 문자열이 0이 되지 않음
+    if dtype.startswith('int'):
+        return to_number(series).round().astype(dtype)
+    return to_number(series).astype(dtype)
+
+
+def categorical_like(values, like):
+    """like가 category면 values도 category로 (Series/Index). 증분 집계에서 버전마다 category 목록이 달라
+    concat/groupby 결과가 object로 풀린 키를 원래 dtype으로 되돌릴 때 사용"""
+    return values.astype('category') if isinstance(like.dtype, pd.CategoricalDtype) else values
+
+
+MONEY = r'예산|추가|배정|기본|금액|잔액'
+
+BUDGET_SCHEMA = SheetSchema('기준', {
+    '팀명': 'str',
+}, patterns=[(MONEY, 'int64')])
+
+EXPENSE_SCHEMA = SheetSchema('지출', {
+    '날짜': 'datetime64',
+    '팀명': 'category',
+    '대분류': 'category',
+    '소분류': 'category',
+    '월': 'category',
+    '월_숫자': 'int8',
+    '월_키': 'int32',
+    '금액': 'int64',
+})
+
+LEAVE_SCHEMA = SheetSchema('원천', {
+    '소속': 'category',
+    '합계': 'float32',
+    '사용일수': 'float32',
+    '잔여일수': 'float32',
+    '잔여율': 'float32',
+    '부채예산': 'int64',
+    '부채잔액': 'int64',
+}, patterns=[(r'^\d{1,2}월$', 'float32')])
+
+OVERTIME_SCHEMA = SheetSchema('연장', {
+    '월': 'category',
+    '팀명': 'category',
+    '이름': 'category',
+    '총근무': 'float32',
+}, patterns=[(r'연장|야근|휴일', 'float32')])
+
+
+def memory_comparison(before, after):
+    """스키마 적용 전/후 열별 dtype과 메모리(bytes). 마지막 행은 합계"""
+    rows = []
+    for col in after.columns:
+        b = int(before[col].memory_usage(deep=True, index=False)) if col in before.columns else 0
+        a = int(after[col].memory_usage(deep=True, index=False))
+        rows.append({'열': str(col), '이전 dtype': str(before[col].dtype) if col in before.columns else '',
+                     '이후 dtype': str(after[col].dtype), '이전 bytes': b, '이후 bytes': a})
+    report = pd.DataFrame(rows, columns=['열', '이전 dtype', '이후 dtype', '이전 bytes', '이후 bytes'])
+    total = {'열': '합계', '이전 dtype': '', '이후 dtype': '',
+             '이전 bytes': int(report['이전 bytes'].sum()), '이후 bytes': int(report['이후 bytes'].sum())}
+    return pd.concat([report, pd.DataFrame([total])], ignore_index=True)
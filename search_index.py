@@ -0,0 +1,110 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 지출 검색 인덱스: 상세내역/대분류/소분류의 문자 bigram 역색인을 데이터 버전당 한 번만 만듦
+# 한국어는 띄어쓰기/조사가 제각각이라 형태소 대신 2글자 n-gram을 사용하고, 후보 행만 부분 문자열로 재확인
+# 같은 문장이 여러 행에 반복되므로 고유 문장 단위로 색인 (postings는 numpy CSR 배열)
+# -----------------------------------------------------------------------------
+SEARCH_COLUMNS = ['상세내역', '대분류', '소분류']
+SEP = '\x00'
+SPACES = re.compile(r'\s+')
+
+
+def normalize_text(value):
+    """소문자 + 공백류는 구분자로 (단어 경계를 넘는 n-gram을 만들지 않음)"""
+    return SPACES.sub(SEP, str(value).casefold())
+
+
+def _run_starts(values):
+    """정렬된 배열에서 값이 바뀌는 위치(각 구간의 첫 원소)"""
+    mask = np.ones(len(values), dtype=bool)
+    mask[1:] = values[1:] != values[:-1]
+    return np.flatnonzero(mask)
+
+
+def _query_terms(query):
+    return [t for t in str(query).casefold().split() if t]
+
+
+class SearchIndex:
+    def __init__(self, df, columns=SEARCH_COLUMNS):
+        columns = [c for c in columns if c in df.columns]
+        self.labels = df.index.to_numpy()
+
+        # 열마다 고유값만 정규화하고, (열별 코드) 조합이 같은 행은 한 문장으로 묶음
+        key = np.zeros(len(df), dtype=np.int64)
+        texts = []
+        for col in columns:
+            codes, uniques = pd.factorize(df[col])
+            texts.append([normalize_text(u) for u in uniques.tolist()] + [''])
+            # 결측(코드 -1)은 마지막 빈 문자열 칸으로 (그대로 더하면 앞 열의 키를 하나 빼먹어 다른 문장과 섞임)
+            key = key * len(texts[-1]) + np.where(codes < 0, len(uniques), codes)
+        self.codes, doc_keys = pd.factorize(key)
+
+        parts = []
+        for col_texts in reversed(texts):
+            doc_keys, col_codes = np.divmod(doc_keys, len(col_texts))
+            parts.append([col_texts[c] for c in col_codes])
+        self.docs = np.array([SEP.join(p) for p in zip(*reversed(parts))] if parts else [''] * len(doc_keys), dtype=object)
+        self._build_postings()
+
+    def _build_postings(self):
+        # 모든 고유 문장을 구분자로 이어 붙인 코드포인트 배열에서 인접 두 글자를 한 번에 추출
+        text = SEP.join(self.docs) + SEP
+        chars = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        lengths = np.fromiter((len(d) + 1 for d in self.docs), dtype=np.int64, count=len(self.docs))
+        doc_of_char = np.repeat(np.arange(len(self.docs)), lengths)
+
+        left, right = chars[:-1], chars[1:]
+        valid = (left != 0) & (right != 0)
+        grams = (left[valid].astype(np.uint64) << np.uint64(21)) | right[valid].astype(np.uint64)
+        docs = doc_of_char[:-1][valid]
+
+        # (gram, 문장)을 정수 하나로 합쳐 한 번 정렬 + 중복 제거 후 gram별 문장 목록을 CSR로 보관
+        n_docs = np.uint64(max(len(self.docs), 1))
+        pairs = np.sort(grams * n_docs + docs.astype(np.uint64))
+        pairs = pairs[_run_starts(pairs)]
+        grams, self._postings = np.divmod(pairs, n_docs)
+        self._postings = self._postings.astype(np.int64)
+        starts = _run_starts(grams)
+        self._grams, self._offsets = grams[starts], np.append(starts, len(grams))
+
+    def _gram_docs(self, a, b):
+        key = (np.uint64(ord(a)) << np.uint64(21)) | np.uint64(ord(b))
+        i = np.searchsorted(self._grams, key)
+        if i == len(self._grams) or self._grams[i] != key:
+            return np.array([], dtype=self._postings.dtype)
+        return self._postings[self._offsets[i]:self._offsets[i + 1]]
+
+    def _term_docs(self, term, candidates):
+        if len(term) >= 2:
+            for a, b in zip(term, term[1:]):
+                docs = self._gram_docs(a, b)
+                candidates = docs if candidates is None else np.intersect1d(candidates, docs, assume_unique=True)
+                if len(candidates) == 0:
+                    return candidates
+        elif candidates is None:
+            candidates = np.arange(len(self.docs))
+        if len(term) == 2:
+            return candidates
+        # bigram이 모두 있어도 순서가 다를 수 있으므로 후보 문장만 부분 문자열로 확인
+        return np.array([d for d in candidates if term in self.docs[d]], dtype=np.int64)
+
+    def search(self, query):
+        """검색어(공백으로 나눈 단어 모두 포함, 대소문자 무시)에 맞는 행의 index 값. 검색어가 비어 있으면 None"""
+        terms = _query_terms(query)
+        if not terms:
+            return None
+        # 긴 단어부터 좁혀서 후보를 빨리 줄임
+        candidates = None
+        for term in sorted(terms, key=len, reverse=True):
+            candidates = self._term_docs(term, candidates)
+            if len(candidates) == 0:
+                break
+        matched = np.zeros(len(self.docs), dtype=bool)
+        matched[candidates] = True
+        return self.labels[matched[self.codes]]
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import socket
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from storage import prune_versions
+
+
+# -----------------------------------------------------------------------------
+# 레플리카 공용 캐시: 공유 볼륨(NFS/EFS 등) 디렉터리에 워크북 원본(xlsx)과 정규화 프레임(Parquet)을 버전별로 보관
+# 여러 레플리카 중 잠금을 잡은 하나만 게시된 시트를 받아오고, 나머지는 current.json이 가리키는 버전을 그대로 사용
+#
+#   <root>/current.json              최근 확인 결과 {content_hash, etag, last_modified, checked_at}
+#   <root>/refresh.lock              시트 확인 중인 레플리카 표시 (O_EXCL 생성, 오래되면 만료)
+#   <root>/<hash>/workbook.xlsx      원본
+#   <root>/<hash>/frames/<key>.parquet
+# -----------------------------------------------------------------------------
+CURRENT = 'current.json'
+LOCK = 'refresh.lock'
+PAYLOAD = 'workbook.xlsx'
+
+
+def _write_atomic(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _key_name(key):
+    # 키 튜플(시트 이름/연도 등)을 파일 이름으로 쓸 수 있게 해시
+    return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+
+class SharedCache:
+    def __init__(self, root, keep=2, lock_timeout=120):
+        self.root = root
+        self.keep = keep
+        self.lock_timeout = lock_timeout
+        os.makedirs(root, exist_ok=True)
+
+    # ---- 워크북 원본 ----------------------------------------------------------
+    def current(self):
+        """다른 레플리카가 마지막으로 확인한 버전 정보. 없거나 읽을 수 없으면 None"""
+        try:
+            with open(os.path.join(self.root, CURRENT), encoding='utf-8') as f:
+                info = json.load(f)
+            return info if 'content_hash' in info else None
+        except (OSError, ValueError):
+            return None
+
+    def age(self, info):
+        return time.time() - info.get('checked_at', 0)
+
+    def load_payload(self, digest):
+        try:
+            with open(os.path.join(self.root, digest, PAYLOAD), 'rb') as f:
+                payload = f.read()
+        except OSError:
+            return None
+        # 쓰는 도중이거나 깨진 파일은 사용하지 않음
+        return payload if hashlib.sha256(payload).hexdigest() == digest else None
+
+    def publish(self, payload, digest, etag=None, last_modified=None):
+        """새로 받은 원본을 저장하고 current.json을 교체 (원본 먼저 쓰고 포인터는 나중에)"""
+        path = os.path.join(self.root, digest)
+        os.makedirs(path, exist_ok=True)
+        if not os.path.exists(os.path.join(path, PAYLOAD)):
+            _write_atomic(os.path.join(path, PAYLOAD), payload)
+        self._set_current(digest, etag, last_modified)
+        prune_versions(self.root, digest, self.keep)
+
+    def touch(self, digest, etag=None, last_modified=None):
+        """시트가 바뀌지 않았음(304/같은 해시)을 기록해 다른 레플리카가 다시 확인하지 않게 함"""
+        self._set_current(digest, etag, last_modified)
+
+    def _set_current(self, digest, etag, last_modified):
+        info = {'content_hash': digest, 'etag': etag, 'last_modified': last_modified, 'checked_at': time.time()}
+        _write_atomic(os.path.join(self.root, CURRENT), json.dumps(info).encode('utf-8'))
+
+    # ---- 시트 확인 잠금 -------------------------------------------------------
+    @contextmanager
+    def refresh_lock(self, wait=0):
+        """잠금을 잡으면 True, wait초 안에 못 잡으면 False를 내줌.
+        잠금 파일이 lock_timeout보다 오래됐으면 확인 도중 죽은 레플리카로 보고 가져옴
+        """
+        path = os.path.join(self.root, LOCK)
+        deadline = time.monotonic() + wait
+        acquired = False
+        while not acquired:
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(path) > self.lock_timeout:
+                        os.remove(path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.2)
+                continue
+            with os.fdopen(fd, 'w') as f:
+                f.write(f"{socket.gethostname()}:{os.getpid()}")
+            acquired = True
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    # ---- 정규화 프레임 --------------------------------------------------------
+    def get_frame(self, version, key):
+        path = os.path.join(self.root, version, 'frames', f"{_key_name(key)}.parquet")
+        if not os.path.exists(path):
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            return None
+
+    def put_frame(self, version, key, frame):
+        # 열 이름이 문자열이 아니거나 Parquet로 표현할 수 없는 열이 있으면 공유하지 않음 (각 레플리카가 직접 만듦)
+        path = os.path.join(self.root, version, 'frames')
+        target = os.path.join(path, f"{_key_name(key)}.parquet")
+        tmp = f"{target}.{os.getpid()}.tmp"
+        try:
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
+                prune_versions(self.root, version, self.keep)
+            frame.to_parquet(tmp)
+            os.replace(tmp, target)
+            return True
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return False
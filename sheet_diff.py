@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 시트 버전 간 행 단위 변경: 행 내용 해시(+같은 내용 행의 반복 순번)로 직전 버전과 비교
+# 추가/삭제된 원본 행만 골라 집계(지출 큐브, 연장근무 롤업)에 증감으로 반영하고, 관리자용 변경 피드로 기록
+# -----------------------------------------------------------------------------
+FEED_COLUMNS = ['시각', '시트', '구분', '행', '내용']
+HEADER_ROWS = 1
+
+
+def _column_hash(values):
+    # 값을 문자열로 본 해시 (엑셀의 1과 '1'은 같은 값). 팀명/분류처럼 반복되는 값은 고유값만 해시
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return pd.util.hash_array(np.asarray(uniques.astype(str), dtype=object), categorize=False)[codes]
+
+
+def row_keys(df):
+    """행 내용 해시, 같은 해시의 반복 순번, 시트 위치 (_row_hash, _dup, _pos)"""
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for col in df.columns:
+        hashes = hashes * np.uint64(1000003) ^ _column_hash(df[col])
+    hashes = pd.Series(hashes.view(np.int64))
+    return pd.DataFrame({'_row_hash': hashes.to_numpy(), '_dup': hashes.groupby(hashes).cumcount().to_numpy(),
+                         '_pos': range(len(df))}, index=df.index)
+
+
+def _cell(value):
+    # 엑셀 날짜는 대부분 시간이 없으므로 날짜만 표시
+    if isinstance(value, pd.Timestamp) and value == value.normalize():
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+def _row_text(row):
+    return " · ".join(_cell(v) for v in row if pd.notna(v) and str(v).strip() not in ('', 'nan'))
+
+
+class SheetDiff:
+    """직전 버전(base_version) 대비 시트 한 장의 변경. added/removed는 원본(정규화 전) 행
+
+    열 구성이 바뀌었으면 행을 비교할 수 없으므로 comparable=False (집계는 전체 재계산)
+    old_keys에 직전 비교의 keys(직전 버전의 row_keys)를 주면 이전 버전은 다시 해시하지 않음
+    """
+
+    def __init__(self, sheet, old, new, base_version, old_keys=None):
+        self.sheet = sheet
+        self.base_version = base_version
+        self.comparable = list(old.columns) == list(new.columns)
+        self.rows = len(new)
+        self.keys = row_keys(new)
+        if not self.comparable:
+            self.added, self.removed = new.iloc[:0], old.iloc[:0]
+            return
+        old_keys = old_keys if old_keys is not None and len(old_keys) == len(old) else row_keys(old)
+        new_keys = self.keys
+        old_index = pd.MultiIndex.from_frame(old_keys[['_row_hash', '_dup']])
+        new_index = pd.MultiIndex.from_frame(new_keys[['_row_hash', '_dup']])
+        added = ~new_index.isin(old_index)
+        removed = ~old_index.isin(new_index)
+        self.added, self.removed = new[added], old[removed]
+        self._added_pos = new_keys['_pos'].to_numpy()[added]
+        self._removed_pos = old_keys['_pos'].to_numpy()[removed]
+
+    def __len__(self):
+        return len(self.added) + len(self.removed)
+
+    def summary(self):
+        if not self.comparable:
+            return f"{self.sheet}: 열 구성 변경"
+        return f"{self.sheet}: +{len(self.added):,} / -{len(self.removed):,}"
+
+    def changes(self, at=None, limit=200):
+        """변경 피드 행 (시각/시트/구분/행/내용). 같은 위치에서 빠지고 들어온 행은 '수정'으로 묶음"""
+        at = time.strftime('%m-%d %H:%M', time.localtime(at))
+        if not self.comparable:
+            return [{'시각': at, '시트': self.sheet, '구분': '열 변경', '행': None, '내용': ", ".join(map(str, self.added.columns))}]
+
+        removed_at = dict(zip(self._removed_pos, range(len(self.removed))))
+        entries = []
+        for i, pos in enumerate(self._added_pos):
+            new_row = self.added.iloc[i]
+            j = removed_at.pop(pos, None)
+            if j is None:
+                entries.append((pos, '추가', _row_text(new_row)))
+                continue
+            old_row = self.removed.iloc[j]
+            edits = [f"{col}: {_cell(old_row[col])} → {_cell(new_row[col])}" for col in self.added.columns
+                     if str(old_row[col]) != str(new_row[col])]
+            entries.append((pos, '수정', ", ".join(edits)))
+        for pos, j in removed_at.items():
+            entries.append((pos, '삭제', _row_text(self.removed.iloc[j])))
+
+        entries.sort(key=lambda e: e[0])
+        return [{'시각': at, '시트': self.sheet, '구분': kind, '행': int(pos) + HEADER_ROWS + 1, '내용': text}
+                for pos, kind, text in entries[:limit]]
+
+
+class ChangeFeed:
+    """최근 변경 기록 (모든 세션 공유, 최근 maxlen건)"""
+
+    def __init__(self, maxlen=500):
+        self._entries = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, diff, at=None):
+        entries = diff.changes(at)
+        with self._lock:
+            # 최신 기록이 앞에 오도록 (한 번에 기록한 행끼리는 시트 행 순서 유지)
+            self._entries.extendleft(reversed(entries))
+        return len(entries)
+
+    def frame(self):
+        """최신 변경이 먼저 오는 DataFrame"""
+        with self._lock:
+            return pd.DataFrame(list(self._entries), columns=FEED_COLUMNS)
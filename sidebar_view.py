@@ -0,0 +1,119 @@
+import importlib.util
+
+import pandas as pd
+import streamlit as st
+
+from app_data import get_change_feed, get_data_store, get_default_month_index, get_default_year_index, get_refresh_worker, get_workbook_loader
+from data_prep import normalize_budget, normalize_expense, normalize_leave, normalize_overtime
+from qr_code import cache_stats as qr_cache_stats, qr_image
+from schema import memory_comparison
+from year_index import month_options
+
+# -----------------------------------------------------------------------------
+# 3. 사이드바 및 공통
+# -----------------------------------------------------------------------------
+MENUS = ["💰 예산 관리", "🏖️ 연차 관리", "⏰ 연장근무 관리"]
+DEFAULT_APP_URL = "https://my-budget-dashboard-ebrzrzbmslu8xh6dphqtin.streamlit.app/"
+# qrcode/PIL은 QR을 실제로 만들 때만 import
+HAS_QRCODE = importlib.util.find_spec("qrcode") is not None
+
+
+# 새 버전이 들어오면 현재 세션을 다시 그림
+@st.fragment(run_every=15)
+def watch_data_version(rendered_version):
+    if get_refresh_worker().version != rendered_version:
+        st.rerun()
+
+
+def select_period(years, label="기간"):
+    """메뉴 필터용 연도 + 기간(전체 누적/해당 연도 월) 선택. (연도, 기간) 반환
+
+    연도는 메뉴 간에 같은 값을 유지(key 공유)
+    """
+    if st.session_state.get('year') not in years:
+        st.session_state.pop('year', None)
+    year = st.selectbox("연도", years, index=get_default_year_index(years), key="year")
+    months = month_options(year)
+    period = st.selectbox(label, months, index=get_default_month_index(months))
+    return year, period
+
+
+def render(all_sheets, sheets):
+    """공통 사이드바(메뉴/새로고침/관리자 패널/QR)를 그리고 선택된 메뉴를 반환"""
+    budget_sheet_name, expense_sheet_name = sheets['budget'], sheets['expense']
+    leave_sheet_name, overtime_sheet_name = sheets['leave'], sheets['overtime']
+
+    with st.sidebar:
+        st.title("통합 관리 시스템")
+        st.markdown("---")
+        menu = st.radio("MAIN MENU", MENUS)
+        st.markdown("---")
+    
+        if st.button("🔄 데이터 새로고침", use_container_width=True):
+            # 전체 캐시 삭제 대신 워커에 즉시 확인 요청: 시트가 안 바뀌었으면 기존 데이터 유지
+            get_refresh_worker().request_refresh(wait=15)
+            st.rerun()
+        st.caption("※ 시트 수정 후 1~5분 뒤 반영됩니다.")
+        watch_data_version(all_sheets.content_hash)
+
+        if st.session_state.get('budget_auth'):
+            with st.expander("🧠 데이터 메모리 (버전별)"):
+                mem = get_data_store().memory_report()
+                if not mem.empty:
+                    mem_by_version = mem.groupby('version', sort=False)['bytes'].sum() / 1024 ** 2
+                    for version, mb in mem_by_version.items():
+                        st.caption(f"{version} · {mb:,.2f} MB")
+                    st.dataframe(mem.assign(MB=(mem['bytes'] / 1024 ** 2).round(2)).drop(columns='bytes'), hide_index=True)
+                if st.button("스키마 적용 전/후 비교", key="schema_memory"):
+                    for sheet_name, normalize in ((budget_sheet_name, normalize_budget), (expense_sheet_name, normalize_expense),
+                                                  (leave_sheet_name, normalize_leave), (overtime_sheet_name, normalize_overtime)):
+                        if not sheet_name:
+                            continue
+                        report = memory_comparison(normalize(all_sheets[sheet_name], compact=False), normalize(all_sheets[sheet_name]))
+                        before, after = report.iloc[-1][['이전 bytes', '이후 bytes']] / 1024 ** 2
+                        st.caption(f"{sheet_name} · {before:,.2f} MB → {after:,.2f} MB")
+                        st.dataframe(report, hide_index=True)
+
+            with st.expander("⏱️ 성능 계측 (직전 실행)"):
+                last = st.session_state.get('last_run_profile')
+                if last:
+                    stopped = " · 중간 종료(st.stop/rerun)" if last.get('status') == 'stopped' else ""
+                    st.caption(f"{last['label']} · 총 {last['total_ms']:,.1f} ms{stopped}")
+                    st.dataframe(pd.DataFrame(last['stages'], columns=['stage', 'ms']), hide_index=True)
+                loader_stats = dict(get_workbook_loader().stats)
+                store_stats = dict(get_data_store().stats)
+                qr_stats = {fmt: f"{info.hits}/{info.misses}" for fmt, info in qr_cache_stats().items()}
+                st.caption(f"시트 확인 {loader_stats} · 데이터 캐시 {store_stats} · QR 캐시(hit/miss) {qr_stats}")
+
+                col_prof, col_mem = st.columns(2)
+                if col_prof.button("cProfile 1회", use_container_width=True):
+                    st.session_state['profile_cprofile_next'] = True
+                    st.rerun()
+                if col_mem.button("메모리 1회", use_container_width=True):
+                    st.session_state['profile_tracemalloc_next'] = True
+                    st.rerun()
+                report = st.session_state.get('last_run_report', {})
+                if 'cprofile' in report:
+                    st.code(report['cprofile'], language=None)
+                if 'tracemalloc' in report:
+                    st.code(report['tracemalloc'], language=None)
+
+            with st.expander("🕘 최근 변경 (행 단위)"):
+                feed = get_change_feed().frame()
+                if feed.empty:
+                    st.caption("새 버전을 받으면 지출·연장근무 시트에서 직전 버전 대비 추가/수정/삭제된 행이 표시됩니다.")
+                else:
+                    st.dataframe(feed, hide_index=True)
+        st.markdown("---")
+    
+        with st.expander("📱 모바일 접속 QR"):
+            if HAS_QRCODE:
+                st.caption("Scan to access")
+                app_url = st.text_input("URL", value=DEFAULT_APP_URL)
+                qr_format = st.radio("형식", ["PNG", "SVG"], horizontal=True, key="qr_format", label_visibility="collapsed")
+                if app_url:
+                    try:
+                        st.image(qr_image(app_url, qr_format), use_container_width=True)
+                    except Exception: pass
+
+    return menu
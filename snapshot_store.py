@@ -0,0 +1,95 @@
+import json
+import os
+import shutil
+import threading
+from collections.abc import Mapping
+
+import pandas as pd
+# Parquet 엔진: 없으면 import 단계에서 ImportError (app_data는 스냅샷 없이 동작)
+import pyarrow  # noqa: F401
+
+from storage import prune_versions, storable_frame
+
+
+# -----------------------------------------------------------------------------
+# 로컬 Parquet 스냅샷: 워크북 해시 단위로 시트를 저장해 콜드 스타트/장애 시 재사용
+# -----------------------------------------------------------------------------
+MANIFEST = 'latest.json'
+
+
+class SnapshotWorkbook(Mapping):
+    """저장된 스냅샷을 LazyWorkbook과 같은 방식(시트 이름 -> DataFrame)으로 읽는다."""
+
+    is_snapshot = True
+
+    def __init__(self, path, content_hash, sheet_files):
+        self.content_hash = content_hash
+        self._path = path
+        self._sheet_files = sheet_files
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        if name not in self._sheet_files:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._frames:
+                self._frames[name] = pd.read_parquet(os.path.join(self._path, self._sheet_files[name]))
+            return self._frames[name]
+
+    def __iter__(self):
+        return iter(self._sheet_files)
+
+    def __len__(self):
+        return len(self._sheet_files)
+
+    @property
+    def parsed_sheets(self):
+        return list(self._frames)
+
+
+class SnapshotStore:
+    def __init__(self, root, keep=2):
+        self.root = root
+        self.keep = keep
+        self._lock = threading.Lock()
+
+    def latest(self):
+        try:
+            with open(os.path.join(self.root, MANIFEST), encoding='utf-8') as f:
+                meta = json.load(f)
+            path = os.path.join(self.root, meta['content_hash'])
+            if not os.path.isdir(path):
+                return None
+            return SnapshotWorkbook(path, meta['content_hash'], meta['sheets'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, workbook):
+        # 모든 시트를 임시 폴더에 쓴 뒤 이름 변경 + manifest 교체로 원자적으로 반영
+        # 시트는 워크북에 캐시하지 않고 읽음 (화면에서 보지 않은 시트나 스트리밍으로 적재하는 시트를 메모리에 남기지 않음)
+        read = getattr(workbook, 'read', workbook.__getitem__)
+        with self._lock:
+            digest = workbook.content_hash
+            path = os.path.join(self.root, digest)
+            if not os.path.isdir(path):
+                tmp = f"{path}.tmp"
+                shutil.rmtree(tmp, ignore_errors=True)
+                os.makedirs(tmp)
+                sheets = {}
+                for i, name in enumerate(workbook):
+                    file_name = f"{i:02d}.parquet"
+                    storable_frame(read(name)).to_parquet(os.path.join(tmp, file_name), index=False)
+                    sheets[name] = file_name
+                with open(os.path.join(tmp, 'sheets.json'), 'w', encoding='utf-8') as f:
+                    json.dump(sheets, f, ensure_ascii=False)
+                os.replace(tmp, path)
+            else:
+                with open(os.path.join(path, 'sheets.json'), encoding='utf-8') as f:
+                    sheets = json.load(f)
+
+            manifest_tmp = os.path.join(self.root, f"{MANIFEST}.tmp")
+            with open(manifest_tmp, 'w', encoding='utf-8') as f:
+                json.dump({'content_hash': digest, 'sheets': sheets}, f, ensure_ascii=False)
+            os.replace(manifest_tmp, os.path.join(self.root, MANIFEST))
+            prune_versions(self.root, digest, self.keep)
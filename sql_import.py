@@ -0,0 +1,52 @@
+"""게시된 구글 시트(xlsx)를 로컬 SQLite/DuckDB 파일로 증분 동기화
+
+    python sql_import.py data/budget.db
+    python sql_import.py duckdb:///data/budget.duckdb --url file:///tmp/book.xlsx
+    python sql_import.py data/budget.db --interval 300      # 5분마다 계속 동기화
+
+앱에서는 BUDGET_DATA_SOURCE=data/budget.db 로 지정하면 시트 대신 이 파일을 읽는다.
+시트 내용(해시)이 이전 동기화와 같으면 아무것도 쓰지 않고, 바뀐 경우에도 추가/삭제된 행만 반영한다.
+"""
+import argparse
+import os
+import time
+
+from data_loader import WorkbookLoader
+from sql_store import sync_workbook
+
+
+def find_expense_sheet(workbook):
+    # app_data.find_sheet_names와 같은 규칙 (streamlit 없이 실행하기 위해 따로 둠)
+    return next((s for s in workbook if '지출' in s or 'Expense' in s), None)
+
+
+def sync_once(loader, target, force=False):
+    workbook = loader.refresh(force=True)
+    changes = sync_workbook(target, workbook, find_expense_sheet(workbook), force=force)
+    stamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    if not changes:
+        print(f"{stamp} 변경 없음 ({workbook.content_hash[:12]})")
+    for name, (added, removed) in changes.items():
+        print(f"{stamp} {name:<20} +{added:,} / -{removed:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('target', help='SQLite 파일 경로 또는 sqlite:///경로, duckdb:///경로')
+    parser.add_argument('--url', default=os.environ.get('BUDGET_SHEET_URL'), help='게시된 xlsx 주소 (기본: BUDGET_SHEET_URL)')
+    parser.add_argument('--interval', type=float, default=0, help='초 단위 반복 주기 (0이면 한 번만 실행)')
+    parser.add_argument('--force', action='store_true', help='해시가 같아도 행 비교를 다시 수행')
+    args = parser.parse_args()
+    if not args.url:
+        parser.error('--url 또는 BUDGET_SHEET_URL이 필요합니다.')
+
+    loader = WorkbookLoader(args.url, min_interval=0)
+    while True:
+        sync_once(loader, args.target, args.force)
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
+
+import pandas as pd
+
+from data_prep import normalize_expense
+from schema import EXPENSE_SCHEMA
+from sheet_diff import row_keys
+from storage import storable_frame
+
+
+# -----------------------------------------------------------------------------
+# 로컬 SQL 데이터 소스: 구글 시트 대신 SQLite(기본) 또는 DuckDB 파일에서 같은 기준/지출/원천/연장 데이터를 읽음
+# 시트 원본은 시트 이름과 같은 테이블에, 지출은 정규화된 expense_facts 테이블(인덱스 포함)에도 저장해
+# 연도/월/팀/분류 필터와 합계 집계를 SQL로 처리(pushdown). 동기화는 sql_import.py
+# -----------------------------------------------------------------------------
+FACTS = 'expense_facts'
+META = '_meta'
+SHEETS = '_sheets'
+ROW_KEY = ['_row_hash', '_dup']
+# 행 식별 키 + 시트에서의 위치 (읽을 때 시트 순서 유지)
+INTERNAL = ROW_KEY + ['_pos']
+FACT_COLUMNS = ['날짜', '팀명', '대분류', '소분류', '상세내역', '금액', '월', '월_숫자', '월_키']
+FACT_INDEXES = {
+    'ix_facts_month_team': ['월_키', '팀명'],
+    'ix_facts_category': ['대분류', '소분류'],
+}
+
+
+def quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def parse_source(spec):
+    """'sqlite:///data/budget.db' / 'duckdb:///data/budget.duckdb' / 파일 경로 -> (엔진, 경로)"""
+    for engine in ('sqlite', 'duckdb'):
+        prefix = f"{engine}:///"
+        if spec.startswith(prefix):
+            return engine, spec[len(prefix):]
+    return ('duckdb' if spec.endswith('.duckdb') else 'sqlite'), spec
+
+
+class Backend:
+    """SQLite/DuckDB 연결 차이(파라미터 조회, DataFrame 적재)만 감춘 얇은 래퍼. duckdb는 선택 의존성"""
+
+    def __init__(self, engine, path, read_only=True):
+        self.engine = engine
+        if engine == 'duckdb':
+            import duckdb
+            self.conn = duckdb.connect(path, read_only=read_only)
+        else:
+            import sqlite3
+            uri = f"file:{path}?mode=ro" if read_only else f"file:{path}"
+            # 쓰기는 begin()/commit()으로 직접 트랜잭션을 묶음
+            self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None)
+
+    def read(self, sql, params=()):
+        if self.engine == 'duckdb':
+            return self.conn.execute(sql, list(params)).df()
+        return pd.read_sql_query(sql, self.conn, params=list(params))
+
+    def scalar(self, sql, params=()):
+        row = self.conn.execute(sql, list(params)).fetchone()
+        return row[0] if row else None
+
+    def execute(self, sql, params=()):
+        self.conn.execute(sql, list(params))
+
+    def executemany(self, sql, rows):
+        if rows:
+            self.conn.executemany(sql, rows)
+
+    def tables(self):
+        if self.engine == 'duckdb':
+            return set(self.read("SELECT table_name FROM information_schema.tables")['table_name'])
+        return set(self.read("SELECT name FROM sqlite_master WHERE type = 'table'")['name'])
+
+    def columns(self, table):
+        return list(self.read(f"SELECT * FROM {quote(table)} LIMIT 0").columns)
+
+    def append(self, table, df, tables):
+        """df 행 추가 (테이블이 없으면 열 타입을 정해서 생성)"""
+        if table not in tables:
+            cols = ", ".join(f"{quote(c)} {_sql_type(df[c].dtype)}" for c in df.columns)
+            self.execute(f"CREATE TABLE {quote(table)} ({cols})")
+            tables.add(table)
+        marks = ", ".join("?" * len(df.columns))
+        self.executemany(f"INSERT INTO {quote(table)} VALUES ({marks})", _records(df))
+
+    def begin(self):
+        self.execute("BEGIN TRANSACTION")
+
+    def commit(self):
+        self.execute("COMMIT")
+
+    def rollback(self):
+        self.execute("ROLLBACK")
+
+    def close(self):
+        self.conn.close()
+
+
+def _sql_type(dtype):
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return 'BIGINT'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'DOUBLE'
+    return 'TEXT'
+
+
+def _records(df):
+    # numpy 스칼라/결측값을 DB 드라이버가 받는 파이썬 값(None 포함)으로
+    values = df.astype(object).where(df.notna(), None)
+    return list(values.itertuples(index=False, name=None))
+
+
+def _facts_frame(df):
+    """expense_facts 조회 결과 -> normalize_expense와 같은 타입의 프레임 (index는 행 id)"""
+    df = df.set_index('_id').rename_axis(None).drop(columns=INTERNAL, errors='ignore')
+    df['날짜'] = pd.to_datetime(df['날짜'], errors='coerce')
+    return EXPENSE_SCHEMA.apply(df)
+
+
+class SqlWorkbook(Mapping):
+    """시트 이름 -> DataFrame 매핑(LazyWorkbook과 같은 방식) + 지출 조회 pushdown 메서드"""
+
+    is_snapshot = False
+
+    def __init__(self, engine, path, content_hash):
+        self.engine = engine
+        self.path = path
+        self.content_hash = content_hash
+        self._frames = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._names = list(self._backend().read(f"SELECT name FROM {SHEETS} ORDER BY position")['name'])
+
+    def _backend(self):
+        # 연결은 스레드별로 하나 (Streamlit 세션은 서로 다른 스레드에서 실행)
+        if getattr(self._local, 'backend', None) is None:
+            self._local.backend = Backend(self.engine, self.path)
+        return self._local.backend
+
+    def __getitem__(self, name):
+        if name not in self._names:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._frames:
+                df = self._backend().read(f"SELECT * FROM {quote(name)} ORDER BY _pos")
+                self._frames[name] = df.drop(columns=INTERNAL, errors='ignore')
+            return self._frames[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def parsed_sheets(self):
+        return list(self._frames)
+
+    # ---- 지출 pushdown ----
+    def _where(self, year=None, month=None, team=None, cat_main=None, cat_sub=None):
+        clauses, params = [], []
+        if year is not None:
+            clauses.append('"월_키" BETWEEN ? AND ?')
+            params += [int(year) * 100, int(year) * 100 + 99]
+        for col, value in (('월', month), ('팀명', team), ('대분류', cat_main), ('소분류', cat_sub)):
+            if value is not None:
+                clauses.append(f"{quote(col)} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def expense_frame(self):
+        return _facts_frame(self._backend().read(f"SELECT * FROM {FACTS} ORDER BY _pos"))
+
+    def expense_years(self):
+        # 정수 나눗셈은 엔진마다 다름 (DuckDB의 /는 실수 나눗셈): 월 부분을 빼고 나눠 두 엔진 모두 정확한 연도
+        years = self._backend().read(
+            f'SELECT DISTINCT CAST(("월_키" - "월_키" % 100) / 100 AS INTEGER) AS y FROM {FACTS} WHERE "월_키" > 0')['y']
+        return sorted((str(int(y)) for y in years), reverse=True)
+
+    def expense_cells(self, year=None):
+        """팀 x 월 x 대분류 x 소분류 합계/건수 (ExpenseCube.cells와 같은 형태)"""
+        where, params = self._where(year)
+        keys = ", ".join(quote(c) for c in ('팀명', '월', '대분류', '소분류'))
+        return self._backend().read(
+            f'SELECT {keys}, SUM("금액") AS "합계", COUNT(*) AS "건수" FROM {FACTS}{where} GROUP BY {keys}', params)
+
+    def expense_rows(self, year=None, month=None, team=None, cat_main=None, cat_sub=None):
+        """필터에 맞는 지출 행 (시트 순서)"""
+        where, params = self._where(year, month, team, cat_main, cat_sub)
+        return _facts_frame(self._backend().read(f'SELECT * FROM {FACTS}{where} ORDER BY _pos', params))
+
+
+class SqlSource:
+    """WorkbookLoader와 같은 인터페이스(workbook/refresh/last_error/stats)로 SQL 파일을 읽는다.
+
+    버전은 동기화 때 기록한 원본 워크북 해시라서, 가져온 데이터가 바뀐 경우에만 새 SqlWorkbook을 만든다.
+    """
+
+    def __init__(self, spec, min_interval=60):
+        self.engine, self.path = parse_source(spec)
+        self.min_interval = min_interval
+        self.last_error = None
+        self.stats = Counter()
+        self._workbook = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def workbook(self):
+        return self._workbook
+
+    def refresh(self, force=False):
+        with self._lock:
+            now = time.monotonic()
+            is_fresh = self._checked_at is not None and now - self._checked_at < self.min_interval
+            if self._workbook is not None and is_fresh and not force:
+                return self._workbook
+            self._checked_at = now
+            self.stats['fetch'] += 1
+            try:
+                backend = Backend(self.engine, self.path)
+                try:
+                    version = backend.scalar(f"SELECT value FROM {META} WHERE key = 'content_hash'")
+                finally:
+                    backend.close()
+            except Exception as e:
+                self.last_error = e
+                self.stats['error'] += 1
+                if self._workbook is None:
+                    raise
+                return self._workbook
+            self.last_error = None
+
+            if self._workbook is None or self._workbook.content_hash != version:
+                self.stats['changed'] += 1
+                self._workbook = SqlWorkbook(self.engine, self.path, version)
+            else:
+                self.stats['unchanged'] += 1
+            return self._workbook
+
+
+# -----------------------------------------------------------------------------
+# 증분 동기화: 행 해시(+같은 행의 반복 순번)로 이전 동기화와 비교해 사라진 행은 삭제, 새 행만 추가
+# 남은 행은 시트에서 위치가 바뀐 경우에만 _pos를 갱신
+# -----------------------------------------------------------------------------
+def _diff(backend, table, keys):
+    """(삭제할 키 목록, 새로 넣을 행 mask, 위치가 바뀐 기존 행의 (새 위치, 키))"""
+    stored = backend.read(f"SELECT _row_hash, _dup, _pos FROM {quote(table)}")
+    stored_pos = dict(zip(zip(stored['_row_hash'], stored['_dup']), stored['_pos']))
+    current = list(zip(keys['_row_hash'], keys['_dup']))
+    current_set = set(current)
+    removed = [k for k in stored_pos if k not in current_set]
+    added = [k not in stored_pos for k in current]
+    moved = [(pos, int(h), int(d)) for pos, (h, d) in enumerate(current)
+             if (h, d) in stored_pos and stored_pos[(h, d)] != pos]
+    return removed, added, moved
+
+
+def _apply_diff(backend, table, removed, moved):
+    backend.executemany(f"DELETE FROM {quote(table)} WHERE _row_hash = ? AND _dup = ?",
+                        [(int(h), int(d)) for h, d in removed])
+    backend.executemany(f"UPDATE {quote(table)} SET _pos = ? WHERE _row_hash = ? AND _dup = ?", moved)
+
+
+def _sync_table(backend, table, df, tables):
+    """시트 원본 테이블 동기화. 열 구성이 바뀌었으면 테이블을 다시 만든다. (추가, 삭제) 행 수"""
+    df = storable_frame(df, as_text=True)
+    keys = row_keys(df)
+    if table in tables and backend.columns(table) != list(df.columns) + INTERNAL:
+        backend.execute(f"DROP TABLE {quote(table)}")
+        tables.discard(table)
+    if table not in tables:
+        backend.append(table, df.join(keys), tables)
+        backend.execute(f"CREATE INDEX IF NOT EXISTS {quote('ix_' + table + '_key')} ON {quote(table)} (_row_hash, _dup)")
+        return len(df), 0
+    removed, added, moved = _diff(backend, table, keys)
+    _apply_diff(backend, table, removed, moved)
+    new_rows = df[added].join(keys[added])
+    backend.append(table, new_rows, tables)
+    return len(new_rows), len(removed)
+
+
+def _sync_facts(backend, raw, tables):
+    """지출 원본의 새 행만 정규화해 expense_facts에 추가 (키는 원본 행 해시). (추가, 삭제) 행 수"""
+    keys = row_keys(storable_frame(raw, as_text=True))
+    if FACTS in tables:
+        removed, added, moved = _diff(backend, FACTS, keys)
+        next_id = (backend.scalar(f"SELECT MAX(_id) FROM {FACTS}") or 0) + 1
+    else:
+        removed, added, moved = [], [True] * len(raw), []
+        next_id = 1
+    _apply_diff(backend, FACTS, removed, moved)
+
+    facts = normalize_expense(raw[added].join(keys[added]), compact=False)
+    facts = facts[[c for c in FACT_COLUMNS if c in facts.columns] + INTERNAL]
+    facts.insert(0, '_id', range(next_id, next_id + len(facts)))
+    backend.append(FACTS, storable_frame(facts, as_text=True), tables)
+    if len(facts):
+        for name, cols in {**FACT_INDEXES, 'ix_facts_key': ROW_KEY}.items():
+            backend.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {FACTS} ({', '.join(quote(c) for c in cols)})")
+    return len(facts), len(removed)
+
+
+def sync_workbook(spec, workbook, expense_sheet, force=False):
+    """워크북(시트 이름 -> DataFrame)을 SQL 파일에 증분 반영. 버전이 같으면 건너뜀. 시트별 (추가, 삭제) 반환"""
+    engine, path = parse_source(spec)
+    backend = Backend(engine, path, read_only=False)
+    try:
+        backend.execute(f"CREATE TABLE IF NOT EXISTS {META} (key TEXT PRIMARY KEY, value TEXT)")
+        current = backend.scalar(f"SELECT value FROM {META} WHERE key = 'content_hash'")
+        version = getattr(workbook, 'content_hash', None) or hashlib.sha256(repr(sorted(workbook)).encode()).hexdigest()
+        if current == version and not force:
+            return {}
+
+        # 한 트랜잭션으로 반영: 앱은 커밋 전까지 이전 버전 전체를 본다
+        # (롤백은 트랜잭션을 연 뒤의 실패에만. 그 전의 실패는 원래 예외 그대로)
+        backend.begin()
+        try:
+            tables = backend.tables()
+            changes = {}
+            for name in workbook:
+                changes[name] = _sync_table(backend, name, workbook[name], tables)
+            if expense_sheet:
+                changes[FACTS] = _sync_facts(backend, workbook[expense_sheet], tables)
+
+            for name in tables - set(workbook) - {META, SHEETS, FACTS}:
+                backend.execute(f"DROP TABLE {quote(name)}")
+            backend.execute(f"DROP TABLE IF EXISTS {SHEETS}")
+            backend.execute(f"CREATE TABLE {SHEETS} (name TEXT, position INTEGER)")
+            backend.executemany(f"INSERT INTO {SHEETS} VALUES (?, ?)", [(n, i) for i, n in enumerate(workbook)])
+            backend.execute(f"DELETE FROM {META} WHERE key IN ('content_hash', 'synced_at')")
+            backend.executemany(f"INSERT INTO {META} VALUES (?, ?)",
+                                [('content_hash', version), ('synced_at', time.strftime('%Y-%m-%dT%H:%M:%S'))])
+            backend.commit()
+        except Exception:
+            backend.rollback()
+            raise
+        return changes
+    finally:
+        backend.close()
@@ -0,0 +1,44 @@
+import os
+import shutil
+
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 파일 저장소 공용: 버전 폴더 정리(스냅샷/공용 캐시)와 저장용 프레임 변환(Parquet/SQL)
+# -----------------------------------------------------------------------------
+def prune_versions(root, current, keep):
+    """root 아래 버전 폴더 중 current와 최근 keep-1개만 남기고 삭제 (쓰는 중인 *.tmp 폴더는 건드리지 않음)"""
+    entries = [
+        os.path.join(root, d) for d in os.listdir(root)
+        if d != current and os.path.isdir(os.path.join(root, d)) and not d.endswith('.tmp')
+    ]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for path in entries[max(keep - 1, 0):]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _arrow_compatible(series):
+    import pyarrow as pa
+    try:
+        pa.array(series, from_pandas=True)
+        return True
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
+
+
+def storable_frame(df, as_text=False):
+    """저장할 수 있는 형태로 바꾼 사본. 열 이름은 문자열로 바꾸고, 결측은 그대로 둔다.
+
+    엑셀 원본은 한 열에 숫자/문자가 섞여 있는 경우가 많아 그대로는 저장되지 않으므로
+    Parquet(기본)는 Arrow로 표현할 수 없는 object 열만, SQL(as_text=True)은 모든 object 열과
+    날짜 열('YYYY-MM-DD HH:MM:SS')을 값마다 문자열로 바꾼다 (열 하나에 한 타입)
+    """
+    out = df.copy()
+    out.columns = [str(c) for c in out.columns]
+    for col in out.columns:
+        if as_text and pd.api.types.is_datetime64_any_dtype(out[col]):
+            out[col] = out[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+        elif out[col].dtype == object and (as_text or not _arrow_compatible(out[col])):
+            out[col] = out[col].map(lambda v: v if pd.isna(v) else str(v)).astype(object)
+    return out
@@ -0,0 +1,33 @@
+import hashlib
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+# app_data는 import 시점에 환경 변수를 읽으므로 먼저 지정 (저장소의 .cache에 스냅샷을 남기지 않음)
+os.environ.setdefault('BUDGET_SNAPSHOT_DIR', tempfile.mkdtemp(prefix='budget-snapshots-'))
+
+from data_loader import LazyWorkbook  # noqa: E402
+from synthetic import make_workbook, write_workbook  # noqa: E402
+
+
+def load_workbook(path):
+    with open(path, 'rb') as f:
+        payload = f.read()
+    return LazyWorkbook(payload, hashlib.sha256(payload).hexdigest())
+
+
+@pytest.fixture
+def book():
+    """작은 합성 워크북 (시트 이름 -> DataFrame)"""
+    return make_workbook(teams=6, expenses=400, employees=40, overtime_employees=20)
+
+
+@pytest.fixture
+def book_path(tmp_path, book):
+    return write_workbook(str(tmp_path / 'book.xlsx'), book)
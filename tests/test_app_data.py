@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+import streamlit as st
+
+import app_data
+from conftest import load_workbook
+from data_prep import normalize_expense, normalize_overtime
+from expense_cube import ExpenseCube
+from overtime_analytics import OvertimeAnalytics
+from synthetic import write_workbook
+from year_index import YearIndex
+
+EXPENSE = '지출내역'
+OVERTIME = '연장근무'
+
+
+@pytest.fixture
+def versions(tmp_path, book, monkeypatch):
+    """(직전 버전, 새 버전) 워크북. 새 버전은 지출/연장근무 행 일부 삭제·추가·수정"""
+    monkeypatch.setattr(app_data, 'INCREMENTAL_MIN_ROWS', 0)
+    monkeypatch.setattr(app_data, 'EXPENSE_INGEST', 'full')
+    st.cache_resource.clear()
+    previous = load_workbook(write_workbook(str(tmp_path / 'v1.xlsx'), book))
+
+    expense = book[EXPENSE].copy()
+    expense.loc[expense.index[4], '금액'] = 777_000
+    extra = expense.iloc[[0, 1]].assign(팀명='신규팀')
+    book[EXPENSE] = pd.concat([expense.drop(index=expense.index[[10, 20, 30]]), extra], ignore_index=True)
+    book[OVERTIME] = book[OVERTIME].drop(index=book[OVERTIME].index[:15]).reset_index(drop=True)
+    current = load_workbook(write_workbook(str(tmp_path / 'v2.xlsx'), book))
+    yield previous, current
+    st.cache_resource.clear()
+
+
+def rebuilt_cube(workbook, year):
+    return ExpenseCube(YearIndex.by_month(normalize_expense(workbook[EXPENSE])).rows(year))
+
+
+def assert_same_cube(actual, expected):
+    pd.testing.assert_frame_equal(actual.cells.reset_index(drop=True), expected.cells.reset_index(drop=True),
+                                  check_categorical=False)
+    pd.testing.assert_frame_equal(actual.monthly, expected.monthly, check_categorical=False)
+    assert actual.main_categories == expected.main_categories
+    assert actual.sub_categories == expected.sub_categories
+
+
+def new_version(previous, current):
+    store = app_data.get_data_store()
+    app_data.record_changes(store, app_data.get_change_feed(), previous, current)
+    return store
+
+
+@pytest.mark.parametrize('year', [None, '2025'])
+def test_incremental_expense_cube_matches_rebuild(versions, year):
+    previous, current = versions
+    app_data.get_expense_cube(previous, EXPENSE, year)
+    store = new_version(previous, current)
+
+    cube = app_data.get_expense_cube(current, EXPENSE, year)
+    assert store.stats['incremental'] == 1
+    assert_same_cube(cube, rebuilt_cube(current, year))
+
+
+def test_missing_previous_cube_falls_back_to_rebuild(versions):
+    previous, current = versions
+    app_data.get_expense_cube(previous, EXPENSE, '2025')
+    store = new_version(previous, current)
+
+    # 직전 버전에 2026년 큐브가 없으면(만든 적 없거나 밀려남) 전체 재집계
+    cube = app_data.get_expense_cube(current, EXPENSE, '2026')
+    assert store.stats['incremental'] == 0
+    assert_same_cube(cube, rebuilt_cube(current, '2026'))
+
+
+def test_incremental_overtime_matches_rebuild(versions):
+    previous, current = versions
+    app_data.get_overtime_analytics(previous, OVERTIME)
+    store = new_version(previous, current)
+
+    analytics = app_data.get_overtime_analytics(current, OVERTIME)
+    expected = OvertimeAnalytics(normalize_overtime(current[OVERTIME]))
+    assert store.stats['incremental'] == 1
+    pd.testing.assert_frame_equal(analytics.rollup, expected.rollup, check_categorical=False)
+    assert (analytics.teams, analytics.months) == (expected.teams, expected.months)
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from bench_converters import legacy_clean_column, legacy_safe_numeric, make_columns
+from converters import clean_labels, to_number
+from data_prep import normalize_leave
+
+
+@pytest.fixture(scope='module')
+def columns():
+    return make_columns(5_000, 200, 12)
+
+
+@pytest.mark.parametrize('name', ['금액(문자열)', '금액(혼합)', '시간(숫자)'])
+def test_to_number_matches_legacy(columns, name):
+    series = columns[name]
+    pd.testing.assert_series_equal(to_number(series), legacy_safe_numeric(series), check_dtype=False)
+
+
+def test_clean_labels_matches_legacy(columns):
+    series = columns['소속']
+    np.testing.assert_array_equal(clean_labels(series).to_numpy(), legacy_clean_column(series).to_numpy())
+
+
+def test_clean_labels_blank_for_missing():
+    series = pd.Series(['1. 경영지원팀', None, '12.영업팀', '영업팀'], dtype=object)
+    assert clean_labels(series).tolist() == ['경영지원팀', '', '영업팀', '영업팀']
+
+
+def test_leave_department_cleanup(book):
+    df = normalize_leave(book['연차원천'])
+    raw = book['연차원천']['소속']
+    assert set(df['소속'].astype(str)) <= set(legacy_clean_column(raw))
+    assert not df['소속'].astype(str).str.match(r'^\d').any()
@@ -0,0 +1,83 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from data_loader import WorkbookLoader
+from synthetic import write_workbook
+
+
+class SheetHandler(BaseHTTPRequestHandler):
+    """게시된 시트 흉내: 현재 내용의 ETag/Last-Modified를 주고 조건부 요청에는 304로 응답"""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        etag = f'"{hashlib.md5(server.payload).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag and self.headers.get('If-Modified-Since') == server.last_modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        self.send_header('Content-Length', str(len(server.payload)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', server.last_modified)
+        self.end_headers()
+        self.wfile.write(server.payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(book_path):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), SheetHandler)
+    httpd.requests = []
+    with open(book_path, 'rb') as f:
+        httpd.payload = f.read()
+    httpd.last_modified = 'Thu, 01 Oct 2026 00:00:00 GMT'
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/pub?output=xlsx"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_not_modified_reuses_workbook(server):
+    loader = WorkbookLoader(server.url, min_interval=0)
+    first = loader.refresh()
+    second = loader.refresh(force=True)
+
+    assert second is first
+    assert loader.stats['not_modified'] == 1
+    assert 'If-None-Match' not in server.requests[0]
+    assert server.requests[1]['If-None-Match'] == f'"{hashlib.md5(server.payload).hexdigest()}"'
+    assert server.requests[1]['If-Modified-Since'] == server.last_modified
+
+
+def test_changed_content_is_fetched_again(server, tmp_path, book):
+    loader = WorkbookLoader(server.url, min_interval=0)
+    first = loader.refresh()
+
+    book['지출내역'] = book['지출내역'].iloc[:-10]
+    with open(write_workbook(str(tmp_path / 'changed.xlsx'), book), 'rb') as f:
+        server.payload = f.read()
+    server.last_modified = 'Fri, 02 Oct 2026 00:00:00 GMT'
+    second = loader.refresh(force=True)
+
+    assert second is not first
+    assert second.content_hash == hashlib.sha256(server.payload).hexdigest()
+    assert loader.stats['changed'] == 2
+    assert len(second['지출내역']) == len(first['지출내역']) - 10
+
+
+def test_sheets_are_parsed_on_first_access(server, book):
+    workbook = WorkbookLoader(server.url).refresh()
+
+    assert list(workbook) == list(book)
+    assert workbook.parsed_sheets == []
+    assert len(workbook['예산기준']) == len(book['예산기준'])
+    assert workbook.parsed_sheets == ['예산기준']
@@ -0,0 +1,48 @@
+import threading
+import time
+
+import pytest
+
+from data_store import VersionedDataStore
+
+
+def test_concurrent_requests_build_once():
+    store = VersionedDataStore()
+    calls = []
+
+    def build():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.get('v1', 'key', build))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ['value'] * 8 and len(calls) == 1
+    assert dict(store.stats) == {'miss': 1, 'hit': 7}
+    assert store._inflight == {}
+
+
+def test_failed_build_is_not_cached_and_releases_lock():
+    store = VersionedDataStore()
+
+    def broken():
+        raise ValueError('bad sheet')
+    with pytest.raises(ValueError):
+        store.get('v1', 'key', broken)
+
+    assert store._inflight == {}
+    assert store.peek('v1', 'key') is None
+    assert store.get('v1', 'key', lambda: 'fixed') == 'fixed'
+
+
+def test_keeps_recent_versions():
+    store = VersionedDataStore(keep_versions=2)
+    for version in ('v1', 'v2', 'v3'):
+        store.get(version, 'key', lambda: version)
+    assert store.versions() == ['v2', 'v3']
+    assert store.peek('v1', 'key') is None
@@ -0,0 +1,20 @@
+import pandas as pd
+
+import app_data
+from conftest import load_workbook
+from data_prep import normalize_expense
+from snapshot_store import SnapshotStore
+
+
+def test_stream_build_with_snapshot_keeps_sheet_unparsed(tmp_path, book_path, monkeypatch):
+    monkeypatch.setattr(app_data, 'EXPENSE_INGEST', 'stream')
+    workbook = load_workbook(book_path)
+    frame = app_data.build_expense_frame(workbook, '지출내역')
+    SnapshotStore(str(tmp_path / 'snapshots')).save(workbook)
+
+    # 행 스트리밍과 스냅샷 저장 모두 지출 시트를 DataFrame으로 캐시하지 않음
+    assert '지출내역' not in workbook.parsed_sheets
+
+    expected = normalize_expense(workbook.read('지출내역'))
+    pd.testing.assert_frame_equal(frame.reset_index(drop=True), expected.reset_index(drop=True),
+                                  check_dtype=False, check_categorical=False)
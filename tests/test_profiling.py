@@ -0,0 +1,54 @@
+import tracemalloc
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import app_data
+from conftest import ROOT
+from profiling import begin_run, current_run, end_run, section
+from synthetic import write_workbook
+
+APP = f"{ROOT}/app.py"
+
+
+@pytest.fixture
+def app_without_overtime(tmp_path, book, monkeypatch):
+    # 연장근무 시트가 없으면 연장근무 메뉴는 경고 후 st.stop()으로 끝남
+    del book['연장근무']
+    path = write_workbook(str(tmp_path / 'no_overtime.xlsx'), book)
+    monkeypatch.setattr(app_data, 'SHEET_URL', f"file://{path}")
+    st.cache_resource.clear()
+    yield
+    st.cache_resource.clear()
+
+
+def test_stopped_run_releases_tracemalloc(app_without_overtime):
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.session_state['profile_tracemalloc_next'] = True
+    at.sidebar.radio[0].set_value("⏰ 연장근무 관리").run()
+
+    assert not at.exception
+    assert not tracemalloc.is_tracing()
+    assert current_run() is None
+
+
+def test_fragment_section_records_status():
+    with section('kpi_row'):
+        pass
+    assert current_run() is None
+
+    with pytest.raises(RuntimeError):
+        with section('kpi_row'):
+            raise RuntimeError
+    assert current_run() is None
+
+
+def test_finish_stops_tracing():
+    run = begin_run('test', trace_memory=True)
+    assert tracemalloc.is_tracing()
+    run.completed = True
+    summary = end_run()
+    assert not tracemalloc.is_tracing()
+    assert summary['status'] == 'done'
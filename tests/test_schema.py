@@ -0,0 +1,18 @@
+import pandas as pd
+
+from data_prep import normalize_leave
+from schema import LEAVE_SCHEMA
+
+
+def test_leave_month_columns_use_number_parsing():
+    df = pd.DataFrame({'소속': ['영업팀', '영업팀'], '3월': ['1,000', '2.5'], '4월': ['-', 1]})
+    out = LEAVE_SCHEMA.apply(df)
+    assert out['3월'].dtype == 'float32' and out['3월'].tolist() == [1000.0, 2.5]
+    assert out['4월'].tolist() == [0.0, 1.0]
+
+
+def test_normalized_leave_dtypes(book):
+    df = normalize_leave(book['연차원천'])
+    assert isinstance(df['소속'].dtype, pd.CategoricalDtype)
+    assert all(df[f"{m}월"].dtype == 'float32' for m in range(1, 13))
+    assert df['부채예산'].dtype == 'int64'
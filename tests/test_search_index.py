@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from data_prep import normalize_expense
+from search_index import SearchIndex
+
+
+def brute_force(df, query):
+    text = df[['상세내역', '대분류', '소분류']].apply(lambda row: " ".join('' if pd.isna(v) else str(v) for v in row), axis=1)
+    mask = np.ones(len(df), dtype=bool)
+    for term in query.casefold().split():
+        mask &= text.str.casefold().str.contains(term, regex=False).to_numpy()
+    return df.index[mask].tolist()
+
+
+def test_missing_values_do_not_borrow_other_rows():
+    df = pd.DataFrame({
+        '상세내역': ['스타벅스 회의', None, '카카오택시', None, 'GS칼텍스 주유'],
+        '대분류': ['회의비', '교통비', '교통비', None, '교통비'],
+        '소분류': ['다과', '택시', None, '주차', '주유'],
+    }, index=[10, 11, 12, 13, 14])
+    index = SearchIndex(df)
+
+    for query in ['스타벅스', '택시', '교통비', '주차', '교통비 주유', '회의']:
+        assert index.search(query).tolist() == brute_force(df, query), query
+    assert index.search('  ') is None
+
+
+def test_search_matches_brute_force(book):
+    df = normalize_expense(book['지출내역'])
+    df.loc[df.index[::7], '상세내역'] = None
+    index = SearchIndex(df)
+    for query in ['택시', '스타벅스 회의', '#12', '교통비 주유', '없는검색어']:
+        assert index.search(query).tolist() == brute_force(df, query), query
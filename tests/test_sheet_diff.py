@@ -0,0 +1,119 @@
+import pandas as pd
+import pytest
+
+from app_data import record_changes
+from conftest import load_workbook
+from data_prep import normalize_expense, normalize_overtime
+from data_store import VersionedDataStore
+from expense_cube import ExpenseCube
+from overtime_analytics import OvertimeAnalytics
+from sheet_diff import ChangeFeed, SheetDiff
+from synthetic import write_workbook
+from year_index import YearIndex, year_labels
+
+
+def edit(old, drop, append, change):
+    """old에서 drop 위치의 행을 지우고, append 행을 덧붙이고, change {위치: {열: 값}}을 고친 새 버전"""
+    new = old.copy()
+    for pos, values in change.items():
+        for col, value in values.items():
+            new.loc[new.index[pos], col] = value
+    new = new.drop(index=old.index[drop])
+    return pd.concat([new, append], ignore_index=True)
+
+
+@pytest.fixture
+def expense_versions(book):
+    old = book['지출내역']
+    extra = old.iloc[[0, 1]].assign(팀명='신규팀', 금액=[12_000, 0])
+    new = edit(old, drop=[30, 40, 41], append=extra, change={5: {'금액': 999_000}, 7: {'대분류': '신규분류'}})
+    return old, new
+
+
+def test_diff_rows(expense_versions):
+    old, new = expense_versions
+    diff = SheetDiff('지출내역', old, new, 'v1')
+
+    assert diff.comparable and diff.rows == len(new)
+    assert len(diff.added) == 4 and len(diff.removed) == 5
+    assert set(diff.removed.index) == {5, 7, 30, 40, 41}
+    assert diff.added['금액'].tolist() == [999_000, old['금액'].iloc[7], 12_000, 0]
+
+    changes = pd.DataFrame(diff.changes())
+    assert changes['구분'].value_counts().to_dict() == {'삭제': 3, '수정': 2, '추가': 2}
+    # 같은 위치에서 빠지고 들어온 행은 '수정' (시트 행 번호는 머리글 한 줄 + 1부터)
+    edits = changes[changes['구분'] == '수정']
+    assert edits['행'].tolist() == [5 + 2, 7 + 2]
+    assert edits['내용'].tolist() == [f"금액: {old['금액'].iloc[5]} → 999000", f"대분류: {old['대분류'].iloc[7]} → 신규분류"]
+
+
+def test_diff_reuses_previous_keys(expense_versions):
+    old, new = expense_versions
+    first = SheetDiff('지출내역', old.iloc[:-5], old, 'v0')
+    second = SheetDiff('지출내역', old, new, 'v1', first.keys)
+    fresh = SheetDiff('지출내역', old, new, 'v1')
+    pd.testing.assert_frame_equal(second.added, fresh.added)
+    pd.testing.assert_frame_equal(second.removed, fresh.removed)
+
+
+def test_diff_detects_column_change(book):
+    old = book['지출내역']
+    diff = SheetDiff('지출내역', old, old.rename(columns={'금액': '지출액'}), 'v1')
+    assert not diff.comparable
+    assert diff.summary() == "지출내역: 열 구성 변경"
+
+
+def test_expense_cube_update_matches_rebuild(expense_versions):
+    old, new = expense_versions
+    diff = SheetDiff('지출내역', old, new, 'v1')
+    before, after = normalize_expense(old), normalize_expense(new)
+    added, removed = normalize_expense(diff.added), normalize_expense(diff.removed)
+
+    for year in [None, *YearIndex.by_month(after).years]:
+        def scope(df):
+            return df if year is None else df[year_labels(df['월']) == year]
+
+        full = ExpenseCube(YearIndex.by_month(after).rows(year))
+        inc = ExpenseCube(YearIndex.by_month(before).rows(year)).updated(scope(added), scope(removed))
+        pd.testing.assert_frame_equal(full.cells.reset_index(drop=True), inc.cells, check_categorical=False)
+        pd.testing.assert_frame_equal(full.monthly, inc.monthly, check_categorical=False)
+        assert full.main_categories == inc.main_categories
+        assert full.sub_categories == inc.sub_categories
+        assert isinstance(inc.cells['팀명'].dtype, pd.CategoricalDtype)
+
+
+def test_overtime_update_matches_rebuild(book):
+    old = book['연장근무']
+    gone = old['팀명'].iloc[20]
+    extra = old.iloc[[0, 1]].assign(팀명='신규팀')
+    new = edit(old, drop=[3, 10, 11], append=extra, change={5: {'연장 근로': 12.0}})
+    new = new[new['팀명'] != gone].reset_index(drop=True)
+    diff = SheetDiff('연장근무', old, new, 'v1')
+
+    full = OvertimeAnalytics(normalize_overtime(new))
+    inc = OvertimeAnalytics(normalize_overtime(old)).updated(normalize_overtime(diff.added), normalize_overtime(diff.removed))
+
+    pd.testing.assert_frame_equal(full.rollup, inc.rollup, check_categorical=False)
+    assert (full.teams, full.months, full.years) == (inc.teams, inc.months, inc.years)
+    assert gone not in inc.teams and '신규팀' in inc.teams
+    for year in full.years:
+        for month in [None, *full.months_of(year)]:
+            assert full.totals(month, year=year) == inc.totals(month, year=year)
+        pd.testing.assert_frame_equal(full.trend(year), inc.trend(year), check_categorical=False)
+        pd.testing.assert_frame_equal(full.team_breakdown(None, full.teams, year),
+                                      inc.team_breakdown(None, inc.teams, year), check_categorical=False)
+
+
+def test_record_changes_only_diffs_aggregated_sheets(tmp_path, book):
+    previous = load_workbook(write_workbook(str(tmp_path / 'v1.xlsx'), book))
+    for sheet in previous:
+        previous[sheet]
+    changed = {name: df.iloc[:-1] for name, df in book.items()}
+    current = load_workbook(write_workbook(str(tmp_path / 'v2.xlsx'), changed))
+
+    store, feed = VersionedDataStore(), ChangeFeed()
+    record_changes(store, feed, previous, current)
+
+    assert set(feed.frame()['시트']) == {'지출내역', '연장근무'}
+    assert store.peek(current.content_hash, ('sheet_diff', '예산기준')) is None
+    assert sorted(current.parsed_sheets) == ['연장근무', '지출내역']
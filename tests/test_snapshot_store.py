@@ -0,0 +1,35 @@
+import pandas as pd
+
+from conftest import load_workbook
+from data_loader import WorkbookLoader
+from snapshot_store import SnapshotStore
+
+
+def test_save_does_not_cache_sheets(tmp_path, book_path, book):
+    workbook = load_workbook(book_path)
+    workbook['예산기준']
+    store = SnapshotStore(str(tmp_path / 'snapshots'))
+    store.save(workbook)
+
+    # 저장하면서 읽은 시트는 워크북에 남지 않음 (이미 파싱된 시트만 캐시에 있음)
+    assert workbook.parsed_sheets == ['예산기준']
+
+    snapshot = store.latest()
+    assert snapshot.content_hash == workbook.content_hash
+    assert list(snapshot) == list(book)
+    pd.testing.assert_frame_equal(snapshot['연장근무'], workbook['연장근무'], check_dtype=False)
+
+
+def test_cold_start_swaps_snapshot_for_workbook(tmp_path, book_path):
+    store = SnapshotStore(str(tmp_path / 'snapshots'))
+    store.save(load_workbook(book_path))
+
+    loader = WorkbookLoader(f"file://{book_path}", snapshot_store=store)
+    assert loader.refresh().is_snapshot
+    loader._background.join(timeout=30)
+
+    # 같은 버전이어도 원본 워크북으로 교체돼 행 스트리밍(iter_rows)을 쓸 수 있음
+    assert not loader.workbook.is_snapshot
+    assert loader.workbook.content_hash == store.latest().content_hash
+    assert loader.stats['unchanged'] == 1
+    assert next(loader.workbook.iter_rows('지출내역'))[0] is not None
@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+
+import sql_store
+from conftest import load_workbook
+from data_prep import normalize_expense
+from expense_cube import CUBE_KEYS, ExpenseCube
+from sql_store import SqlSource, sync_workbook
+from synthetic import write_workbook
+from year_index import YearIndex
+
+
+@pytest.fixture(params=['sqlite', 'duckdb'])
+def target(request, tmp_path):
+    if request.param == 'duckdb':
+        pytest.importorskip('duckdb')
+    return f"{request.param}:///{tmp_path / 'budget'}.{'db' if request.param == 'sqlite' else 'duckdb'}"
+
+
+def sorted_cells(cells):
+    cells = cells.astype({k: str for k in CUBE_KEYS}).astype({'합계': 'int64', '건수': 'int64'})
+    return cells.sort_values(CUBE_KEYS).reset_index(drop=True)
+
+
+def test_sync_and_query_round_trip(target, tmp_path, book):
+    workbook = load_workbook(write_workbook(str(tmp_path / 'v1.xlsx'), book))
+    changes = sync_workbook(target, workbook, '지출내역')
+    assert changes['expense_facts'] == (len(normalize_expense(workbook['지출내역'])), 0)
+    assert sync_workbook(target, workbook, '지출내역') == {}
+
+    expense = normalize_expense(workbook['지출내역'])
+    years = YearIndex.by_month(expense)
+    db = SqlSource(target).refresh()
+    assert db.content_hash == workbook.content_hash
+    assert list(db) == list(workbook)
+    assert db.expense_years() == years.years
+
+    for year in [None, *years.years]:
+        expected = ExpenseCube(years.rows(year)).cells
+        pd.testing.assert_frame_equal(sorted_cells(db.expense_cells(year)), sorted_cells(expected))
+
+    team = expense['팀명'].iloc[0]
+    rows = db.expense_rows(year=years.years[0], team=team)
+    expected = years.rows(years.years[0])
+    assert rows['금액'].tolist() == expected.loc[expected['팀명'] == team, '금액'].tolist()
+
+
+def test_incremental_sync(target, tmp_path, book):
+    # 앞의 다섯 행 중 두 행은 맨 뒤로 옮기고 세 행은 삭제: 옮긴 행은 다시 넣지 않고 위치만 갱신
+    raw = book['지출내역']
+    sync_workbook(target, load_workbook(write_workbook(str(tmp_path / 'v1.xlsx'), book)), '지출내역')
+    book['지출내역'] = pd.concat([raw.iloc[5:], raw.iloc[:2]], ignore_index=True)
+    workbook = load_workbook(write_workbook(str(tmp_path / 'v2.xlsx'), book))
+
+    changes = sync_workbook(target, workbook, '지출내역')
+    assert changes['expense_facts'] == (0, int((raw['금액'].iloc[2:5] != 0).sum()))
+
+    db = SqlSource(target).refresh()
+    expense = normalize_expense(workbook['지출내역'])
+    assert db.expense_frame()['금액'].tolist() == expense['금액'].tolist()
+    assert db.expense_years() == YearIndex.by_month(expense).years
+
+
+def test_failed_sync_keeps_previous_version(target, tmp_path, book, monkeypatch):
+    v1 = load_workbook(write_workbook(str(tmp_path / 'v1.xlsx'), book))
+    sync_workbook(target, v1, '지출내역')
+    book['지출내역'] = book['지출내역'].iloc[10:]
+    book['예산기준'] = book['예산기준'].iloc[1:]
+    v2 = load_workbook(write_workbook(str(tmp_path / 'v2.xlsx'), book))
+
+    # 시트 테이블은 반영된 뒤, 지출 facts 정규화 도중 실패
+    def broken(raw, compact=True):
+        raise RuntimeError('normalize failed')
+    monkeypatch.setattr(sql_store, 'normalize_expense', broken)
+    with pytest.raises(RuntimeError, match='normalize failed'):
+        sync_workbook(target, v2, '지출내역')
+
+    db = SqlSource(target).refresh()
+    assert db.content_hash == v1.content_hash
+    assert len(db['예산기준']) == len(v1['예산기준'])
+    assert len(db['지출내역']) == len(v1['지출내역'])
+    assert len(db.expense_frame()) == len(normalize_expense(v1['지출내역']))
+
+
+def test_failure_before_transaction_is_not_masked(target, tmp_path, book, monkeypatch):
+    workbook = load_workbook(write_workbook(str(tmp_path / 'v1.xlsx'), book))
+
+    def broken(self, sql, params=()):
+        raise RuntimeError('version lookup failed')
+    monkeypatch.setattr(sql_store.Backend, 'scalar', broken)
+    with pytest.raises(RuntimeError, match='version lookup failed'):
+        sync_workbook(target, workbook, '지출내역')
@@ -0,0 +1,37 @@
+import os
+import time
+
+import pandas as pd
+
+from storage import prune_versions, storable_frame
+
+
+def test_prune_keeps_current_and_recent(tmp_path):
+    for i, name in enumerate(['a', 'b', 'c', 'd', 'e.tmp']):
+        os.makedirs(tmp_path / name)
+        stamp = time.time() - 100 + i
+        os.utime(tmp_path / name, (stamp, stamp))
+    (tmp_path / 'current.json').write_text('{}')
+
+    prune_versions(str(tmp_path), 'a', keep=2)
+    assert sorted(os.listdir(tmp_path)) == ['a', 'current.json', 'd', 'e.tmp']
+
+
+def test_storable_frame():
+    df = pd.DataFrame({
+        1: pd.Series([1, '2', None], dtype=object),
+        '팀명': pd.Series(['영업팀', '인사팀', None], dtype=object),
+        '날짜': pd.to_datetime(['2026-03-01', '2026-03-02 09:30:00', None], format='ISO8601'),
+        '금액': [1000, 2000, 3000],
+    })
+
+    parquet = storable_frame(df)
+    assert list(parquet.columns) == ['1', '팀명', '날짜', '금액']
+    assert parquet['1'].tolist()[:2] == ['1', '2'] and pd.isna(parquet['1'].iloc[2])
+    assert parquet['날짜'].dtype == df['날짜'].dtype
+    parquet.to_parquet(os.devnull)
+
+    sql = storable_frame(df, as_text=True)
+    assert sql['날짜'].tolist()[:2] == ['2026-03-01 00:00:00', '2026-03-02 09:30:00']
+    assert sql['금액'].tolist() == [1000, 2000, 3000]
+    assert df.columns.tolist()[0] == 1
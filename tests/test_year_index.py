@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from conftest import load_workbook
+from data_prep import normalize_expense, normalize_leave
+from expense_cube import ExpenseCube
+from synthetic import write_workbook
+from year_index import YearIndex
+
+
+@pytest.mark.filterwarnings('ignore:Could not infer format')
+def test_rows_without_year_are_dropped_in_both_paths(book):
+    # 날짜를 읽을 수 없는 행은 월이 비어 있음
+    raw = book['지출내역'].astype({'날짜': object})
+    raw.loc[raw.index[::9], '날짜'] = '미정'
+    expense = normalize_expense(raw)
+    years = YearIndex.by_month(expense)
+    undated = expense['월'].isna()
+    assert undated.any()
+
+    everything = years.rows()
+    assert len(everything) == (~undated).sum() == sum(len(years.rows(y)) for y in years.years)
+    assert ExpenseCube(everything).totals()[0] == sum(ExpenseCube(years.rows(y)).totals()[0] for y in years.years)
+
+    # 증분 반영할 행도 같은 기준으로 고름
+    assert years.select(expense).index.equals(everything.index)
+    assert years.select(expense, years.years[0]).index.equals(years.rows(years.years[0]).index)
+
+
+def test_empty_date_cells_have_no_year(tmp_path, book):
+    # 시트의 빈 날짜 칸은 1970년이 아니라 연도 없음
+    book['지출내역'].loc[book['지출내역'].index[::5], '날짜'] = None
+    workbook = load_workbook(write_workbook(str(tmp_path / 'blank_dates.xlsx'), book))
+    expense = normalize_expense(workbook['지출내역'])
+    blank = expense['날짜'].isna()
+
+    assert blank.any()
+    assert expense.loc[blank, '월'].isna().all() and (expense.loc[blank, '월_키'] == 0).all()
+    years = YearIndex.by_month(expense)
+    assert years.years == ['2026', '2025']
+    assert len(years.rows()) == (~blank).sum()
+
+
+def test_unpartitioned_frame_is_shared(book):
+    leave = normalize_leave(book['연차원천'])
+    years = YearIndex.by_year_column(leave)
+    assert not years.partitioned and years.key('2026') is None
+    assert years.rows('2026') is leave and years.rows() is leave
+    assert years.select(leave, '2026') is leave
+
+
+def test_fully_dated_frame_is_not_copied(book):
+    expense = normalize_expense(book['지출내역'])
+    years = YearIndex.by_month(expense)
+    assert years.rows() is expense
+    assert years.years == ['2026', '2025']
+    pd.testing.assert_frame_equal(years.rows('2025'), expense[expense['월'].astype(str).str.startswith('2025')])
@@ -0,0 +1,241 @@
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+
+# -----------------------------------------------------------------------------
+# [CSS] 프리미엄 UI 디자인
+# 스타일 블록은 매 실행마다 다시 보내야 하지만(요소가 사라지지 않도록), 공백·주석을 줄인 문자열은 한 번만 만든다
+# -----------------------------------------------------------------------------
+APP_CSS = """
+    <style>
+        @import url('https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css');
+        
+        .stApp {
+            font-family: 'Pretendard', sans-serif;
+            background-color: #F4F7FE;
+        }
+        
+        h1, h2, h3, h4, h5, h6, p, div, span, label, button, input, select, textarea {
+            font-family: 'Pretendard', sans-serif;
+        }
+
+        .material-symbols-rounded { font-family: 'Material Symbols Rounded' !important; }
+        .block-container { padding-top: 1.5rem; padding-bottom: 10rem; }
+
+        /* 카드 박스 스타일 */
+        div.css-1r6slb0, div.stDataFrame, div[data-testid="stMetric"] {
+            background-color: white;
+            border-radius: 20px;
+            padding: 24px;
+            box-shadow: 0px 4px 20px rgba(112, 144, 176, 0.08);
+            border: none;
+        }
+
+        /* 메트릭 숫자 */
+        div[data-testid="stMetricValue"] {
+            font-size: 2rem !important;
+            font-weight: 700 !important;
+            color: #2B3674;
+        }
+        div[data-testid="stMetricLabel"] {
+            font-size: 0.95rem !important;
+            color: #A3AED0;
+            font-weight: 500;
+        }
+
+        /* 모던 헤더 */
+        .modern-header {
+            background: white;
+            padding: 25px 30px;
+            border-radius: 20px;
+            box-shadow: 0px 4px 20px rgba(112, 144, 176, 0.08);
+            margin-bottom: 25px;
+            border-left: 10px solid #4318FF;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }
+        .modern-header h1 {
+            margin: 0;
+            font-size: 1.8rem;
+            color: #2B3674;
+            font-weight: 800;
+            line-height: 1.2;
+        }
+        .modern-header p {
+            margin: 8px 0 0 0;
+            color: #A3AED0;
+            font-size: 1rem;
+            font-weight: 500;
+        }
+
+        /* KPI 카드 */
+        .kpi-card {
+            background-color: white;
+            border-radius: 16px;
+            padding: 24px;
+            box-shadow: 0px 4px 12px rgba(112, 144, 176, 0.08);
+            border: 1px solid #E2E8F0;
+            border-top: 5px solid #3B82F6;
+            height: 100%;
+            display: flex;
+            flex-direction: column;
+            justify-content: space-between;
+        }
+        .kpi-title { color: #64748B; font-size: 0.9rem; font-weight: 600; margin-bottom: 8px; }
+        .kpi-value { color: #1E293B; font-size: 2.2rem; font-weight: 800; letter-spacing: -1px; }
+        .kpi-sub { color: #94A3B8; font-size: 0.85rem; margin-top: 4px; font-weight: 500; }
+
+        /* 팀별 예산 카드 (budget_cards.py) */
+        .team-card {
+            background: white;
+            padding: 24px;
+            border-radius: 16px;
+            margin-bottom: 20px;
+            box-shadow: 0px 4px 12px rgba(0,0,0,0.05);
+            border: 1px solid #E2E8F0;
+            border-top: 5px solid #3B82F6;
+        }
+        .team-card.common { border-top-color: #8B5CF6; }
+        .team-card .card-title { margin-bottom: 15px; font-weight: 800; color: #1E293B; font-size: 1.2rem; }
+        .team-card .card-section { margin-bottom: 20px; }
+        .team-card .card-divider { border-top: 1px dashed #E2E8F0; margin: 15px 0; }
+        .team-card .card-head { display: flex; justify-content: space-between; font-size: 0.9rem; margin-bottom: 6px; }
+        .team-card .card-head .label { color: #64748B; font-weight: 700; }
+        .team-card .card-head .rate { font-weight: 800; }
+        .team-card .card-bar { width: 100%; background-color: #F1F5F9; height: 8px; border-radius: 4px; margin-bottom: 10px; }
+        .team-card .card-bar div { height: 8px; border-radius: 4px; }
+        .team-card .card-nums { display: flex; justify-content: space-between; font-size: 0.85rem; color: #64748B; }
+        .team-card .card-nums strong { color: #1E293B; }
+        .team-card .st-ok { color: #3B82F6 !important; }
+        .team-card .st-warn { color: #F59E0B !important; }
+        .team-card .st-over { color: #EF4444 !important; }
+        .team-card .card-bar .st-ok { background-color: #3B82F6; }
+        .team-card .card-bar .st-warn { background-color: #F59E0B; }
+        .team-card .card-bar .st-over { background-color: #EF4444; }
+
+        /* 커스텀 리스트 행 */
+        .custom-row {
+            background-color: white;
+            border-bottom: 1px solid #F4F7FE;
+            padding: 16px 10px;
+            display: flex;
+            align-items: center;
+            transition: all 0.2s ease;
+            border-radius: 12px;
+            margin-bottom: 5px;
+        }
+        .custom-row:hover { background-color: #F4F7FE; transform: translateX(5px); }
+        
+        .custom-header {
+            background-color: #EEF2FF; 
+            border-radius: 12px;
+            padding: 16px 10px;
+            font-weight: 700;
+            color: #4318FF; 
+            font-size: 0.9rem;
+            display: flex;
+            align-items: center;
+            margin-bottom: 12px;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            border: 1px solid #E0E7FF;
+        }
+        .custom-header .row-item, .custom-header .row-item-left {
+            color: #4318FF !important;
+            font-weight: 800 !important;
+        }
+        
+        .row-item { flex: 1; text-align: center; font-size: 0.95rem; color: #2B3674; font-weight: 500; }
+        .row-item-left { flex: 1; text-align: left; padding-left: 20px; font-size: 0.95rem; color: #2B3674; font-weight: 500; }
+        
+        /* 태그 */
+        .badge { padding: 6px 12px; border-radius: 30px; font-size: 0.75rem; font-weight: 700; }
+        .badge-red { background-color: #FEE2E2; color: #DC2626; }
+        .badge-blue { background-color: #E0E7FF; color: #4318FF; }
+        .badge-gray { background-color: #F4F7FE; color: #A3AED0; }
+        
+        /* 합계 박스 */
+        .total-box {
+            background: linear-gradient(135deg, #868CFF 0%, #4318FF 100%);
+            border-radius: 20px;
+            padding: 25px;
+            margin-bottom: 25px;
+            display: flex;
+            justify-content: space-around;
+            align-items: center;
+            color: white;
+            box-shadow: 0px 10px 20px rgba(67, 24, 255, 0.2);
+        }
+        .total-label { font-size: 0.9rem; color: #E9E3FF; margin-bottom: 5px; display: block; text-align: center; font-weight: 500;}
+        .total-value { font-size: 1.5rem; font-weight: 700; color: white; display: block; text-align: center;}
+        
+        /* 사이드바 */
+        [data-testid="stSidebar"] {
+            background-color: white;
+            box-shadow: 4px 0px 20px rgba(112, 144, 176, 0.05);
+            border-right: none;
+        }
+
+        /* 탭 버튼 스타일 */
+        div.row-widget.stRadio > div {
+            background-color: white;
+            padding: 10px;
+            border-radius: 20px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.05);
+            display: flex;
+            justify-content: center;
+            gap: 15px;
+            border: 1px solid #E2E8F0;
+            margin-bottom: 20px;
+            margin-top: 10px;
+        }
+        div.row-widget.stRadio > div[role="radiogroup"] > label {
+            flex: 1;
+            background-color: transparent;
+            border-radius: 15px;
+            padding: 15px 0;
+            text-align: center;
+            transition: all 0.3s ease;
+            cursor: pointer;
+            border: 2px solid transparent;
+            margin-right: 0 !important;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+        }
+        div.row-widget.stRadio > div[role="radiogroup"] > label:hover {
+            background-color: #F8FAFC;
+            color: #4318FF;
+            transform: translateY(-2px);
+        }
+        div.row-widget.stRadio > div[role="radiogroup"] > label[data-checked="true"] {
+            background-color: #4318FF;
+            color: white !important;
+            box-shadow: 0 8px 20px rgba(67, 24, 255, 0.3);
+            transform: translateY(-2px);
+        }
+        div.row-widget.stRadio > div[role="radiogroup"] > label p {
+            font-size: 1.2rem !important;
+            font-weight: 700 !important;
+            margin: 0 !important;
+        }
+        div.row-widget.stRadio > div[role="radiogroup"] > label[data-checked="false"] p {
+            color: #A3AED0 !important;
+        }
+    </style>
+"""
+
+
+@lru_cache(maxsize=1)
+def minified_css():
+    css = re.sub(r'/\*.*?\*/', '', APP_CSS, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return css.strip()
+
+
+def inject_css():
+    st.markdown(minified_css(), unsafe_allow_html=True)
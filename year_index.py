@@ -0,0 +1,91 @@
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+# -----------------------------------------------------------------------------
+# 연도별 파티션 인덱스: 연도 -> 행 위치를 데이터 버전당 한 번만 계산
+# 연도를 고르면 해당 연도 행만 꺼내서(처음 한 번) 집계하므로 전체 이력을 다시 훑지 않음
+# -----------------------------------------------------------------------------
+YEAR = re.compile(r'(\d{4})')
+YEAR_COLUMNS = ('연도', '년도', 'Year')
+ALL_PERIOD = "전체 누적"
+
+
+def year_of(label):
+    """'2026-03' / '2026년 3월' / 2026 -> '2026'. 연도를 읽을 수 없으면 None"""
+    m = YEAR.search(str(label))
+    return m.group(1) if m else None
+
+
+def year_labels(values):
+    """값마다 연도 문자열(없으면 None). 고유값만 파싱"""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    years = np.array([year_of(u) for u in uniques] + [None], dtype=object)
+    return pd.Series(years[codes], index=values.index, dtype=object)
+
+
+def month_options(year):
+    return [ALL_PERIOD] + [f"{year}-{m:02d}" for m in range(1, 13)]
+
+
+def find_year_column(frame):
+    return next((c for c in YEAR_COLUMNS if c in frame.columns), None)
+
+
+class YearIndex:
+    """프레임의 연도별 행 위치. years가 None이면(연도 열이 없는 시트) 모든 연도가 프레임 전체를 공유
+
+    연도를 읽을 수 없는 행(날짜가 비어 있는 지출 등)은 어느 연도에도 속하지 않으므로
+    전체(year=None) 조회에서도 뺀다 (연도별 합계의 합 = 전체 합계)
+    """
+
+    def __init__(self, frame, years=None, column=None):
+        self.frame = frame
+        self.column = column
+        self._rows = {}
+        self._dated = None
+        if years is not None:
+            self._rows = {y: rows for y, rows in years.groupby(years, dropna=True).indices.items()}
+            if self._rows and years.isna().any():
+                self._dated = np.flatnonzero(years.notna().to_numpy())
+        self.years = sorted(self._rows, reverse=True)
+        self._parts = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def by_month(cls, frame, col='월'):
+        return cls(frame, year_labels(frame[col]), col) if col in frame.columns else cls(frame)
+
+    @classmethod
+    def by_year_column(cls, frame):
+        col = find_year_column(frame)
+        return cls(frame, year_labels(frame[col]), col) if col else cls(frame)
+
+    @property
+    def partitioned(self):
+        return bool(self._rows)
+
+    def key(self, year):
+        """캐시 키용 파티션 이름: 연도로 나뉘지 않은 프레임이면 None"""
+        return year if self.partitioned else None
+
+    def rows(self, year=None):
+        """연도 파티션 프레임 (year=None이면 연도가 있는 전체 행, 파티션이 없으면 프레임 전체)"""
+        year = self.key(year)
+        if year is None and self._dated is None:
+            return self.frame
+        with self._lock:
+            if year not in self._parts:
+                positions = self._dated if year is None else self._rows.get(year, np.array([], dtype=np.intp))
+                self._parts[year] = self.frame.iloc[positions]
+            return self._parts[year]
+
+    def select(self, frame, year=None):
+        """같은 열 구성의 다른 프레임(예: 증분 반영할 추가/삭제 행)에서 rows(year)와 같은 기준으로 행을 고름"""
+        if not self.partitioned or self.column is None:
+            return frame
+        labels = year_labels(frame[self.column])
+        return frame[labels.notna()] if year is None else frame[labels == year]